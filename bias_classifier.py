@@ -7,11 +7,16 @@ EMA crossovers, and MACD momentum without separate bias classification.
 
 This file remains for backward compatibility with test files.
 """
+import numpy as np
 import pandas as pd
 from typing import Dict, Tuple, List
 from enum import Enum
 
 
+# Indicator columns the bias conditions read, in _classify_values argument order
+BIAS_COLUMNS = ("Close", "VWAP", "EMA_fast", "EMA_slow", "RSI")
+
+
 class MarketBias(Enum):
     """Market bias enumeration"""
     BULLISH = "Bullish"
@@ -49,35 +54,56 @@ class BiasClassifier:
             - confidence_score: Float between 0.0 and 1.0
             - notes: List of strings explaining the classification
         """
+        return self._classify_values(
+            latest_data['Close'], latest_data['VWAP'],
+            latest_data['EMA_fast'], latest_data['EMA_slow'], latest_data['RSI']
+        )
+    
+    def classify_last(self, cols: Dict[str, np.ndarray]) -> Tuple[MarketBias, float, List[str]]:
+        """
+        Classify market bias from the last value of each indicator column.
+        
+        Same result as classify_bias(df.iloc[-1]) without boxing a pandas row.
+        
+        Args:
+            cols: Mapping of column name to a NumPy array of values
+                Must include: Close, VWAP, EMA_fast, EMA_slow, RSI
+        
+        Returns:
+            Tuple of (bias, confidence_score, notes), as for classify_bias
+        """
+        return self._classify_values(*(float(cols[c][-1]) for c in BIAS_COLUMNS))
+    
+    def _classify_values(self, close, vwap, ema_fast, ema_slow, rsi_value) -> Tuple[MarketBias, float, List[str]]:
+        """Run the bias conditions on scalar indicator values (NaN/None = unavailable)."""
         bullish_signals = 0
         bearish_signals = 0
         total_signals = 0
         notes = []
         
         # Condition 1: Close vs VWAP
-        if pd.notna(latest_data['Close']) and pd.notna(latest_data['VWAP']):
+        if pd.notna(close) and pd.notna(vwap):
             total_signals += 1
-            if latest_data['Close'] > latest_data['VWAP']:
+            if close > vwap:
                 bullish_signals += 1
-                notes.append(f"Price above VWAP ({latest_data['Close']:.2f} > {latest_data['VWAP']:.2f})")
+                notes.append(f"Price above VWAP ({close:.2f} > {vwap:.2f})")
             else:
                 bearish_signals += 1
-                notes.append(f"Price below VWAP ({latest_data['Close']:.2f} < {latest_data['VWAP']:.2f})")
+                notes.append(f"Price below VWAP ({close:.2f} < {vwap:.2f})")
         
         # Condition 2: EMA9 vs EMA21
-        if pd.notna(latest_data['EMA_fast']) and pd.notna(latest_data['EMA_slow']):
+        if pd.notna(ema_fast) and pd.notna(ema_slow):
             total_signals += 1
-            if latest_data['EMA_fast'] > latest_data['EMA_slow']:
+            if ema_fast > ema_slow:
                 bullish_signals += 1
-                notes.append(f"EMA9 above EMA21 ({latest_data['EMA_fast']:.2f} > {latest_data['EMA_slow']:.2f})")
+                notes.append(f"EMA9 above EMA21 ({ema_fast:.2f} > {ema_slow:.2f})")
             else:
                 bearish_signals += 1
-                notes.append(f"EMA9 below EMA21 ({latest_data['EMA_fast']:.2f} < {latest_data['EMA_slow']:.2f})")
+                notes.append(f"EMA9 below EMA21 ({ema_fast:.2f} < {ema_slow:.2f})")
         
         # Condition 3: RSI regime
-        if pd.notna(latest_data['RSI']):
+        if pd.notna(rsi_value):
             total_signals += 1
-            rsi_value = latest_data['RSI']
             
             if rsi_value > self.rsi_bullish:
                 bullish_signals += 1
@@ -5,7 +5,9 @@ Designed with abstraction for easy data source swapping
 import yfinance as yf
 import pandas as pd
 import time
-from typing import Optional, ClassVar
+import threading
+from collections import OrderedDict
+from typing import Optional, ClassVar, Dict, List
 from datetime import datetime, timedelta
 
 
@@ -31,6 +33,75 @@ class DataFetcher:
             DataFrame with columns: Open, High, Low, Close, Volume, Datetime (index)
         """
         raise NotImplementedError("Subclasses must implement fetch_data()")
+    
+    def fetch_multi(self, intervals: List[str], period: str = "5d") -> Dict[str, pd.DataFrame]:
+        """
+        Fetch several intervals with as few requests as possible.
+        
+        The finest interval is fetched once and every coarser minute interval
+        that lines up with it (and with the 9:30 ET open) is resampled from it.
+        Anything else falls back to its own fetch_data() call.
+        
+        Args:
+            intervals: Candle intervals (e.g., ["5m", "15m"])
+            period: How much historical data to fetch
+        
+        Returns:
+            Dictionary mapping each interval to its OHLCV DataFrame
+        """
+        minutes = {iv: _interval_minutes(iv) for iv in intervals}
+        resampleable = [iv for iv in intervals if minutes[iv] is not None]
+        results = {}
+        
+        if resampleable:
+            base = min(resampleable, key=lambda iv: minutes[iv])
+            base_df = self.fetch_data(base, period)
+            results[base] = base_df
+            
+            for iv in resampleable:
+                if iv == base:
+                    continue
+                step = minutes[iv]
+                if step % minutes[base] == 0 and _SESSION_OPEN_MINUTE % step == 0:
+                    results[iv] = resample_ohlcv(base_df, f"{step}min")
+        
+        for iv in intervals:
+            if iv not in results:
+                results[iv] = self.fetch_data(iv, period)
+        
+        return results
+
+
+# Minutes from midnight to the 9:30 ET open; resampled bins must line up with it
+_SESSION_OPEN_MINUTE = 9 * 60 + 30
+
+
+def _interval_minutes(interval: str) -> Optional[int]:
+    """Length of an intraday "<n>m" interval in minutes, or None for anything else."""
+    if interval.endswith('m') and interval[:-1].isdigit():
+        return int(interval[:-1])
+    return None
+
+
+def resample_ohlcv(df: pd.DataFrame, rule: str) -> pd.DataFrame:
+    """
+    Aggregate OHLCV candles into coarser bars.
+    
+    Args:
+        df: DataFrame with Open, High, Low, Close, Volume columns
+        rule: Pandas offset alias (e.g., "15min")
+    
+    Returns:
+        Resampled DataFrame with empty (out-of-session) bins dropped
+    """
+    resampled = df.resample(rule, closed='left', label='left').agg({
+        'Open': 'first',
+        'High': 'max',
+        'Low': 'min',
+        'Close': 'last',
+        'Volume': 'sum',
+    })
+    return resampled.dropna(subset=['Close'])
 
 
 class YahooFinanceDataFetcher(DataFetcher):
@@ -40,9 +111,12 @@ class YahooFinanceDataFetcher(DataFetcher):
     """
     
     # Class-level variables for rate limiting
-    _last_request_time: ClassVar[float] = 0
+    _last_request_time: ClassVar[float] = 0  # latest reserved start slot (may be in the future)
+    _last_started_time: ClassVar[float] = 0  # when the most recent request actually started
     _request_count: ClassVar[int] = 0
     _hour_start_time: ClassVar[float] = time.time()
+    _rate_lock: ClassVar[threading.Lock] = threading.Lock()
+    _stats_cache: ClassVar[Optional[tuple]] = None  # (request_count, monotonic time, stats dict)
     
     def __init__(self, ticker: str, request_delay: float = 2.0):
         """
@@ -60,25 +134,30 @@ class YahooFinanceDataFetcher(DataFetcher):
         """
         Enforce rate limiting between API requests.
         Waits if necessary to maintain the configured request delay.
+        Thread-safe: concurrent callers each reserve their own start slot.
         """
-        current_time = time.time()
-        
-        # Reset counter every hour
-        if current_time - YahooFinanceDataFetcher._hour_start_time >= 3600:
-            YahooFinanceDataFetcher._request_count = 0
-            YahooFinanceDataFetcher._hour_start_time = current_time
-        
-        # Calculate time since last request
-        time_since_last = current_time - YahooFinanceDataFetcher._last_request_time
+        with YahooFinanceDataFetcher._rate_lock:
+            current_time = time.time()
+            
+            # Reset counter every hour
+            if current_time - YahooFinanceDataFetcher._hour_start_time >= 3600:
+                YahooFinanceDataFetcher._request_count = 0
+                YahooFinanceDataFetcher._hour_start_time = current_time
+            
+            # Reserve the next start time at least request_delay after the last one
+            start_time = max(current_time, YahooFinanceDataFetcher._last_request_time + self.request_delay)
+            
+            # Update tracking variables
+            YahooFinanceDataFetcher._last_request_time = start_time
+            YahooFinanceDataFetcher._request_count += 1
         
         # Wait if needed to maintain minimum delay
-        if time_since_last < self.request_delay:
-            wait_time = self.request_delay - time_since_last
+        wait_time = start_time - current_time
+        if wait_time > 0:
             time.sleep(wait_time)
         
-        # Update tracking variables
-        YahooFinanceDataFetcher._last_request_time = time.time()
-        YahooFinanceDataFetcher._request_count += 1
+        with YahooFinanceDataFetcher._rate_lock:
+            YahooFinanceDataFetcher._last_started_time = max(YahooFinanceDataFetcher._last_started_time, start_time)
     
     @classmethod
     def get_request_stats(cls) -> dict:
@@ -86,18 +165,29 @@ class YahooFinanceDataFetcher(DataFetcher):
         Get current request statistics for monitoring.
         
         Returns:
-            Dictionary with request count and timing info
+            Dictionary with request count and timing info; time_since_last_request is
+            measured from the last request that actually started, not a queued slot
         """
-        current_time = time.time()
-        hour_elapsed = current_time - cls._hour_start_time
+        # Repeated polls within a second, with no new requests, reuse the last snapshot
+        cached = cls._stats_cache
+        if cached is not None and cached[0] == cls._request_count and time.monotonic() - cached[1] < 1.0:
+            return dict(cached[2])
+        
+        with cls._rate_lock:
+            current_time = time.time()
+            request_count = cls._request_count
+            hour_elapsed = current_time - cls._hour_start_time
+            last_request_time = cls._last_started_time
         
-        return {
-            "requests_this_hour": cls._request_count,
+        stats = {
+            "requests_this_hour": request_count,
             "hour_elapsed_seconds": hour_elapsed,
             "hour_elapsed_minutes": hour_elapsed / 60,
-            "requests_per_hour_rate": (cls._request_count / hour_elapsed * 3600) if hour_elapsed > 0 else 0,
-            "time_since_last_request": current_time - cls._last_request_time if cls._last_request_time > 0 else 0
+            "requests_per_hour_rate": (request_count / hour_elapsed * 3600) if hour_elapsed > 0 else 0,
+            "time_since_last_request": current_time - last_request_time if last_request_time > 0 else 0
         }
+        cls._stats_cache = (request_count, time.monotonic(), stats)
+        return dict(stats)
     
     def fetch_data(self, interval: str, period: str = "5d", max_retries: int = 3) -> pd.DataFrame:
         """
@@ -118,8 +208,9 @@ class YahooFinanceDataFetcher(DataFetcher):
                 # Apply rate limiting before making request
                 self._rate_limit()
                 
-                ticker_obj = yf.Ticker(self.ticker)
-                df = ticker_obj.history(period=period, interval=interval)
+                # A fresh yf.Ticker per call: history() keeps per-call metadata on the
+                # object, so one shared across threads could mix up concurrent fetches
+                df = yf.Ticker(self.ticker).history(period=period, interval=interval)
                 
                 if df.empty:
                     raise ValueError(f"No data returned for {self.ticker} with interval {interval}")
@@ -153,6 +244,13 @@ class YahooFinanceDataFetcher(DataFetcher):
         raise RuntimeError(f"Failed to fetch data for {self.ticker} after {max_retries} attempts: {str(last_exception)}")
 
 
+# Fetchers are reused per (ticker, source, request_delay) so repeated analyses share one
+# instance; least recently used ones are dropped past MAX_CACHED_FETCHERS
+MAX_CACHED_FETCHERS = 32
+_FETCHERS: "OrderedDict[tuple, DataFetcher]" = OrderedDict()
+_fetchers_lock = threading.Lock()
+
+
 def get_data_fetcher(ticker: str, source: str = "yahoo", request_delay: float = 2.0) -> DataFetcher:
     """
     Factory function to get the appropriate data fetcher.
@@ -163,9 +261,19 @@ def get_data_fetcher(ticker: str, source: str = "yahoo", request_delay: float =
         request_delay: Minimum seconds between requests (default: 2.0 for ~1800 req/hour)
     
     Returns:
-        DataFetcher instance
+        DataFetcher instance (shared with earlier calls using the same arguments)
     """
-    if source.lower() == "yahoo":
-        return YahooFinanceDataFetcher(ticker, request_delay=request_delay)
-    else:
-        raise ValueError(f"Unsupported data source: {source}")
+    key = (ticker.upper(), source.lower(), request_delay)
+    with _fetchers_lock:
+        fetcher = _FETCHERS.get(key)
+        if fetcher is None:
+            if source.lower() == "yahoo":
+                fetcher = YahooFinanceDataFetcher(ticker, request_delay=request_delay)
+            else:
+                raise ValueError(f"Unsupported data source: {source}")
+            _FETCHERS[key] = fetcher
+            if len(_FETCHERS) > MAX_CACHED_FETCHERS:
+                _FETCHERS.popitem(last=False)
+        else:
+            _FETCHERS.move_to_end(key)
+    return fetcher
@@ -10,14 +10,21 @@ serializes them for client-side Plotly.js rendering, and exposes a small
 JSON API used by the dashboard front-end.
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, render_template, jsonify, request, Response, stream_with_context
+import logging
 import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import gzip
 import time
 import sys
 import os
 from datetime import datetime
 import pytz
 
+import numpy as np
+import orjson
 import pandas as pd
 
 from market_copilot import MarketCopilot
@@ -31,6 +38,10 @@ from options_data import OptionsDataFetcher
 from new_signal_logic import generate_multi_timeframe_signals
 from plotly.subplots import make_subplots
 import plotly.graph_objects as go
+import plotly.io as pio
+
+# Plotly's orjson engine encodes numpy arrays directly (no per-element Python pass)
+pio.json.config.default_engine = 'orjson'
 
 # Test mode for CI/CD - returns mock data instead of fetching from APIs
 TEST_MODE = os.environ.get('FLASK_TEST_MODE', '').lower() in ('1', 'true', 'yes')
@@ -39,56 +50,159 @@ TEST_MODE = os.environ.get('FLASK_TEST_MODE', '').lower() in ('1', 'true', 'yes'
 MarketHours.set_display_timezone(DISPLAY_TIMEZONE)
 
 app = Flask(__name__)
+logger = logging.getLogger(__name__)
 
 # Lightweight cache for API payloads (per-ticker)
 _cache_lock = threading.Lock()
-_ticker_cache = {}  # {ticker: {'payload': {...}, 'cached_at': timestamp, 'is_building': bool}}
+_ticker_cache = {}  # {ticker: {'payload': {...}, 'payload_bytes': b'...', 'payload_gzip': b'...', 'cached_at': timestamp}}
+_build_locks = defaultdict(threading.Lock)  # per-ticker single-flight build locks
 CACHE_TTL = CACHE_DURATION  # Use configured cache duration (60 seconds)
 
+# Per-endpoint response TTLs in seconds (see @cached)
+CACHE_POLICIES = {
+    'tickers': 60,       # static list
+    'analysis': CACHE_TTL,
+    'debug': 10,         # recomputes indicators from a fresh fetch
+}
+_response_cache = {}  # {(policy, ticker): (cached_at, body_bytes)}
+MAX_RESPONSE_CACHE = 256  # arbitrary ?ticker= values must not grow the cache without bound
 
-def _serializable_value(v):
-    try:
-        if isinstance(v, pd.Timestamp):
-            return v.strftime('%Y-%m-%dT%H:%M:%S%z')
-    except Exception:
-        pass
-    try:
-        from datetime import datetime as _dt
-        if isinstance(v, _dt):
-            return v.strftime('%Y-%m-%dT%H:%M:%S%z')
-    except Exception:
-        pass
-    try:
-        import numpy as _np
-        if isinstance(v, (_np.generic,)):
-            return v.item()
-    except Exception:
-        pass
-    return v
+# Market status only changes on minute boundaries; share it across builds for 30s
+MARKET_STATUS_TTL = 30
+_market_status_cache = [0, None]  # [fetched_at, status dict]
 
+# Extra leading bars fed to calculate_all_indicators so EMA/RSI/ATR/MACD(26)
+# have settled by the first displayed bar; the prefix is dropped afterwards
+INDICATOR_WARMUP = 3 * max(INDICATORS['ema_slow'], INDICATORS['rsi_period'], INDICATORS['atr_period'], 26)
+
+
+def _json_default(v):
+    """orjson fallback for values it cannot encode natively (e.g. pd.Timestamp)."""
+    if isinstance(v, datetime):
+        return v.strftime('%Y-%m-%dT%H:%M:%S%z')
+    if isinstance(v, np.generic):
+        return v.item()
+    raise TypeError(f"Type is not JSON serializable: {type(v).__name__}")
+
+
+class _RawJSONMembers(bytes):
+    """Already-encoded JSON object whose members _stream_json splices into the enclosing object."""
 
-def _serialize_fig(fig):
-    if fig is None:
-        return None
-    chart_data = []
-    for t in fig.data:
-        td = t.to_plotly_json()
-        for k in ('x', 'y', 'open', 'high', 'low', 'close', 'customdata'):
-            if k in td and td[k] is not None:
-                try:
-                    arr = list(td[k])
-                    arr = [
-                        [_serializable_value(v2) for v2 in v]
-                        if isinstance(v, (list, tuple))
-                        else _serializable_value(v)
-                        for v in arr
-                    ]
-                    td[k] = arr
-                except Exception:
-                    pass
-        chart_data.append(td)
-    chart_layout = fig.layout.to_plotly_json() if hasattr(fig.layout, 'to_plotly_json') else dict(fig.layout)
-    return {'data': chart_data, 'layout': chart_layout}
+
+def _stream_json(payload):
+    """Yield a JSON object one top-level key at a time.
+
+    Lets Flask start writing the small fields while the large chart
+    entries are still being encoded, instead of buffering the whole body.
+    """
+    yield b'{'
+    for i, (key, value) in enumerate(list(payload.items())):
+        if i:
+            yield b','
+        if isinstance(value, _RawJSONMembers):
+            yield value[1:-1]
+            continue
+        yield orjson.dumps(str(key))
+        yield b':'
+        yield orjson.dumps(value, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    yield b'}'
+
+
+def _json_response(payload, status=200):
+    """Stream a payload dict as an application/json response."""
+    return Response(stream_with_context(_stream_json(payload)), status=status, mimetype='application/json')
+
+
+def _prune_response_cache(now):
+    """Drop expired entries, then the oldest ones while over MAX_RESPONSE_CACHE. Caller holds _cache_lock."""
+    for key in [k for k, (cached_at, _) in _response_cache.items() if now - cached_at >= CACHE_POLICIES[k[0]]]:
+        del _response_cache[key]
+    while len(_response_cache) >= MAX_RESPONSE_CACHE:
+        del _response_cache[next(iter(_response_cache))]  # dicts keep insertion order
+
+
+def cached(policy, default_ticker=''):
+    """Cache a JSON route's 200 response body for CACHE_POLICIES[policy] seconds, keyed by ?ticker=.
+
+    Args:
+        policy: Key into CACHE_POLICIES
+        default_ticker: The view's own default for ?ticker=, so an omitted
+            parameter and an explicit one share a cache entry
+    """
+    ttl = CACHE_POLICIES[policy]
+
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            key = (policy, request.args.get('ticker', default_ticker).upper())
+            now = time.time()
+            with _cache_lock:
+                hit = _response_cache.get(key)
+            if hit and now - hit[0] < ttl:
+                return Response(hit[1], mimetype='application/json')
+
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                with _cache_lock:
+                    _response_cache.pop(key, None)
+                    _prune_response_cache(now)
+                    _response_cache[key] = (now, response.get_data())
+            return response
+        return wrapper
+    return decorator
+
+
+def _encoded_response(body, body_gzip=None):
+    """Serve pre-encoded JSON, using the pre-gzipped copy when the client accepts gzip."""
+    if body_gzip is not None and 'gzip' in request.accept_encodings:
+        response = Response(body_gzip, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(body, mimetype='application/json')
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+
+def _serialize_figs(figs):
+    """Encode the per-timeframe figures in one pass with Plotly's orjson engine.
+
+    Returns the chart_1m/chart_5m/chart_15m members plus a single shared
+    chart_template (the figures' layouts leave it out), spliced straight into
+    the payload. Figures are read from their internal data/layout dicts rather
+    than fig.to_dict(), which deep-copies every trace and base64-packs the
+    numpy arrays (plotly.js 2.27 on the page can't decode that format).
+    """
+    charts = {}
+    template = None
+    for label in ('1m', '5m', '15m'):
+        fig = figs.get(label)
+        if fig is None:
+            charts[f'chart_{label}'] = None
+            continue
+        layout = dict(fig._layout)
+        template = layout.pop('template', template)
+        charts[f'chart_{label}'] = {'data': fig._data, 'layout': layout}
+    charts['chart_template'] = template
+    return _RawJSONMembers(pio.json.to_json_plotly(charts, engine='orjson').encode())
+
+
+def _get_market_status():
+    """MarketHours.get_market_status(), reused for MARKET_STATUS_TTL seconds."""
+    now = time.time()
+    with _cache_lock:
+        if _market_status_cache[1] is not None and now - _market_status_cache[0] < MARKET_STATUS_TTL:
+            return _market_status_cache[1]
+    status = MarketHours.get_market_status()
+    with _cache_lock:
+        _market_status_cache[:] = [now, status]
+    return status
+
+
+def _indicators_for_tail(data, rows):
+    """Compute indicators on the last `rows` bars (plus warmup) and return both trimmed to `rows`."""
+    data = data.tail(rows + INDICATOR_WARMUP)
+    indicators = calculate_all_indicators(data, INDICATORS)
+    return data.tail(rows), indicators.tail(rows)
 
 
 def _build_price_volume_figure(data, indicators, title, timeframe_label, ticker='SPY', signals=None):
@@ -116,22 +230,18 @@ def _build_price_volume_figure(data, indicators, title, timeframe_label, ticker=
     recent_indicators = indicators.tail(recent_candles) if len(indicators) > recent_candles else indicators
     
     # Calculate Y-axis range including price AND indicators (VWAP, EMAs)
-    price_min = float(recent_data['Low'].min())
-    price_max = float(recent_data['High'].max())
-    
-    # Also consider indicator values to ensure they're visible
-    indicator_values = []
-    if 'VWAP' in recent_indicators and not recent_indicators['VWAP'].isna().all():
-        indicator_values.extend(recent_indicators['VWAP'].dropna().tolist())
-    if 'EMA_fast' in recent_indicators and not recent_indicators['EMA_fast'].isna().all():
-        indicator_values.extend(recent_indicators['EMA_fast'].dropna().tolist())
-    if 'EMA_slow' in recent_indicators and not recent_indicators['EMA_slow'].isna().all():
-        indicator_values.extend(recent_indicators['EMA_slow'].dropna().tolist())
+    price_min = float(np.nanmin(recent_data['Low'].to_numpy(dtype=float)))
+    price_max = float(np.nanmax(recent_data['High'].to_numpy(dtype=float)))
     
-    # Expand range to include indicators
-    if indicator_values:
-        price_min = min(price_min, min(indicator_values))
-        price_max = max(price_max, max(indicator_values))
+    # Also consider indicator values (VWAP, EMAs) to ensure they're visible
+    for col in ('VWAP', 'EMA_fast', 'EMA_slow'):
+        if col not in recent_indicators:
+            continue
+        values = recent_indicators[col].to_numpy(dtype=float)
+        if np.isnan(values).all():
+            continue
+        price_min = min(price_min, float(np.nanmin(values)))
+        price_max = max(price_max, float(np.nanmax(values)))
     
     # Add minimal padding (1% on each side) for visual clarity
     price_range = price_max - price_min
@@ -146,48 +256,41 @@ def _build_price_volume_figure(data, indicators, title, timeframe_label, ticker=
         shared_xaxes=True, 
         vertical_spacing=0.02,
         row_heights=[0.65, 0.15, 0.20],
-        subplot_titles=(title, f'{timeframe_label} Volume', 'MACD')
+        subplot_titles=(title, f'{timeframe_label} Volume', 'MACD'),
+        # Server-built from clean arrays: skip Plotly's per-property validation
+        figure=go.Figure(_validate=False)
     )
 
     # Format times for hover as 12-hour with AM/PM in display timezone (CST)
     try:
-        formatted_times = []
-        for dt in data.index:
-            if hasattr(dt, 'strftime'):
-                # Convert to display timezone (Central Time)
-                dt_display = MarketHours.to_display_time(dt)
-                formatted_times.append(dt_display.strftime('%b %d, %Y, %I:%M %p CT'))
-            else:
-                formatted_times.append(str(dt))
+        display_index = data.index
+        if display_index.tz is None:
+            display_index = display_index.tz_localize(MarketHours.MARKET_TZ)
+        if MarketHours.DISPLAY_TZ is not None:
+            display_index = display_index.tz_convert(MarketHours.DISPLAY_TZ)
+        formatted_times = display_index.strftime('%b %d, %Y, %I:%M %p CT').to_numpy()
     except Exception:
-        formatted_times = [str(dt) for dt in data.index]
+        formatted_times = data.index.astype(str).to_numpy()
 
-    try:
-        custom = list(zip(
-            indicators.get('VWAP', [None] * len(data)),
-            indicators.get('EMA_fast', [None] * len(data)),
-            indicators.get('EMA_slow', [None] * len(data)),
-            data['Volume'].tolist(),
-        ))
-    except Exception:
-        custom = [[None, None, None, None] for _ in range(len(data))]
-
-    # Calculate price change for each candle
+    # Calculate price change for each candle (zipped numpy columns, no per-row .iloc)
     price_changes = []
     percent_changes = []
-    for i in range(len(data)):
-        try:
-            open_price = float(data['Open'].iloc[i])
-            close_price = float(data['Close'].iloc[i])
+    try:
+        opens = data['Open'].to_numpy(dtype=np.float64)
+        closes = data['Close'].to_numpy(dtype=np.float64)
+    except (TypeError, ValueError):
+        opens = closes = None
+    if opens is None:
+        price_changes = percent_changes = ["N/A"] * len(data)
+    else:
+        for open_price, close_price in zip(opens.tolist(), closes.tolist()):
             change = close_price - open_price
             pct_change = (change / open_price * 100) if open_price != 0 else 0
             price_changes.append(f"{change:+.2f}")
             percent_changes.append(f"{pct_change:+.2f}%")
-        except:
-            price_changes.append("N/A")
-            percent_changes.append("N/A")
 
     fig.add_trace(go.Candlestick(
+        _validate=False,
         x=data.index, 
         open=data['Open'], 
         high=data['High'], 
@@ -195,7 +298,7 @@ def _build_price_volume_figure(data, indicators, title, timeframe_label, ticker=
         close=data['Close'],
         name=f'{ticker} {timeframe_label}',
         text=formatted_times,
-        customdata=list(zip(price_changes, percent_changes)),
+        customdata=np.column_stack((price_changes, percent_changes)),
         increasing_line_color='#00FF41',
         decreasing_line_color='#FF0000',
         increasing_fillcolor='rgba(0, 255, 65, 0.7)',
@@ -217,22 +320,23 @@ def _build_price_volume_figure(data, indicators, title, timeframe_label, ticker=
     ), row=1, col=1)
 
     if 'VWAP' in indicators:
-        fig.add_trace(go.Scatter(x=data.index, y=indicators['VWAP'], name=f'VWAP ({timeframe_label})',
+        fig.add_trace(go.Scatter(_validate=False, x=data.index, y=indicators['VWAP'], name=f'VWAP ({timeframe_label})',
                                   line=dict(color='purple', width=2, dash='dot')), row=1, col=1)
     if 'EMA_fast' in indicators:
-        fig.add_trace(go.Scatter(x=data.index, y=indicators['EMA_fast'], name=f'EMA 9 ({timeframe_label})',
+        fig.add_trace(go.Scatter(_validate=False, x=data.index, y=indicators['EMA_fast'], name=f'EMA 9 ({timeframe_label})',
                                   line=dict(color='#2196F3', width=1.5)), row=1, col=1)
     if 'EMA_slow' in indicators:
-        fig.add_trace(go.Scatter(x=data.index, y=indicators['EMA_slow'], name=f'EMA 21 ({timeframe_label})',
+        fig.add_trace(go.Scatter(_validate=False, x=data.index, y=indicators['EMA_slow'], name=f'EMA 21 ({timeframe_label})',
                                   line=dict(color='#FF9800', width=1.5)), row=1, col=1)
 
-    colors = ['#26a69a' if c >= o else '#ef5350' for c, o in zip(data['Close'], data['Open'])]
-    fig.add_trace(go.Bar(x=data.index, y=data['Volume'], marker_color=colors, showlegend=False), row=2, col=1)
+    colors = np.where(data['Close'].to_numpy() >= data['Open'].to_numpy(), '#26a69a', '#ef5350')
+    fig.add_trace(go.Bar(_validate=False, x=data.index, y=data['Volume'], marker_color=colors, showlegend=False), row=2, col=1)
 
     # Add MACD subplot
     if 'MACD' in indicators and 'MACD_signal' in indicators and 'MACD_histogram' in indicators:
         # MACD Line and Signal Line
         fig.add_trace(go.Scatter(
+            _validate=False,
             x=data.index,
             y=indicators['MACD'],
             name='MACD',
@@ -240,6 +344,7 @@ def _build_price_volume_figure(data, indicators, title, timeframe_label, ticker=
         ), row=3, col=1)
         
         fig.add_trace(go.Scatter(
+            _validate=False,
             x=data.index,
             y=indicators['MACD_signal'],
             name='Signal',
@@ -247,8 +352,9 @@ def _build_price_volume_figure(data, indicators, title, timeframe_label, ticker=
         ), row=3, col=1)
         
         # MACD Histogram (color-coded: green for positive, red for negative)
-        colors_macd = ['#26a69a' if h >= 0 else '#ef5350' for h in indicators['MACD_histogram']]
+        colors_macd = np.where(indicators['MACD_histogram'].to_numpy() >= 0, '#26a69a', '#ef5350').tolist()
         fig.add_trace(go.Bar(
+            _validate=False,
             x=data.index,
             y=indicators['MACD_histogram'],
             name='Histogram',
@@ -264,7 +370,7 @@ def _build_price_volume_figure(data, indicators, title, timeframe_label, ticker=
         buy_signals = [s for s in signals if s['type'] == 'buy']
         sell_signals = [s for s in signals if s['type'] == 'sell']
         
-        print(f"📍 Chart {timeframe_label}: {len(buy_signals)} buy, {len(sell_signals)} sell signals")
+        logger.debug("Chart %s: %d buy, %d sell signals", timeframe_label, len(buy_signals), len(sell_signals))
         
         if buy_signals:
             buy_times = [s['timestamp'] for s in buy_signals]
@@ -272,6 +378,7 @@ def _build_price_volume_figure(data, indicators, title, timeframe_label, ticker=
             buy_strength = [s.get('strength', 50) for s in buy_signals]
             
             fig.add_trace(go.Scatter(
+                _validate=False,
                 x=buy_times,
                 y=buy_prices,
                 mode='markers',
@@ -292,6 +399,7 @@ def _build_price_volume_figure(data, indicators, title, timeframe_label, ticker=
             sell_strength = [s.get('strength', 50) for s in sell_signals]
             
             fig.add_trace(go.Scatter(
+                _validate=False,
                 x=sell_times,
                 y=sell_prices,
                 mode='markers',
@@ -307,16 +415,18 @@ def _build_price_volume_figure(data, indicators, title, timeframe_label, ticker=
             ), row=1, col=1)
 
     fig.update_layout(
-        template='plotly_dark', 
+        template=pio.templates['plotly_dark'],
         hovermode='x unified',
         showlegend=True,
         margin=dict(l=60, r=30, t=40, b=40), 
         autosize=True, 
         height=900,
         dragmode='zoom',
+        uirevision='const',  # keep client zoom/pan across Plotly.react refreshes
         modebar_add=['v1hovermode', 'toggleSpikelines'],
         # Better grid and tick behavior
         xaxis=dict(
+            rangeslider=dict(visible=False),
             showgrid=True,
             gridwidth=1,
             gridcolor='rgba(128, 128, 128, 0.2)',
@@ -394,7 +504,7 @@ def create_chart(copilot_data, data_15m, indicators_15m, ticker="SPY", data_1m=N
     try:
         options_fetcher = OptionsDataFetcher(ticker)
         walls = options_fetcher.get_options_walls(current_price)
-        iv_metrics = options_fetcher.get_iv_metrics()
+        iv_metrics = options_fetcher.get_iv_metrics(current_price)
         pcr = options_fetcher.get_put_call_ratio()
         gex = options_fetcher.get_gamma_exposure(current_price)
     except Exception as e:
@@ -411,18 +521,19 @@ def create_chart(copilot_data, data_15m, indicators_15m, ticker="SPY", data_1m=N
         indicators_1m, indicators_5m, indicators_15m
     )
     
-    # Run backtest analysis
-    backtester = SignalBacktester(lookforward_candles=5)
-    backtest_report = backtester.generate_report(data_5m, indicators_5m, signals)
-    print("\n" + backtest_report)
+    # Run backtest analysis (report is only logged, so skip it when nobody is listening)
+    if logger.isEnabledFor(logging.INFO):
+        backtester = SignalBacktester(lookforward_candles=5)
+        backtest_report = backtester.generate_report(data_5m, signals)
+        logger.info("\n%s", backtest_report)
 
     fig_1m = None
     if data_1m is not None and indicators_1m is not None:
-        print(f"[create_chart] Creating 1m chart with {len(data_1m)} candles")
+        logger.debug("[create_chart] Creating 1m chart with %d candles", len(data_1m))
         fig_1m = _build_price_volume_figure(data_1m, indicators_1m, f'{ticker} 1-Minute Chart', '1m', ticker, signals)
-        print(f"[create_chart] 1m chart created: {fig_1m is not None}")
+        logger.debug("[create_chart] 1m chart created: %s", fig_1m is not None)
     else:
-        print(f"[create_chart] Skipping 1m chart - data_1m: {data_1m is not None}, indicators_1m: {indicators_1m is not None}")
+        logger.debug("[create_chart] Skipping 1m chart - data_1m: %s, indicators_1m: %s", data_1m is not None, indicators_1m is not None)
 
     fig_5m = _build_price_volume_figure(data_5m, indicators_5m, f'{ticker} 5-Minute Chart', '5m', ticker, signals)
     fig_15m = _build_price_volume_figure(data_15m, indicators_15m, f'{ticker} 15-Minute Chart', '15m', ticker, signals)
@@ -430,53 +541,75 @@ def create_chart(copilot_data, data_15m, indicators_15m, ticker="SPY", data_1m=N
     return {'1m': fig_1m, '5m': fig_5m, '15m': fig_15m}, walls, signals, iv_metrics, pcr, gex
 
 
-def build_and_cache_payload(ticker="SPY"):
-    print(f"[build_and_cache_payload] Building payload for ticker: {ticker}")
-    global _ticker_cache
-    
-    # Initialize ticker cache entry if needed
+def _is_building(ticker):
+    """True while a build for ticker holds its lock."""
     with _cache_lock:
-        if ticker not in _ticker_cache:
-            _ticker_cache[ticker] = {'payload': None, 'cached_at': 0, 'is_building': False}
-        
-        if _ticker_cache[ticker]['is_building']:
-            print(f"[build_and_cache_payload] Already building for {ticker}, skipping")
-            return
-        _ticker_cache[ticker]['is_building'] = True
-    
+        lock = _build_locks.get(ticker)
+    return lock is not None and lock.locked()
+
+
+def build_and_cache_payload(ticker="SPY", max_age=0):
+    """Build the payload for ticker and store it in the cache.
+
+    Builds are single-flight per ticker: a caller that arrives while another
+    build is running waits for it, then skips its own build if the cached
+    payload is now younger than max_age seconds.
+    """
+    with _cache_lock:
+        build_lock = _build_locks[ticker]
+
+    with build_lock:
+        with _cache_lock:
+            entry = _ticker_cache.setdefault(ticker, {'payload': None, 'payload_bytes': None, 'payload_gzip': None, 'cached_at': 0})
+            if entry['payload'] is not None and time.time() - entry['cached_at'] < max_age:
+                return
+        _build_payload(ticker)
+
+
+def _build_payload(ticker):
+    logger.debug("[build_and_cache_payload] Building payload for ticker: %s", ticker)
     try:
         copilot = MarketCopilot(ticker=ticker, request_delay=REQUEST_DELAY)
         
-        # Fetch data SEQUENTIALLY to respect rate limits
-        # Parallel fetching bypasses rate limiting and causes 429 errors
-        print(f"[{ticker}] Fetching 5m data...")
-        try:
-            data_5m = copilot.data_fetcher.fetch_data('5m', '5d')
-        except Exception as e:
-            print(f"[ERROR] Error fetching 5m data for {ticker}: {e}")
-            data_5m = None
-        
-        time.sleep(REQUEST_DELAY)  # Explicit delay between requests
-        
-        print(f"[{ticker}] Fetching 15m data...")
-        try:
-            data_15m = copilot.data_fetcher.fetch_data('15m', '1mo')
-        except Exception:
+        fetcher = copilot.data_fetcher
+
+        def fetch_5m():
+            print(f"[{ticker}] Fetching 5m data...")
             try:
-                time.sleep(REQUEST_DELAY)
-                data_15m = copilot.data_fetcher.fetch_data('15m', '5d')
+                return fetcher.fetch_data('5m', '5d')
             except Exception as e:
-                print(f"[ERROR] Error fetching 15m data for {ticker}: {e}")
-                data_15m = None
-        
-        time.sleep(REQUEST_DELAY)  # Explicit delay between requests
-        
-        print(f"[{ticker}] Fetching 1m data...")
-        try:
-            data_1m = copilot.data_fetcher.fetch_data('1m', '1d')
-        except Exception as e:
-            print(f"[ERROR] Error fetching 1m data for {ticker}: {e}")
-            data_1m = None
+                print(f"[ERROR] Error fetching 5m data for {ticker}: {e}")
+                return None
+
+        def fetch_15m():
+            print(f"[{ticker}] Fetching 15m data...")
+            try:
+                return fetcher.fetch_data('15m', '1mo')
+            except Exception:
+                try:
+                    return fetcher.fetch_data('15m', '5d')
+                except Exception as e:
+                    print(f"[ERROR] Error fetching 15m data for {ticker}: {e}")
+                    return None
+
+        def fetch_1m():
+            print(f"[{ticker}] Fetching 1m data...")
+            try:
+                return fetcher.fetch_data('1m', '1d')
+            except Exception as e:
+                print(f"[ERROR] Error fetching 1m data for {ticker}: {e}")
+                return None
+
+        # Fetches overlap, but the fetcher's shared rate limiter still starts
+        # requests at least REQUEST_DELAY apart, so this doesn't trigger 429s
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            future_5m = pool.submit(fetch_5m)
+            future_15m = pool.submit(fetch_15m)
+            future_1m = pool.submit(fetch_1m)
+            data_5m = future_5m.result()
+            data_15m = future_15m.result()
+            data_1m = future_1m.result()
+
         # Check if we have critical data (5m minimum required)
         if data_5m is None or data_5m.empty:
             print(f"[ERROR] No 5m data available for {ticker} - cannot build payload")
@@ -489,6 +622,8 @@ def build_and_cache_payload(ticker="SPY"):
                         'ticker': ticker,
                         'retry_after': 60  # Suggest waiting 60 seconds
                     }
+                    _ticker_cache[ticker]['payload_bytes'] = None
+                    _ticker_cache[ticker]['payload_gzip'] = None
                 _ticker_cache[ticker]['cached_at'] = time.time()
             return
         
@@ -496,62 +631,50 @@ def build_and_cache_payload(ticker="SPY"):
             print(f"No 15m data available for {ticker}, using 5m data for both timeframes")
             data_15m = data_5m.copy()
 
-        data_5m = data_5m.tail(78)
-        data_15m = data_15m.tail(100)
+        has_1m = data_1m is not None and not data_1m.empty
+        if not has_1m:
+            print(f"[{ticker}] WARNING: No 1m data available")
 
-        indicators_5m = calculate_all_indicators(data_5m, INDICATORS)
-        indicators_15m = calculate_all_indicators(data_15m, INDICATORS)
+        indicators_1m = None
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            future_5m = pool.submit(_indicators_for_tail, data_5m, 78)
+            future_15m = pool.submit(_indicators_for_tail, data_15m, 100)
+            future_1m = pool.submit(_indicators_for_tail, data_1m, 240) if has_1m else None
+            data_5m, indicators_5m = future_5m.result()
+            data_15m, indicators_15m = future_15m.result()
+            if future_1m is not None:
+                logger.debug("[%s] 1m data: %d candles", ticker, len(data_1m))
+                data_1m, indicators_1m = future_1m.result()
 
         bias_5m, conf_5m, _ = copilot.bias_classifier.classify_bias(indicators_5m.iloc[-1])
         bias_15m, conf_15m, _ = copilot.bias_classifier.classify_bias(indicators_15m.iloc[-1])
 
         copilot_data = {'data_5m': data_5m, 'indicators_5m': indicators_5m, 'bias_5m': bias_5m.value, 'bias_15m': bias_15m.value}
 
-        # Process 1m data if available
-        indicators_1m = None
-        if data_1m is not None and not data_1m.empty:
-            print(f"[{ticker}] 1m data: {len(data_1m)} candles")
-            data_1m = data_1m.tail(240)
-            indicators_1m = calculate_all_indicators(data_1m, INDICATORS)
-        else:
-            print(f"[{ticker}] WARNING: No 1m data available")
-
         figs, walls, signals, iv_metrics, pcr, gex = create_chart(copilot_data, data_15m, indicators_15m, ticker=ticker, data_1m=data_1m, indicators_1m=indicators_1m)
 
         # Provide a small indicators summary for the frontend which expects
         # data.indicators.close and data.indicators.rsi (and a gamma_score).
-        try:
-            current_price = float(data_5m['Close'].iloc[-1])
-        except Exception:
-            current_price = None
+        # Pull the 5m columns out as arrays once; everything below is plain numpy.
+        close_np = data_5m['Close'].to_numpy(dtype=float)
+        volume_np = data_5m['Volume'].to_numpy(dtype=float)
+        atr_np = indicators_5m['ATR'].to_numpy(dtype=float) if 'ATR' in indicators_5m else None
+        rsi_np = indicators_5m['RSI'].to_numpy(dtype=float) if 'RSI' in indicators_5m else None
 
-        try:
-            rsi_val = float(indicators_5m['RSI'].iloc[-1]) if 'RSI' in indicators_5m else None
-        except Exception:
-            rsi_val = None
+        current_price = float(close_np[-1])
+        rsi_val = float(rsi_np[-1]) if rsi_np is not None else None
 
         # Compute a compact gamma_score similar to chart_view.py so the UI can display a gauge
-        try:
-            recent_volume = data_5m['Volume'].iloc[-5:].mean()
-            avg_volume = data_5m['Volume'].mean()
-            volume_ratio = (recent_volume / avg_volume) if avg_volume and avg_volume > 0 else 1.0
-        except Exception:
-            volume_ratio = 1.0
+        avg_volume = volume_np.mean()
+        volume_ratio = (volume_np[-5:].mean() / avg_volume) if avg_volume > 0 else 1.0
 
-        try:
-            if 'ATR' in indicators_5m:
-                current_atr = float(indicators_5m['ATR'].iloc[-1])
-                avg_atr = float(indicators_5m['ATR'].mean())
-                volatility_ratio = (current_atr / avg_atr) if avg_atr and avg_atr > 0 else 1.0
-            else:
-                volatility_ratio = 1.0
-        except Exception:
-            volatility_ratio = 1.0
+        volatility_ratio = 1.0
+        if atr_np is not None and not np.isnan(atr_np).all():
+            avg_atr = np.nanmean(atr_np)
+            if avg_atr > 0:
+                volatility_ratio = atr_np[-1] / avg_atr
 
-        try:
-            price_change_5m = ((data_5m['Close'].iloc[-1] / data_5m['Close'].iloc[-5]) - 1) * 100 if len(data_5m) >= 5 else 0
-        except Exception:
-            price_change_5m = 0
+        price_change_5m = ((close_np[-1] / close_np[-5]) - 1) * 100 if len(close_np) >= 5 else 0
 
         try:
             gamma_score = min(100, int((volume_ratio * 30 + volatility_ratio * 30 + abs(price_change_5m) * 10)))
@@ -559,7 +682,7 @@ def build_and_cache_payload(ticker="SPY"):
             gamma_score = 0
 
         # Get market status
-        market_status_info = MarketHours.get_market_status()
+        market_status_info = _get_market_status()
         
         # Get latest candle times for each timeframe
         latest_times = {}
@@ -580,9 +703,7 @@ def build_and_cache_payload(ticker="SPY"):
             pass
 
         payload = {
-            'chart_1m': _serialize_fig(figs.get('1m')) if figs.get('1m') is not None else None,
-            'chart_5m': _serialize_fig(figs.get('5m')),
-            'chart_15m': _serialize_fig(figs.get('15m')),
+            'charts': _serialize_figs(figs),
             'bias_5m': {'bias': bias_5m.value, 'confidence': conf_5m},
             'bias_15m': {'bias': bias_15m.value, 'confidence': conf_15m},
             'walls': walls[:5],
@@ -603,24 +724,32 @@ def build_and_cache_payload(ticker="SPY"):
             'latest': latest_times,
         }
 
+        # Encode (and gzip) once here so cache hits are served without
+        # re-serializing or compressing per request
+        payload_bytes = b''.join(_stream_json(payload))
+        payload_gzip = gzip.compress(payload_bytes, compresslevel=5)
+
         with _cache_lock:
             _ticker_cache[ticker]['payload'] = payload
+            _ticker_cache[ticker]['payload_bytes'] = payload_bytes
+            _ticker_cache[ticker]['payload_gzip'] = payload_gzip
             _ticker_cache[ticker]['cached_at'] = time.time()
 
     except Exception as e:
         print(f"ERROR building payload for {ticker}: {e}")
         import traceback
         traceback.print_exc()
-        # Store error payload so frontend knows what happened
         with _cache_lock:
-            _ticker_cache[ticker]['payload'] = {
-                'error': f'Failed to fetch data for {ticker}: {str(e)}',
-                'ticker': ticker
-            }
+            # Keep serving the last good payload if there is one; otherwise
+            # store an error payload so frontend knows what happened
+            if _ticker_cache[ticker]['payload'] is None or 'error' in _ticker_cache[ticker]['payload']:
+                _ticker_cache[ticker]['payload'] = {
+                    'error': f'Failed to fetch data for {ticker}: {str(e)}',
+                    'ticker': ticker
+                }
+                _ticker_cache[ticker]['payload_bytes'] = None
+                _ticker_cache[ticker]['payload_gzip'] = None
             _ticker_cache[ticker]['cached_at'] = time.time()
-    finally:
-        with _cache_lock:
-            _ticker_cache[ticker]['is_building'] = False
 
 
 def periodic_refresh():
@@ -668,6 +797,7 @@ def health():
 
 
 @app.route('/api/tickers')
+@cached('tickers')
 def get_tickers():
     """Return list of available tickers for dropdown"""
     tickers = get_ticker_list()
@@ -675,16 +805,17 @@ def get_tickers():
 
 
 @app.route('/api/analysis/debug')
+@cached('debug', default_ticker='SPY')
 def get_analysis_debug():
     try:
-        copilot = MarketCopilot()
+        ticker = request.args.get('ticker', 'SPY').upper()
+        copilot = MarketCopilot(ticker=ticker)
         data_5m = copilot.data_fetcher.fetch_data('5m', '5d')
         time.sleep(REQUEST_DELAY)
         if data_5m is None or data_5m.empty:
             return jsonify({'error': 'No 5m data available'}), 500
 
-        data_5m = data_5m.tail(78)
-        indicators_5m = calculate_all_indicators(data_5m, INDICATORS)
+        data_5m, indicators_5m = _indicators_for_tail(data_5m, 78)
 
         N = 10
         rows = []
@@ -726,6 +857,8 @@ def get_analysis():
         ticker = request.args.get('ticker', 'SPY').upper()
         
         # Check if cache exists and is fresh for this ticker
+        payload = None
+        cache_age = 0
         with _cache_lock:
             if ticker in _ticker_cache:
                 cache_entry = _ticker_cache[ticker]
@@ -735,39 +868,40 @@ def get_analysis():
                 # If we have an error payload (rate limited), return it with retry hint
                 if payload and 'error' in payload:
                     payload['cache_age'] = int(cache_age)
-                    return jsonify(payload), 429  # Return 429 Too Many Requests
-                
-                # Return fresh cached data
-                if payload and cache_age < CACHE_TTL:
-                    return jsonify(payload)
+                    return _json_response(payload, 429)  # Return 429 Too Many Requests
                 
-                # Cache exists but stale - if we're currently building, return stale data
-                if payload and cache_entry['is_building']:
-                    payload['stale'] = True
-                    payload['cache_age'] = int(cache_age)
-                    return jsonify(payload)
+                # Return fresh cached data (pre-encoded by the builder)
+                if payload and cache_age < CACHE_POLICIES['analysis']:
+                    if cache_entry.get('payload_bytes') is not None:
+                        return _encoded_response(cache_entry['payload_bytes'], cache_entry.get('payload_gzip'))
+                    return _json_response(payload)
+
+        # Cache exists but stale - return the last good payload right away and
+        # refresh it in the background (the build lock keeps this single-flight)
+        if payload:
+            if not _is_building(ticker):
+                threading.Thread(target=build_and_cache_payload,
+                                 args=(ticker, CACHE_POLICIES['analysis']), daemon=True).start()
+            payload['stale'] = True
+            payload['cache_age'] = int(cache_age)
+            response = _json_response(payload)
+            response.headers['X-Cache'] = 'stale'
+            return response
+
+        # Nothing cached yet - build on demand; concurrent requests for the
+        # same ticker wait on the one in-flight build instead of polling
+        build_and_cache_payload(ticker, max_age=CACHE_POLICIES['analysis'])
 
-        # Build on-demand if cache empty or stale
-        build_and_cache_payload(ticker)
+        with _cache_lock:
+            payload = _ticker_cache.get(ticker, {}).get('payload')
+        if payload:
+            # Return even if error - frontend will handle it
+            if 'error' in payload:
+                return _json_response(payload, 429)
+            return _json_response(payload)
 
-        # Wait for build to complete (up to 20 seconds to account for rate limits)
-        wait_start = time.time()
-        while True:
-            with _cache_lock:
-                if ticker in _ticker_cache:
-                    payload = _ticker_cache[ticker]['payload']
-                    if payload:
-                        # Return even if error - frontend will handle it
-                        if 'error' in payload:
-                            return jsonify(payload), 429
-                        return jsonify(payload)
-            if time.time() - wait_start > 20:
-                break
-            time.sleep(0.5)
-
-        # Timeout waiting for data
         return jsonify({
-            'error': 'Timeout waiting for data. Server may be rate limited.',
+            'error': 'No data available. Server may be rate limited.',
             'retry_after': 60
         }), 503
     
@@ -778,6 +912,9 @@ def get_analysis():
 if __name__ == '__main__':
     import os
 
+    # Show the backtest report on the console; per-chart debug lines stay hidden
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     port = int(os.environ.get('FLASK_RUN_PORT') or os.environ.get('FLASK_PORT') or 5000)
     for arg in sys.argv[1:]:
         if arg.startswith('--port=') or arg.startswith('-p='):
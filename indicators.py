@@ -3,55 +3,185 @@ Technical indicators module - Computes all required indicators
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Optional, Union
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
-def calculate_ema(data: pd.Series, period: int) -> pd.Series:
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _ewm_nb(x, alpha, min_periods):
+        """
+        Recursive EWM, same weighting as pandas ewm(adjust=False, ignore_na=False).
+        
+        A NaN input repeats the last value, but the old value keeps decaying across
+        the gap, so the next valid input weighs more than alpha.
+        """
+        n = x.shape[0]
+        out = np.empty(n)
+        old_wt_factor = 1.0 - alpha
+        weighted = np.nan
+        old_wt = 1.0
+        count = 0
+        for i in range(n):
+            v = x[i]
+            is_obs = not np.isnan(v)
+            if is_obs:
+                count += 1
+            if np.isnan(weighted):
+                if is_obs:
+                    weighted = v
+            else:
+                old_wt *= old_wt_factor
+                if is_obs:
+                    if weighted != v:
+                        weighted = (old_wt * weighted + alpha * v) / (old_wt + alpha)
+                    old_wt = 1.0
+            out[i] = weighted if count >= min_periods else np.nan
+        return out
+
+    @njit(cache=True)
+    def _atr_nb(high, low, close, period):
+        """True range + simple rolling mean, matching rolling(window=period).mean()."""
+        n = high.shape[0]
+        tr = np.empty(n)
+        out = np.full(n, np.nan)
+        window_sum = 0.0
+        window_nans = 0  # NaN true ranges in the window; the mean is NaN while any remain
+        for i in range(n):
+            # Largest of the available ranges (NaN-skipping, like max(axis=1))
+            t = high[i] - low[i]
+            if i > 0:
+                for r in (abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1])):
+                    if np.isnan(t) or r > t:
+                        t = r
+            tr[i] = t
+            if np.isnan(t):
+                window_nans += 1
+            else:
+                window_sum += t
+            if i >= period:
+                dropped = tr[i - period]
+                if np.isnan(dropped):
+                    window_nans -= 1
+                else:
+                    window_sum -= dropped
+            if i >= period - 1 and window_nans == 0:
+                out[i] = window_sum / period
+        return out
+
+    @njit(cache=True)
+    def _vwap_session_nb(tp, vol, session_ids):
+        """
+        Cumulative tp*volume / cumulative volume, reset whenever session_ids changes.
+        
+        NaN terms are skipped like a NaN-skipping cumsum: that bar's VWAP is NaN and
+        the session's totals carry on from the bars around it.
+        """
+        n = tp.shape[0]
+        out = np.empty(n)
+        cum_tpv = 0.0
+        cum_vol = 0.0
+        for i in range(n):
+            if i == 0 or session_ids[i] != session_ids[i - 1]:
+                cum_tpv = 0.0
+                cum_vol = 0.0
+            tpv = tp[i] * vol[i]
+            v = vol[i]
+            if not np.isnan(tpv):
+                cum_tpv += tpv
+            if not np.isnan(v):
+                cum_vol += v
+            if np.isnan(tpv) or np.isnan(v) or cum_vol == 0.0:
+                out[i] = np.nan
+            else:
+                out[i] = cum_tpv / cum_vol
+        return out
+
+    # Compile up front so the first request doesn't pay the JIT cost
+    _warm = np.ones(4)
+    _ewm_nb(_warm, 0.5, 1)
+    _atr_nb(_warm, _warm, _warm, 2)
+    _vwap_session_nb(_warm, _warm, np.zeros(4, dtype=np.int64))
+    del _warm
+
+
+def _session_ids(index: pd.Index) -> np.ndarray:
+    """Integer key per bar identifying its trading day (local midnight)."""
+    return index.normalize().asi8
+
+
+def calculate_ema(data: pd.Series, period: int, use_numba: bool = True) -> pd.Series:
     """
     Calculate Exponential Moving Average.
     
     Args:
         data: Price series (typically Close prices)
         period: EMA period
+        use_numba: Use the JIT kernel when numba is installed
     
     Returns:
         Series with EMA values
     """
+    if use_numba and NUMBA_AVAILABLE:
+        values = _ewm_nb(data.to_numpy(dtype=np.float64), 2.0 / (period + 1), 1)
+        return pd.Series(values, index=data.index)
     return data.ewm(span=period, adjust=False).mean()
 
 
-def calculate_rsi(data: pd.Series, period: int = 14) -> pd.Series:
+def calculate_rsi(data: pd.Series, period: int = 14, use_numba: bool = True) -> pd.Series:
     """
-    Calculate Relative Strength Index.
+    Calculate Relative Strength Index (Wilder's smoothing).
     
     Args:
         data: Price series (typically Close prices)
         period: RSI period (default 14)
+        use_numba: Use the JIT kernel when numba is installed
     
     Returns:
         Series with RSI values
     """
-    delta = data.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    delta = data.diff().to_numpy()
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    
+    # Wilder's smoothing (alpha = 1/period), one pass per side
+    if use_numba and NUMBA_AVAILABLE:
+        avg_gain = pd.Series(_ewm_nb(gain, 1.0 / period, period), index=data.index)
+        avg_loss = pd.Series(_ewm_nb(loss, 1.0 / period, period), index=data.index)
+    else:
+        avg_gain = pd.Series(gain, index=data.index).ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
+        avg_loss = pd.Series(loss, index=data.index).ewm(alpha=1 / period, adjust=False, min_periods=period).mean()
     
-    rs = gain / loss
+    rs = avg_gain / avg_loss
     rsi = 100 - (100 / (1 + rs))
     
     return rsi
 
 
-def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
+def calculate_atr(df: pd.DataFrame, period: int = 14, use_numba: bool = True) -> pd.Series:
     """
     Calculate Average True Range.
     
     Args:
         df: DataFrame with High, Low, Close columns
         period: ATR period (default 14)
+        use_numba: Use the JIT kernel when numba is installed
     
     Returns:
         Series with ATR values
     """
+    if use_numba and NUMBA_AVAILABLE:
+        values = _atr_nb(df['High'].to_numpy(dtype=np.float64),
+                         df['Low'].to_numpy(dtype=np.float64),
+                         df['Close'].to_numpy(dtype=np.float64),
+                         period)
+        return pd.Series(values, index=df.index)
+    
     high = df['High']
     low = df['Low']
     close = df['Close']
@@ -66,35 +196,47 @@ def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
     return atr
 
 
-def calculate_vwap(df: pd.DataFrame) -> pd.Series:
+def calculate_vwap(df: pd.DataFrame, use_numba: bool = True) -> pd.Series:
     """
     Calculate Volume Weighted Average Price for the current session.
     Resets at the start of each trading day.
     
     Args:
         df: DataFrame with High, Low, Close, Volume columns
+        use_numba: Use the JIT kernel when numba is installed
     
     Returns:
         Series with VWAP values
     """
-    typical_price = (df['High'] + df['Low'] + df['Close']) / 3
-    
-    # Get date component for grouping by session
-    df_copy = df.copy()
-    df_copy['date'] = df_copy.index.date
-    
-    # Calculate cumulative values within each session
-    df_copy['tp_volume'] = typical_price * df['Volume']
-    df_copy['cumul_tp_volume'] = df_copy.groupby('date')['tp_volume'].cumsum()
-    df_copy['cumul_volume'] = df_copy.groupby('date')['Volume'].cumsum()
-    
-    # VWAP = cumulative(typical_price * volume) / cumulative(volume)
-    vwap = df_copy['cumul_tp_volume'] / df_copy['cumul_volume']
-    
-    return vwap
+    tp = ((df['High'] + df['Low'] + df['Close']) / 3).to_numpy(dtype=np.float64)
+    vol = df['Volume'].to_numpy(dtype=np.float64)
+    session_ids = _session_ids(df.index)
+    
+    if use_numba and NUMBA_AVAILABLE:
+        values = _vwap_session_nb(tp, vol, session_ids)
+        return pd.Series(values, index=df.index)
+    
+    # Running totals over the whole frame, minus the total carried in from
+    # before each session's first bar (no copy/groupby needed). NaN terms are
+    # skipped like groupby cumsum, so they can't poison the later carries.
+    tpv = tp * vol
+    cum_tpv = np.nancumsum(tpv)
+    cum_vol = np.nancumsum(vol)
+    session_start = np.diff(session_ids, prepend=session_ids[:1] - 1) != 0
+    start_pos = np.maximum.accumulate(np.where(session_start, np.arange(len(tp)), 0))
+    carry_tpv = np.r_[0.0, cum_tpv][start_pos]
+    carry_vol = np.r_[0.0, cum_vol][start_pos]
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vwap = (cum_tpv - carry_tpv) / (cum_vol - carry_vol)
+    vwap[np.isnan(tpv) | np.isnan(vol)] = np.nan
+    
+    return pd.Series(vwap, index=df.index)
 
 
-def calculate_macd(data: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, pd.Series]:
+def calculate_macd(data: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9,
+                   ema: Optional[Callable[[int], pd.Series]] = None,
+                   use_numba: bool = True) -> Dict[str, pd.Series]:
     """
     Calculate MACD (Moving Average Convergence Divergence).
     
@@ -103,15 +245,19 @@ def calculate_macd(data: pd.Series, fast: int = 12, slow: int = 26, signal: int
         fast: Fast EMA period (default 12)
         slow: Slow EMA period (default 26)
         signal: Signal line period (default 9)
+        ema: Optional period -> EMA lookup so already-computed EMAs of data are reused
+        use_numba: Use the JIT EMA kernel when numba is installed
     
     Returns:
         Dictionary with 'macd', 'signal', and 'histogram' Series
     """
-    ema_fast = calculate_ema(data, fast)
-    ema_slow = calculate_ema(data, slow)
+    if ema is None:
+        ema = lambda period: calculate_ema(data, period, use_numba)
+    ema_fast = ema(fast)
+    ema_slow = ema(slow)
     
     macd_line = ema_fast - ema_slow
-    signal_line = calculate_ema(macd_line, signal)
+    signal_line = calculate_ema(macd_line, signal, use_numba)
     histogram = macd_line - signal_line
     
     return {
@@ -121,7 +267,7 @@ def calculate_macd(data: pd.Series, fast: int = 12, slow: int = 26, signal: int
     }
 
 
-def calculate_all_indicators(df: pd.DataFrame, config: Dict[str, int]) -> pd.DataFrame:
+def calculate_all_indicators(df: pd.DataFrame, config: Dict[str, int], use_numba: bool = True) -> pd.DataFrame:
     """
     Calculate all technical indicators and add them to the DataFrame.
     
@@ -132,40 +278,44 @@ def calculate_all_indicators(df: pd.DataFrame, config: Dict[str, int]) -> pd.Dat
             - ema_slow: Slow EMA period
             - rsi_period: RSI period
             - atr_period: ATR period
+        use_numba: Route EMA/RSI/ATR/VWAP through the numba kernels when available
     
     Returns:
         DataFrame with all indicators added as new columns
     """
-    df = df.copy()
-    
-    # EMAs
-    df['EMA_fast'] = calculate_ema(df['Close'], config['ema_fast'])
-    df['EMA_slow'] = calculate_ema(df['Close'], config['ema_slow'])
-    
-    # RSI
-    df['RSI'] = calculate_rsi(df['Close'], config['rsi_period'])
-    
-    # ATR
-    df['ATR'] = calculate_atr(df, config['atr_period'])
-    
-    # VWAP
-    df['VWAP'] = calculate_vwap(df)
-    
-    # MACD
-    macd_data = calculate_macd(df['Close'])
-    df['MACD'] = macd_data['macd']
-    df['MACD_signal'] = macd_data['signal']
-    df['MACD_histogram'] = macd_data['histogram']
+    close = df['Close']
     
-    return df
+    # EMAs of Close keyed by period, so MACD reuses any that match ema_fast/ema_slow
+    ema_cache = {}
+    
+    def ema(period):
+        if period not in ema_cache:
+            ema_cache[period] = calculate_ema(close, period, use_numba)
+        return ema_cache[period]
+    
+    macd_data = calculate_macd(close, ema=ema, use_numba=use_numba)
+    
+    # Build all indicator columns first, then attach them in one concat
+    indicators = pd.DataFrame({
+        'EMA_fast': ema(config['ema_fast']),
+        'EMA_slow': ema(config['ema_slow']),
+        'RSI': calculate_rsi(close, config['rsi_period'], use_numba),
+        'ATR': calculate_atr(df, config['atr_period'], use_numba),
+        'VWAP': calculate_vwap(df, use_numba),
+        'MACD': macd_data['macd'],
+        'MACD_signal': macd_data['signal'],
+        'MACD_histogram': macd_data['histogram'],
+    }, index=df.index)
+    
+    return pd.concat([df.drop(columns=indicators.columns, errors='ignore'), indicators], axis=1)
 
 
-def detect_volatility_regime(atr_series: pd.Series, lookback: int = 5) -> str:
+def detect_volatility_regime(atr_series: Union[pd.Series, np.ndarray], lookback: int = 5) -> str:
     """
     Detect whether volatility is expanding or compressing.
     
     Args:
-        atr_series: Series of ATR values
+        atr_series: ATR values, as a Series or a float64 array
         lookback: Number of periods to look back for trend
     
     Returns:
@@ -174,12 +324,13 @@ def detect_volatility_regime(atr_series: pd.Series, lookback: int = 5) -> str:
     if len(atr_series) < lookback + 1:
         return "Neutral"
     
-    recent_atr = atr_series.iloc[-lookback:].values
+    recent_atr = np.asarray(atr_series, dtype=np.float64)[-lookback:]
     
     # Check if ATR is generally rising or falling
-    # Simple linear regression slope
-    x = np.arange(len(recent_atr))
-    slope = np.polyfit(x, recent_atr, 1)[0]
+    # Simple linear regression slope (closed form for x = 0..n-1)
+    n = len(recent_atr)
+    x = np.arange(n) - (n - 1) / 2
+    slope = np.dot(x, recent_atr - recent_atr.mean()) / (n * (n * n - 1) / 12)
     
     # Threshold for significance (can be tuned)
     threshold = recent_atr.mean() * 0.01  # 1% of average ATR
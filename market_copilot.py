@@ -3,14 +3,18 @@ Market Copilot - Main orchestration script
 Analyzes SPY across multiple timeframes for options trading decisions
 """
 import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
-from data_fetcher import get_data_fetcher
-from indicators import calculate_all_indicators
-from bias_classifier import BiasClassifier
-from signal_generator import SignalGenerator
 from market_hours import MarketHours
 import config
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class MarketCopilot:
     """
@@ -21,7 +25,9 @@ class MarketCopilot:
         self,
         ticker: str = config.DEFAULT_TICKER,
         data_source: str = "yahoo",
-        request_delay: float = None
+        request_delay: float = None,
+        use_numba: bool = True,
+        async_output: bool = False
     ):
         """
         Initialize the Market Copilot.
@@ -30,9 +36,20 @@ class MarketCopilot:
             ticker: Stock ticker to analyze (default: SPY)
             data_source: Data source to use (default: yahoo)
             request_delay: Seconds between API requests (default: from config)
+            use_numba: Use the JIT indicator kernels when numba is installed
+            async_output: Print/export on a background thread so a polling loop can start
+                the next fetch right away (call flush() before exiting)
         """
+        # Heavy modules (yfinance, pandas, numba kernels) load here rather than at import time
+        from data_fetcher import get_data_fetcher
+        from bias_classifier import BiasClassifier
+        from signal_generator import SignalGenerator
+        
         print(f"[MarketCopilot] Initializing for ticker: {ticker}")
         self.ticker = ticker
+        self.use_numba = use_numba
+        # One worker keeps reports and exports in submission order
+        self._io_executor = ThreadPoolExecutor(max_workers=1) if async_output else None
         
         # Use config default if not specified
         if request_delay is None:
@@ -70,33 +87,26 @@ class MarketCopilot:
                     if market_status['next_open']:
                         print(f"   Next market open: {market_status['next_open']}\n")
             
-            # Fetch data for both timeframes
-            timeframe_data = {}
+            # One request at the finest interval; coarser timeframes are
+            # resampled from it where possible (see DataFetcher.fetch_multi)
+            intervals = list(config.TIMEFRAMES.values())
+            raw_frames = self.data_fetcher.fetch_multi(intervals, period=config.DATA_PERIOD)
             
-            for tf_name, tf_interval in config.TIMEFRAMES.items():
-                # Fetch raw data
-                raw_data = self.data_fetcher.fetch_data(
-                    interval=tf_interval,
-                    period=config.DATA_PERIOD
-                )
-                
-                # Check data freshness
-                if check_market_hours and not raw_data.empty:
-                    latest_timestamp = raw_data.index[-1]
-                    is_fresh, freshness_msg = MarketHours.check_data_freshness(latest_timestamp)
-                    
+            # Check data freshness for every timeframe in one pass
+            if check_market_hours:
+                freshness = MarketHours.check_data_freshness_many({
+                    tf_interval: raw_frames[tf_interval].index
+                    for tf_interval in intervals if not raw_frames[tf_interval].empty
+                }, market_status=market_status)
+                for tf_interval, (is_fresh, freshness_msg) in freshness.items():
                     if not is_fresh:
                         data_freshness_warnings.append(f"{tf_interval}: {freshness_msg}")
                         if verbose:
                             print(f"   {freshness_msg}")
-                
-                # Calculate indicators
-                enriched_data = calculate_all_indicators(
-                    raw_data,
-                    config.INDICATORS
-                )
-                
-                timeframe_data[tf_interval] = enriched_data
+            
+            # Indicators and classification are CPU-bound, so run them inline;
+            # the concurrency that pays off is in fetch_multi's network calls
+            timeframe_data = {tf_interval: self._enrich(raw_frames[tf_interval]) for tf_interval in intervals}
             
             # Generate multi-timeframe signal
             signal = self.signal_generator.generate_multi_timeframe_signal(
@@ -112,7 +122,7 @@ class MarketCopilot:
             
             # Print formatted output if verbose
             if verbose:
-                self._print_signal(signal)
+                self._run_io(self._print_signal, signal)
             
             return signal
         
@@ -122,6 +132,39 @@ class MarketCopilot:
                 print(f"\n❌ {error_msg}\n")
             return {"error": error_msg}
     
+    def _enrich(self, raw_data):
+        """
+        Calculate indicators for one timeframe's candles.
+        
+        Args:
+            raw_data: OHLCV DataFrame for the timeframe
+        
+        Returns:
+            DataFrame with indicator columns added
+        """
+        from indicators import calculate_all_indicators
+        return calculate_all_indicators(
+            raw_data,
+            config.INDICATORS,
+            use_numba=self.use_numba
+        )
+    
+    def _run_io(self, func, *args) -> None:
+        """Run an output task inline, or on the background I/O thread when async_output is on."""
+        if self._io_executor is None:
+            func(*args)
+        else:
+            self._io_executor.submit(func, *args)
+    
+    def flush(self) -> None:
+        """
+        Wait for any queued background prints/exports to finish.
+        The copilot keeps working afterwards; a new I/O thread is started on demand.
+        """
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=True)
+            self._io_executor = ThreadPoolExecutor(max_workers=1)
+    
     def _print_signal(self, signal: Dict[str, Any]) -> None:
         """
         Print the signal in a formatted, human-readable way.
@@ -129,48 +172,48 @@ class MarketCopilot:
         Args:
             signal: The complete signal dictionary
         """
-        print("\n" + "="*80)
-        print(f"  MARKET COPILOT - {signal['ticker']} Analysis")
-        print(f"  {signal['analysis_timestamp']}")
+        # Build the whole report and write it once (one stdout lock/flush instead of dozens)
+        parts = ["\n" + "="*80,
+                 f"  MARKET COPILOT - {signal['ticker']} Analysis",
+                 f"  {signal['analysis_timestamp']}"]
         
         # Show market status if available
         if 'market_status' in signal:
             status = signal['market_status']['status']
-            print(f"  Market Status: {status}")
+            parts.append(f"  Market Status: {status}")
         
-        print("="*80)
+        parts.append("="*80)
         
-        # Print each timeframe
+        # Each timeframe
         for tf_name, tf_signal in signal['timeframes'].items():
-            print(f"\n📊 {tf_name.upper()} Timeframe:")
-            print(f"   Bias: {tf_signal['bias']} ({tf_signal['confidence_label']} - {tf_signal['confidence']:.1%})")
-            print(f"   Volatility: {tf_signal['volatility_regime']}")
-            
-            # Indicators
             ind = tf_signal['indicators']
-            print(f"\n   Indicators:")
-            print(f"      Close: ${ind['close']}")
-            print(f"      VWAP:  ${ind['vwap']}")
-            print(f"      EMA9:  ${ind['ema_9']}  |  EMA21: ${ind['ema_21']}")
-            print(f"      RSI:   {ind['rsi']}  |  ATR: ${ind['atr']}")
-            
-            # Analysis notes
-            print(f"\n   Analysis:")
-            for note in tf_signal['analysis_notes']:
-                print(f"      • {note}")
+            parts.append(
+                f"\n📊 {tf_name.upper()} Timeframe:\n"
+                f"   Bias: {tf_signal['bias']} ({tf_signal['confidence_label']} - {tf_signal['confidence']:.1%})\n"
+                f"   Volatility: {tf_signal['volatility_regime']}\n"
+                f"\n   Indicators:\n"
+                f"      Close: ${ind['close']}\n"
+                f"      VWAP:  ${ind['vwap']}\n"
+                f"      EMA9:  ${ind['ema_9']}  |  EMA21: ${ind['ema_21']}\n"
+                f"      RSI:   {ind['rsi']}  |  ATR: ${ind['atr']}\n"
+                f"\n   Analysis:"
+            )
+            parts.extend(f"      • {note}" for note in tf_signal['analysis_notes'])
         
         # Synthesis
-        print("\n" + "-"*80)
-        print("📈 SYNTHESIS:")
         synthesis = signal['synthesis']
-        print(f"   Overall Bias: {synthesis['overall_bias']} (Avg Confidence: {synthesis['average_confidence']:.1%})")
-        print(f"   Alignment: {synthesis['timeframe_alignment']} - {synthesis['alignment_strength']}")
-        
-        print(f"\n💡 RECOMMENDATIONS:")
-        for rec in synthesis['recommendations']:
-            print(f"   • {rec}")
+        parts.append(
+            "\n" + "-"*80 + "\n"
+            "📈 SYNTHESIS:\n"
+            f"   Overall Bias: {synthesis['overall_bias']} (Avg Confidence: {synthesis['average_confidence']:.1%})\n"
+            f"   Alignment: {synthesis['timeframe_alignment']} - {synthesis['alignment_strength']}\n"
+            f"\n💡 RECOMMENDATIONS:"
+        )
+        parts.extend(f"   • {rec}" for rec in synthesis['recommendations'])
         
-        print("\n" + "="*80 + "\n")
+        parts.append("\n" + "="*80 + "\n")
+        sys.stdout.write("\n".join(parts) + "\n")
+        sys.stdout.flush()
     
     def export_to_json(self, signal: Dict[str, Any], filepath: str) -> None:
         """
@@ -180,8 +223,17 @@ class MarketCopilot:
             signal: The signal dictionary to export
             filepath: Path to save the JSON file
         """
-        with open(filepath, 'w') as f:
-            json.dump(signal, f, indent=2)
+        self._run_io(self._write_json, signal, filepath)
+    
+    def _write_json(self, signal: Dict[str, Any], filepath: str) -> None:
+        """Write the signal to filepath (runs inline or on the I/O thread)."""
+        if ORJSON_AVAILABLE:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(signal, option=options))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(signal, f, indent=2)
         print(f"Signal exported to {filepath}")
 
 
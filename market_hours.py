@@ -1,10 +1,55 @@
 """
 Market hours detection and data freshness validation
 """
+from bisect import bisect_right
 from datetime import datetime, time, timedelta
-import pytz
-from typing import Tuple, Optional
-import pandas as pd
+import time as _time
+from zoneinfo import ZoneInfo
+from typing import Any, Dict, Tuple, Optional
+
+
+# Message prefixes shared by the freshness checks
+_WARN = "⚠️  "
+_OK = "✓ "
+
+
+# Holiday and session calendars are computed once, on first use, for this span
+_CALENDAR_START = '2000-01-01'
+_CALENDAR_END = '2040-12-31'
+
+
+def _build_nyse_calendar():
+    """
+    Build the NYSE holiday set and sorted session-day list for the calendar span.
+    pandas is imported here so importing this module stays cheap.
+    
+    Returns:
+        Tuple of (frozenset of holiday dates, sorted list of session dates)
+    """
+    import pandas as pd
+    from pandas.tseries.holiday import (
+        AbstractHolidayCalendar, Holiday, GoodFriday, USMartinLutherKingJr, USPresidentsDay,
+        USMemorialDay, USLaborDay, USThanksgivingDay, nearest_workday, sunday_to_monday
+    )
+    
+    class _NYSEHolidayCalendar(AbstractHolidayCalendar):
+        """Regular NYSE full-day closures (no one-off closures such as national days of mourning)."""
+        rules = [
+            Holiday('New Years Day', month=1, day=1, observance=sunday_to_monday),
+            USMartinLutherKingJr,
+            USPresidentsDay,
+            GoodFriday,
+            USMemorialDay,
+            Holiday('Juneteenth', month=6, day=19, start_date='2022-01-01', observance=nearest_workday),
+            Holiday('Independence Day', month=7, day=4, observance=nearest_workday),
+            USLaborDay,
+            USThanksgivingDay,
+            Holiday('Christmas', month=12, day=25, observance=nearest_workday),
+        ]
+    
+    holiday_index = _NYSEHolidayCalendar().holidays(_CALENDAR_START, _CALENDAR_END)
+    session_days = pd.bdate_range(_CALENDAR_START, _CALENDAR_END, freq='C', holidays=holiday_index)
+    return frozenset(holiday_index.date), list(session_days.date)
 
 
 class MarketHours:
@@ -13,7 +58,7 @@ class MarketHours:
     """
     
     # US stock market timezone (market logic always in ET)
-    MARKET_TZ = pytz.timezone('America/New_York')
+    MARKET_TZ = ZoneInfo('America/New_York')
     
     # Display timezone (can be different from market timezone)
     DISPLAY_TZ = None  # Will be set from config
@@ -26,6 +71,43 @@ class MarketHours:
     PREMARKET_OPEN = time(4, 0)   # 4:00 AM ET
     AFTERHOURS_CLOSE = time(20, 0)  # 8:00 PM ET
     
+    # Intraday session lookup: bisect the time of day (microseconds) into these boundaries.
+    # The close boundaries sit 1us past the close so MARKET_CLOSE/AFTERHOURS_CLOSE stay inclusive.
+    _BOUNDARIES = [
+        (t.hour * 3600 + t.minute * 60 + t.second) * 1_000_000 + t.microsecond + offset
+        for t, offset in ((PREMARKET_OPEN, 0), (MARKET_OPEN, 0), (MARKET_CLOSE, 1), (AFTERHOURS_CLOSE, 1))
+    ]
+    _STATUS_TABLE = ("Closed", "Pre-Market", "Open", "After-Hours", "Closed")
+    
+    # Status can't change within a second; memoize the status checks for that long
+    STATUS_CACHE_SECONDS = 1.0
+    _status_cache = {}  # {key: (monotonic timestamp, value)}
+    
+    # NYSE holidays (set of dates) and sorted session days (list of dates), built on first use
+    _HOLIDAYS = None
+    _SESSION_DAYS = None
+    
+    @classmethod
+    def _load_calendar(cls) -> None:
+        """Build the holiday/session calendars the first time they are needed."""
+        if cls._SESSION_DAYS is None:
+            cls._HOLIDAYS, cls._SESSION_DAYS = _build_nyse_calendar()
+    
+    @classmethod
+    def _cached(cls, key):
+        """Return (hit, value) for a memoized status entry younger than STATUS_CACHE_SECONDS."""
+        entry = cls._status_cache.get(key)
+        if entry is not None and _time.monotonic() - entry[0] < cls.STATUS_CACHE_SECONDS:
+            return True, entry[1]
+        return False, None
+    
+    @classmethod
+    def _session_status(cls, current_time: time) -> str:
+        """Intraday status ("Closed", "Pre-Market", "Open", "After-Hours") for an ET time of day."""
+        usec = ((current_time.hour * 3600 + current_time.minute * 60 + current_time.second) * 1_000_000
+                + current_time.microsecond)
+        return cls._STATUS_TABLE[bisect_right(cls._BOUNDARIES, usec)]
+    
     @classmethod
     def set_display_timezone(cls, tz_name: str):
         """
@@ -34,7 +116,7 @@ class MarketHours:
         Args:
             tz_name: Timezone name (e.g., 'America/Chicago' for Central Time)
         """
-        cls.DISPLAY_TZ = pytz.timezone(tz_name)
+        cls.DISPLAY_TZ = ZoneInfo(tz_name)
     
     @classmethod
     def to_display_time(cls, dt: datetime) -> datetime:
@@ -50,7 +132,7 @@ class MarketHours:
         if cls.DISPLAY_TZ is None:
             return dt
         if dt.tzinfo is None:
-            dt = cls.MARKET_TZ.localize(dt)
+            dt = dt.replace(tzinfo=cls.MARKET_TZ)
         return dt.astimezone(cls.DISPLAY_TZ)
     
     @classmethod
@@ -74,28 +156,35 @@ class MarketHours:
         Returns:
             True if market is open, False otherwise
         """
+        key = ('is_market_open', include_extended_hours)
+        hit, value = cls._cached(key)
+        if hit:
+            return value
+        
         now = cls.get_market_time()
         current_time = now.time()
         
         # Check if it's a weekend
         if now.weekday() >= 5:  # Saturday = 5, Sunday = 6
-            return False
+            is_open = False
         
         # Check if it's a US market holiday (simplified - doesn't account for all holidays)
-        if cls._is_market_holiday(now):
-            return False
+        elif cls._is_market_holiday(now):
+            is_open = False
         
         # Check trading hours
-        if include_extended_hours:
-            return cls.PREMARKET_OPEN <= current_time <= cls.AFTERHOURS_CLOSE
+        elif include_extended_hours:
+            is_open = cls._session_status(current_time) != "Closed"
         else:
-            return cls.MARKET_OPEN <= current_time <= cls.MARKET_CLOSE
+            is_open = cls._session_status(current_time) == "Open"
+        
+        cls._status_cache[key] = (_time.monotonic(), is_open)
+        return is_open
     
     @classmethod
     def _is_market_holiday(cls, dt: datetime) -> bool:
         """
-        Check if date is a major US market holiday.
-        Note: This is a simplified check. For production, use a proper holiday calendar.
+        Check if date is a NYSE market holiday (including floating and observed holidays).
         
         Args:
             dt: Datetime to check
@@ -103,24 +192,8 @@ class MarketHours:
         Returns:
             True if it's a known market holiday
         """
-        # Major holidays (simplified list)
-        year = dt.year
-        
-        # New Year's Day
-        if dt.month == 1 and dt.day == 1:
-            return True
-        
-        # Independence Day
-        if dt.month == 7 and dt.day == 4:
-            return True
-        
-        # Christmas
-        if dt.month == 12 and dt.day == 25:
-            return True
-        
-        # Add more holidays as needed (MLK Day, Presidents Day, Good Friday, etc.)
-        
-        return False
+        cls._load_calendar()
+        return dt.date() in cls._HOLIDAYS
     
     @classmethod
     def get_market_status(cls) -> dict:
@@ -130,6 +203,10 @@ class MarketHours:
         Returns:
             Dictionary with market status details
         """
+        hit, value = cls._cached('market_status')
+        if hit:
+            return dict(value)
+        
         now = cls.get_market_time()
         current_time = now.time()
         is_weekend = now.weekday() >= 5
@@ -142,26 +219,20 @@ class MarketHours:
         elif is_holiday:
             status = "Holiday"
             next_open = cls._get_next_market_open(now)
-        elif cls.MARKET_OPEN <= current_time <= cls.MARKET_CLOSE:
-            status = "Open"
-            next_open = None
-        elif cls.PREMARKET_OPEN <= current_time < cls.MARKET_OPEN:
-            status = "Pre-Market"
-            next_open = None
-        elif cls.MARKET_CLOSE < current_time <= cls.AFTERHOURS_CLOSE:
-            status = "After-Hours"
-            next_open = None
         else:
-            status = "Closed"
-            next_open = cls._get_next_market_open(now)
+            status = cls._session_status(current_time)
+            next_open = cls._get_next_market_open(now) if status == "Closed" else None
         
-        return {
+        # Same clock reading as status above, so no separate is_market_open() calls
+        market_status = {
             "status": status,
-            "is_open": cls.is_market_open(include_extended_hours=False),
-            "is_extended_hours": cls.is_market_open(include_extended_hours=True) and not cls.is_market_open(include_extended_hours=False),
+            "is_open": status == "Open",
+            "is_extended_hours": status in ("Pre-Market", "After-Hours"),
             "current_time_et": now.strftime("%Y-%m-%d %H:%M:%S %Z"),
             "next_open": next_open.strftime("%Y-%m-%d %H:%M:%S %Z") if next_open else None
         }
+        cls._status_cache['market_status'] = (_time.monotonic(), market_status)
+        return dict(market_status)
     
     @classmethod
     def _get_next_market_open(cls, from_time: datetime) -> datetime:
@@ -174,7 +245,14 @@ class MarketHours:
         Returns:
             Next market open datetime
         """
-        # Start with next day
+        # First precomputed session day after from_time's date
+        cls._load_calendar()
+        idx = bisect_right(cls._SESSION_DAYS, from_time.date())
+        if idx < len(cls._SESSION_DAYS):
+            next_date = cls._SESSION_DAYS[idx]
+            return datetime.combine(next_date, cls.MARKET_OPEN, tzinfo=cls.MARKET_TZ)
+        
+        # Past the precomputed range - step day by day
         next_day = from_time + timedelta(days=1)
         next_day = next_day.replace(hour=9, minute=30, second=0, microsecond=0)
         
@@ -192,40 +270,102 @@ class MarketHours:
         return next_day
     
     @classmethod
-    def check_data_freshness(cls, latest_timestamp: pd.Timestamp, max_age_minutes: int = 30) -> Tuple[bool, str]:
+    def check_data_freshness(cls, latest_timestamp, max_age_minutes: int = 30,
+                             market_status: Optional[dict] = None) -> Tuple[bool, str]:
         """
         Check if data is fresh enough for real-time analysis.
         
         Args:
-            latest_timestamp: Most recent data timestamp
+            latest_timestamp: Most recent data timestamp, or a DatetimeIndex whose last entry is used
             max_age_minutes: Maximum acceptable age in minutes
+            market_status: Result of get_market_status() if the caller already has it
         
         Returns:
             Tuple of (is_fresh, warning_message)
         """
-        now = cls.get_market_time()
+        import numpy as np
+        import pandas as pd
+        
+        if market_status is None:
+            market_status = cls.get_market_status()
+        market_active = market_status['is_open'] or market_status['is_extended_hours']
+        
+        if isinstance(latest_timestamp, pd.DatetimeIndex):
+            index = latest_timestamp
+            if index.tz is not None and market_active:
+                # Market open: age straight from the raw UTC datetime64, no Timestamp needed
+                age = np.datetime64(_time.time_ns(), 'ns') - index.values[-1]
+                age_minutes = age / np.timedelta64(1, 'm')
+                return cls._freshness_result(age_minutes, max_age_minutes)
+            latest_timestamp = index[-1]
         
-        # Convert timestamp to market timezone if needed
+        # Naive timestamps are market time
+        latest_timestamp = pd.Timestamp(latest_timestamp)
         if latest_timestamp.tzinfo is None:
-            latest_timestamp = cls.MARKET_TZ.localize(latest_timestamp)
-        else:
+            latest_timestamp = latest_timestamp.replace(tzinfo=cls.MARKET_TZ)
+        
+        # Age from int64 epoch nanoseconds (Timestamp.value), no Timedelta in between
+        age_minutes = (_time.time_ns() - latest_timestamp.value) / 60_000_000_000
+        
+        # If market is closed, we expect stale data
+        if not market_active:
             latest_timestamp = latest_timestamp.astimezone(cls.MARKET_TZ)
+            prefix, suffix = cls._closed_warning_parts(market_status)
+            data_time = latest_timestamp.strftime('%Y-%m-%d %H:%M:%S %Z')
+            return False, f"{prefix}Data is from {data_time} ({age_minutes:.0f} minutes old).{suffix}"
+        
+        # Market is open - check freshness
+        return cls._freshness_result(age_minutes, max_age_minutes)
+    
+    @classmethod
+    def check_data_freshness_many(cls, latest: Dict[str, Any], max_age_minutes: int = 30,
+                                  market_status: Optional[dict] = None) -> Dict[str, Tuple[bool, str]]:
+        """
+        Check freshness for several timeframes at once (one clock read, vectorized ages).
         
-        age = now - latest_timestamp
-        age_minutes = age.total_seconds() / 60
+        Args:
+            latest: Mapping of name -> latest timestamp (or DatetimeIndex whose last entry is used)
+            max_age_minutes: Maximum acceptable age in minutes
+            market_status: Result of get_market_status() if the caller already has it
+        
+        Returns:
+            Mapping of name -> (is_fresh, warning_message), same messages as check_data_freshness
+        """
+        if not latest:
+            return {}
+        
+        import numpy as np
+        import pandas as pd
+        
+        stamps = [v[-1] if isinstance(v, pd.DatetimeIndex) else v for v in latest.values()]
+        stamps = [ts if ts.tzinfo is not None else ts.replace(tzinfo=cls.MARKET_TZ) for ts in stamps]
+        latest_utc = pd.to_datetime(stamps, utc=True)
+        ages_min = (np.datetime64(_time.time_ns(), 'ns') - latest_utc.values) / np.timedelta64(1, 'm')
         
         # If market is closed, we expect stale data
-        if not cls.is_market_open(include_extended_hours=True):
+        if market_status is None:
             market_status = cls.get_market_status()
-            warning = (f"⚠️  Market is currently {market_status['status']}. "
-                      f"Data is from {latest_timestamp.strftime('%Y-%m-%d %H:%M:%S %Z')} "
-                      f"({age_minutes:.0f} minutes old).")
-            if market_status['next_open']:
-                warning += f" Next open: {market_status['next_open']}"
-            return False, warning
+        if not (market_status['is_open'] or market_status['is_extended_hours']):
+            data_times = latest_utc.tz_convert(cls.MARKET_TZ).strftime('%Y-%m-%d %H:%M:%S %Z')
+            prefix, suffix = cls._closed_warning_parts(market_status)
+            return {
+                name: (False, f"{prefix}Data is from {data_time} ({age:.0f} minutes old).{suffix}")
+                for name, data_time, age in zip(latest, data_times, ages_min)
+            }
         
-        # Market is open - check freshness
+        return {name: cls._freshness_result(age, max_age_minutes) for name, age in zip(latest, ages_min)}
+    
+    @staticmethod
+    def _closed_warning_parts(market_status: dict) -> Tuple[str, str]:
+        """Constant (prefix, suffix) of the closed-market warning, built once per status."""
+        prefix = f"{_WARN}Market is currently {market_status['status']}. "
+        suffix = f" Next open: {market_status['next_open']}" if market_status['next_open'] else ""
+        return prefix, suffix
+    
+    @staticmethod
+    def _freshness_result(age_minutes: float, max_age_minutes: int) -> Tuple[bool, str]:
+        """Freshness verdict for data of a given age while the market is open."""
         if age_minutes > max_age_minutes:
-            return False, f"⚠️  Data may be stale. Latest data is {age_minutes:.0f} minutes old (max: {max_age_minutes} minutes)."
+            return False, f"{_WARN}Data may be stale. Latest data is {age_minutes:.0f} minutes old (max: {max_age_minutes} minutes)."
         
-        return True, f"✓ Data is fresh ({age_minutes:.1f} minutes old)"
+        return True, f"{_OK}Data is fresh ({age_minutes:.1f} minutes old)"
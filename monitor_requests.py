@@ -1,13 +1,14 @@
 """
 Monitor API request statistics
 """
-from data_fetcher import YahooFinanceDataFetcher
 
 
 def print_request_stats():
     """
     Print current request statistics in a formatted way.
     """
+    from data_fetcher import YahooFinanceDataFetcher
+    
     stats = YahooFinanceDataFetcher.get_request_stats()
     
     print("\n" + "="*60)
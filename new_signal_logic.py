@@ -37,135 +37,167 @@ SELL SIGNAL REQUIREMENTS (must meet 3/8):
 8. Gamma score elevated (>40) - indicates high volatility/conviction
 """
 
+import numpy as np
 import pandas as pd
 from typing import List, Dict, Optional
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit: the scan core then runs as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
 
-def generate_multi_timeframe_signals(
-    data_1m: pd.DataFrame,
-    data_5m: pd.DataFrame,
-    data_15m: pd.DataFrame,
-    indicators_1m: pd.DataFrame,
-    indicators_5m: pd.DataFrame,
-    indicators_15m: pd.DataFrame
-) -> List[Dict]:
+
+# Signal type codes returned by the scan core
+SIGNAL_NONE = 0
+SIGNAL_BUY = 1
+SIGNAL_SELL = 2
+
+# Frequency limiting: minutes between signals, shortened for strong (6+ condition) signals
+SIGNAL_COOLDOWN_MINUTES = 15
+STRONG_SIGNAL_COOLDOWN_MINUTES = 10
+STRONG_SIGNAL_CONDITIONS = 6
+
+# Condition labels in the order they are checked; bit k of a candle's condition mask is label k
+_BUY_CONDITION_LABELS = (
+    "15m above VWAP",
+    "5m above VWAP",
+    "1m pullback to VWAP",
+    "1m near EMA9",
+    "RSI rising 35-60",
+    "MACD increasing",
+    "Volume above average",
+    "15m MACD positive",
+    "Gamma elevated ({gamma}%)",
+    "STRONG: Golden Cross (EMA9 > EMA21)",
+    "STRONG: 5m MACD bullish shift",
+)
+_SELL_CONDITION_LABELS = (
+    "15m below VWAP",
+    "5m below VWAP",
+    "Failed VWAP reclaim",
+    "Failed EMA9 reclaim",
+    "RSI falling 65-40",
+    "MACD decreasing",
+    "Volume above average",
+    "15m MACD negative",
+    "Gamma elevated ({gamma}%)",
+    "STRONG: Death Cross (EMA9 < EMA21)",
+    "STRONG: 5m MACD bearish shift",
+)
+
+
+# Set bit positions and number of conditions met for every possible condition bitmask
+_MASK_BITS = tuple(
+    tuple(k for k in range(len(_BUY_CONDITION_LABELS)) if (mask >> k) & 1)
+    for mask in range(1 << len(_BUY_CONDITION_LABELS))
+)
+_CONDITION_COUNTS = np.array([len(bits) for bits in _MASK_BITS])
+_GAMMA_BIT = 8  # the only label with a value in it
+
+_MINUTE_NS = 60 * 1_000_000_000
+_FIVE_MIN_NS = 5 * _MINUTE_NS
+
+
+def condition_labels(code: int, mask: int, gamma_score: int) -> List[str]:
     """
-    Generate buy/sell signals with multi-timeframe confirmation.
+    Human-readable conditions behind one row of generate_multi_timeframe_signal_frame.
     
-    Returns list of signals: [{timestamp, price, type, strength, conditions_met, label}]
+    Args:
+        code: The row's type_code (SIGNAL_BUY or SIGNAL_SELL)
+        mask: The row's cond_bitmask
+        gamma_score: The row's gamma
+    
+    Returns:
+        Labels of the met conditions, in condition order
     """
-    signals = []
+    labels = _BUY_CONDITION_LABELS if code == SIGNAL_BUY else _SELL_CONDITION_LABELS
+    return [labels[k].format(gamma=gamma_score) if k == _GAMMA_BIT else labels[k]
+            for k in _MASK_BITS[mask]]
+
+
+def _signal_dict(timestamp, price: float, code: int, mask: int, gamma_score: int) -> Dict:
+    """Assemble one signal dict from the scan's per-candle outputs."""
+    is_buy = code == SIGNAL_BUY
+    conditions = condition_labels(code, mask, gamma_score)
+    return {
+        'timestamp': timestamp,
+        'price': price,
+        'type': 'buy' if is_buy else 'sell',
+        'strength': len(conditions) * 12,  # 8 conditions max = 96%
+        'conditions_met': len(conditions),
+        'conditions': conditions,
+        'label': f"{'BUY' if is_buy else 'SELL'} ({len(conditions)}/8 conditions) [γ={gamma_score}]"
+    }
+
+
+def _aligned(indicators: pd.DataFrame, data: pd.DataFrame) -> pd.DataFrame:
+    """Return indicators row-aligned with data, so positions index both frames."""
+    if indicators.index.equals(data.index):
+        return indicators
+    return indicators.reindex(data.index)
+
+
+def _pack_bits(conditions) -> np.ndarray:
+    """Pack a sequence of boolean arrays into a uint16 bitmask (bit k = conditions[k])."""
+    mask = np.zeros(len(conditions[0]), dtype=np.uint16)
+    for k, condition in enumerate(conditions):
+        mask |= condition.astype(np.uint16) << np.uint16(k)
+    return mask
+
+
+def _popcount(mask: np.ndarray) -> np.ndarray:
+    """Number of set bits per element (np.bitwise_count on numpy 2, table lookup before)."""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(mask)
+    return _CONDITION_COUNTS[mask]
+
+
+def _index_ns(index: pd.DatetimeIndex) -> np.ndarray:
+    """Int64 nanosecond view of a DatetimeIndex (UTC epoch when tz-aware), for searchsorted."""
+    return index.as_unit('ns').asi8
+
+
+@njit(cache=True)
+def _pack_conditions(conditions):
+    """Pack a tuple of condition flags into (bitmask, number of flags set)."""
+    mask = 0
+    count = 0
+    for k in range(len(conditions)):
+        if conditions[k]:
+            mask |= 1 << k
+            count += 1
+    return mask, count
+
+
+@njit(cache=True)
+def _scan_signals_core(close_5m, vwap_5m, ema9_5m, rsi_5m, hist_5m, prev_hist_5m,
+                       volume_5m, avg_volume_5m, recent_high_5m, gamma_5m, golden_cross, death_cross,
+                       has_15m, close_15m, vwap_15m, hist_15m,
+                       has_1m, close_1m, high_1m, vwap_1m, rsi_1m, hist_1m, macd_increasing_1m,
+                       volume_1m, avg_volume_1m):
+    """
+    Evaluate the buy/sell rules for every 5m candle.
     
-    # Need minimum data
-    if len(data_5m) < 20:
-        return signals
+    Every input is a per-5m-candle array; 15m and 1m values are already gathered
+    at each candle's aligned position (has_15m/has_1m mark candles with no match).
     
-    # Scan through 5m candles (primary timeframe)
-    for i in range(20, len(data_5m)):
-        # Current 5m candle
-        close_5m = float(data_5m['Close'].iloc[i])
-        timestamp_5m = data_5m.index[i]
-        volume_5m = float(data_5m['Volume'].iloc[i])
-        
-        # 5m indicators
-        vwap_5m = float(indicators_5m['VWAP'].iloc[i])
-        ema9_5m = float(indicators_5m['EMA_fast'].iloc[i])
-        ema21_5m = float(indicators_5m['EMA_slow'].iloc[i])
-        rsi_5m = float(indicators_5m['RSI'].iloc[i])
-        macd_5m = float(indicators_5m['MACD'].iloc[i])
-        macd_signal_5m = float(indicators_5m['MACD_signal'].iloc[i])
-        macd_hist_5m = macd_5m - macd_signal_5m
-        
-        # Calculate Gamma Score (0-100) based on volume, volatility, and momentum
-        # WHY: High gamma indicates explosive move potential (like gamma squeezes)
-        recent_volume_5m = float(data_5m['Volume'].iloc[max(0, i-5):i].mean())
-        avg_volume_5m_calc = float(data_5m['Volume'].iloc[max(0, i-20):i].mean())
-        volume_ratio = (recent_volume_5m / avg_volume_5m_calc) if avg_volume_5m_calc > 0 else 1.0
-        
-        # Calculate volatility (ATR-based if available)
-        if 'ATR' in indicators_5m.columns:
-            current_atr = float(indicators_5m['ATR'].iloc[i])
-            avg_atr = float(indicators_5m['ATR'].iloc[max(0, i-20):i].mean())
-            volatility_ratio = (current_atr / avg_atr) if avg_atr > 0 else 1.0
-        else:
-            volatility_ratio = 1.0
-        
-        # Calculate price momentum over last 5 candles
-        if i >= 5:
-            price_change_5m = ((close_5m / float(data_5m['Close'].iloc[i-5])) - 1) * 100
-        else:
-            price_change_5m = 0
-        
-        # Gamma score: volume (30%) + volatility (30%) + momentum (40%)
-        gamma_score = min(100, int((volume_ratio * 30 + volatility_ratio * 30 + abs(price_change_5m) * 10)))
-        
-        # EMA crossover detection (5m timeframe)
-        ema9_above_ema21 = ema9_5m > ema21_5m
-        golden_cross = False  # EMA 9 crossing above EMA 21
-        death_cross = False   # EMA 9 crossing below EMA 21
-        
-        if i >= 1:
-            prev_ema9_5m = float(indicators_5m['EMA_fast'].iloc[i-1])
-            prev_ema21_5m = float(indicators_5m['EMA_slow'].iloc[i-1])
-            prev_ema9_above = prev_ema9_5m > prev_ema21_5m
-            
-            # Golden cross: EMA9 crosses above EMA21
-            if not prev_ema9_above and ema9_above_ema21:
-                golden_cross = True
-            # Death cross: EMA9 crosses below EMA21
-            elif prev_ema9_above and not ema9_above_ema21:
-                death_cross = True
-        
-        # 15m data (trend context)
-        # Find 15m candle containing this timestamp
-        idx_15m_list = data_15m.index[data_15m.index <= timestamp_5m]
-        if len(idx_15m_list) == 0:
-            continue
-        idx_15m = idx_15m_list[-1]
-        
-        idx_15m_pos = data_15m.index.get_loc(idx_15m)
-        if isinstance(idx_15m_pos, slice):
-            idx_15m_pos = idx_15m_pos.start
-        close_15m = float(data_15m['Close'].iloc[idx_15m_pos])
-        vwap_15m = float(indicators_15m['VWAP'].iloc[idx_15m_pos])
-        macd_15m = float(indicators_15m['MACD'].iloc[idx_15m_pos])
-        macd_signal_15m = float(indicators_15m['MACD_signal'].iloc[idx_15m_pos])
-        macd_hist_15m = macd_15m - macd_signal_15m
-        
-        # 1m data (entry timing)
-        # Get recent 1m candles within this 5m period
-        mask_1m = (data_1m.index > timestamp_5m - pd.Timedelta(minutes=5)) & (data_1m.index <= timestamp_5m)
-        recent_1m = data_1m[mask_1m]
-        
-        if len(recent_1m) == 0:
+    Returns:
+        Tuple of (signal type per candle: SIGNAL_NONE/BUY/SELL, condition bitmask per candle)
+    """
+    n = close_5m.shape[0]
+    sig_type = np.zeros(n, dtype=np.int8)
+    cond_mask = np.zeros(n, dtype=np.int64)
+    
+    for i in range(20, n):
+        if not has_15m[i] or not has_1m[i]:
             continue
-            
-        # Latest 1m values
-        close_1m = float(recent_1m['Close'].iloc[-1])
-        volume_1m = float(recent_1m['Volume'].iloc[-1])
-        last_1m_idx = recent_1m.index[-1]
-        last_1m_pos = indicators_1m.index.get_loc(last_1m_idx)
-        if isinstance(last_1m_pos, slice):
-            last_1m_pos = last_1m_pos.start
-        vwap_1m = float(indicators_1m['VWAP'].iloc[last_1m_pos])
-        rsi_1m = float(indicators_1m['RSI'].iloc[last_1m_pos])
-        
-        # 1m MACD histogram change
-        macd_1m_curr = float(indicators_1m['MACD'].iloc[last_1m_pos])
-        signal_1m_curr = float(indicators_1m['MACD_signal'].iloc[last_1m_pos])
-        hist_1m_curr = macd_1m_curr - signal_1m_curr
-        
-        hist_1m_prev = 0
-        if len(recent_1m) >= 2:
-            prev_1m_idx = recent_1m.index[-2]
-            prev_1m_pos = indicators_1m.index.get_loc(prev_1m_idx)
-            if isinstance(prev_1m_pos, slice):
-                prev_1m_pos = prev_1m_pos.start
-            macd_1m_prev = float(indicators_1m['MACD'].iloc[prev_1m_pos])
-            signal_1m_prev = float(indicators_1m['MACD_signal'].iloc[prev_1m_pos])
-            hist_1m_prev = macd_1m_prev - signal_1m_prev
-        
-        macd_increasing_1m = hist_1m_curr > hist_1m_prev
         
         # =================================================================
         # FILTERS - Skip if conditions not met (relaxed for more signals)
@@ -173,208 +205,374 @@ def generate_multi_timeframe_signals(
         
         # Filter 1: Volume Check (avoid extremely low-volume chop)
         # WHY: Low volume = no institutional participation (lowered to 50%)
-        avg_volume_5m = float(data_5m['Volume'].iloc[max(0, i-10):i].mean())
-        if volume_5m < avg_volume_5m * 0.5:  # Lowered from 0.7
+        if volume_5m[i] < avg_volume_5m[i] * 0.5:  # Lowered from 0.7
             continue  # Skip if volume < 50% of average
         
         # NO FILTER 2 - VWAP flatness was blocking too many signals
         
+        close = close_5m[i]
+        vwap = vwap_5m[i]
+        ema9 = ema9_5m[i]
+        hist = hist_5m[i]
+        prev_hist = prev_hist_5m[i]
+        close1 = close_1m[i]
+        vwap1 = vwap_1m[i]
+        rsi1 = rsi_1m[i]
+        hist1 = hist_1m[i]
+        macd_up_1m = macd_increasing_1m[i]
+        volume_confirmed = volume_1m[i] > avg_volume_1m[i] * 1.05  # Lowered from 1.2x to 1.05x
+        gamma_elevated = gamma_5m[i] >= 40
         
         # =================================================================
-        # BUY SIGNAL LOGIC - Must meet 4/7 conditions (lowered for sensitivity)
-        # OR strong MACD momentum shift
+        # BUY SIGNAL LOGIC - 3+ conditions OR strong MACD momentum shift
         # =================================================================
         
-        buy_conditions = []
-        
-        # CONDITION 1: 15m price above VWAP (bullish trend)
-        # WHY: Higher timeframe sets directional bias
-        if close_15m > vwap_15m:
-            buy_conditions.append("15m above VWAP")
-        
-        # CONDITION 2: 5m price above VWAP (bullish setup)
-        # WHY: Confirms we're in bullish price structure
-        if close_5m > vwap_5m:
-            buy_conditions.append("5m above VWAP")
-        
         # CONDITION 3: 1m pullback (entry timing)
         # WHY: Want to buy dips, not chase - pullback to VWAP or EMA
-        distance_to_vwap_1m = ((close_1m - vwap_1m) / vwap_1m) * 100
-        if 0 < distance_to_vwap_1m < 0.3:  # Within 0.3% above VWAP
-            buy_conditions.append("1m pullback to VWAP")
-        elif 0 < (close_1m - ema9_5m) / ema9_5m * 100 < 0.2:  # Near EMA9
-            buy_conditions.append("1m near EMA9")
-        
-        # CONDITION 4: RSI rising through 35-60 (momentum building)
-        # WHY: NOT overbought/oversold, but momentum direction (widened range)
-        if 35 <= rsi_1m <= 60 and rsi_1m > rsi_5m - 5:  # 1m RSI rising toward 5m
-            buy_conditions.append("RSI rising 35-60")
-        
-        # CONDITION 5: MACD histogram increasing on 1m (momentum shift)
-        # WHY: Shows buying pressure building, NOT just crossover
-        if macd_increasing_1m and hist_1m_curr > 0:
-            buy_conditions.append("MACD increasing")
+        distance_to_vwap_1m = ((close1 - vwap1) / vwap1) * 100
+        pullback_vwap = 0 < distance_to_vwap_1m < 0.3  # Within 0.3% above VWAP
+        near_ema9 = not pullback_vwap and 0 < (close1 - ema9) / ema9 * 100 < 0.2  # Near EMA9
         
-        # CONDITION 6: Volume confirmation
-        # WHY: Institutions move with volume (lowered threshold)
-        avg_volume_1m = float(recent_1m['Volume'].iloc[:-1].mean()) if len(recent_1m) > 1 else volume_1m
-        if volume_1m > avg_volume_1m * 1.05:  # Lowered from 1.2x to 1.05x
-            buy_conditions.append("Volume above average")
-        
-        # CONDITION 7: 15m MACD positive (trend confirmation)
-        # WHY: Higher timeframe trend must support the trade
-        if macd_hist_15m > 0:
-            buy_conditions.append("15m MACD positive")
-        
-        # CONDITION 8: Gamma score elevated (>40)
-        # WHY: High gamma indicates explosive potential, institutional activity
-        if gamma_score >= 40:
-            buy_conditions.append(f"Gamma elevated ({gamma_score}%)")
-        
-        # STRONG MOMENTUM OVERRIDES catch clear trend changes
         # Override 1: Golden Cross (EMA9 crosses above EMA21)
-        # WHY: Classic bullish signal - catches uptrend starts
         # RESTRICTION: Must have positive MACD and price above VWAP (prevents false signals in downtrends)
-        if golden_cross and macd_hist_5m > 0 and close_5m > vwap_5m:
-            buy_conditions.append("STRONG: Golden Cross (EMA9 > EMA21)")
+        golden_override = golden_cross[i] and hist > 0 and close > vwap
         
         # Override 2: MACD histogram crossing zero upward on 5m
-        # This catches clear reversals like 11:30 AM bounce
-        strong_macd_reversal = False
-        if i >= 1:
-            prev_hist_5m = float(indicators_5m['MACD'].iloc[i-1]) - float(indicators_5m['MACD_signal'].iloc[i-1])
-            curr_hist_5m = macd_hist_5m
-            # Crossover from negative to positive OR strong increase in positive territory
-            if (prev_hist_5m < 0 and curr_hist_5m > 0) or (prev_hist_5m > 0 and curr_hist_5m > prev_hist_5m * 1.5):
-                strong_macd_reversal = True
-                buy_conditions.append("STRONG: 5m MACD bullish shift")
+        # Crossover from negative to positive OR strong increase in positive territory
+        strong_macd_reversal = (prev_hist < 0 and hist > 0) or (prev_hist > 0 and hist > prev_hist * 1.5)
+        
+        buy_mask, buy_count = _pack_conditions((
+            close_15m[i] > vwap_15m[i],                  # 1: 15m above VWAP (bullish trend)
+            close > vwap,                                # 2: 5m above VWAP (bullish setup)
+            pullback_vwap,                               # 3: 1m pullback to VWAP
+            near_ema9,                                   # 3: ... or near EMA9
+            35 <= rsi1 <= 60 and rsi1 > rsi_5m[i] - 5,   # 4: 1m RSI rising toward 5m
+            macd_up_1m and hist1 > 0,                    # 5: MACD histogram increasing on 1m
+            volume_confirmed,                            # 6: Volume confirmation
+            hist_15m[i] > 0,                             # 7: 15m MACD positive
+            gamma_elevated,                              # 8: Gamma score elevated
+            golden_override,
+            strong_macd_reversal,
+        ))
         
-        # Generate BUY signal if 3+ conditions met OR any strong override
         # RESISTANCE CHECK: Only block buys at tops when MACD also shows weakness
         # WHY: Prevents buying like the 2:10 PM top before selloff
         # Only triggers when near high AND MACD losing momentum
-        at_resistance = False
-        if i >= 20:
-            recent_high = float(data_5m['High'].iloc[max(0, i-20):i].max())
-            distance_from_high = ((recent_high - close_5m) / close_5m) * 100
-            macd_declining = macd_hist_5m < 0.05  # MACD histogram losing strength
-            if distance_from_high < 0.3 and macd_declining:  # Near high AND weak MACD
-                at_resistance = True
+        distance_from_high = ((recent_high_5m[i] - close) / close) * 100
+        macd_declining = hist < 0.05  # MACD histogram losing strength
+        at_resistance = distance_from_high < 0.3 and macd_declining  # Near high AND weak MACD
         
         # CRITICAL: BUY only if price above VWAP (trend alignment) AND not at resistance
-        price_above_vwap = close_5m > vwap_5m
-        trigger_buy = (len(buy_conditions) >= 3 or strong_macd_reversal or (golden_cross and macd_hist_5m > 0 and close_5m > vwap_5m))
-        
-        if trigger_buy and price_above_vwap and not at_resistance:
-            signals.append({
-                'timestamp': timestamp_5m,
-                'price': close_5m,
-                'type': 'buy',
-                'strength': len(buy_conditions) * 12,  # 8 conditions max = 96%
-                'conditions_met': len(buy_conditions),
-                'conditions': buy_conditions,
-                'label': f"BUY ({len(buy_conditions)}/8 conditions) [γ={gamma_score}]"
-            })
+        trigger_buy = buy_count >= 3 or strong_macd_reversal or golden_override
+        if trigger_buy and close > vwap and not at_resistance:
+            sig_type[i] = SIGNAL_BUY
+            cond_mask[i] = buy_mask
             continue  # Don't check sell if buy triggered
         
         # =================================================================
-        # SELL SIGNAL LOGIC - Must meet 4/7 conditions (lowered for sensitivity)
-        # OR strong MACD bearish shift
+        # SELL SIGNAL LOGIC - 3+ conditions OR strong MACD bearish shift
         # =================================================================
         
-        sell_conditions = []
-        
-        # CONDITION 1: 15m price below VWAP (bearish trend)
-        if close_15m < vwap_15m:
-            sell_conditions.append("15m below VWAP")
-        
-        # CONDITION 2: 5m price below VWAP (bearish setup)
-        if close_5m < vwap_5m:
-            sell_conditions.append("5m below VWAP")
-        
         # CONDITION 3: Failed reclaim of VWAP (rejection)
         # WHY: Price tried to reclaim VWAP but failed - bearish
-        high_1m = float(recent_1m['High'].iloc[-1])
-        if close_1m < vwap_1m and high_1m > vwap_1m:
-            sell_conditions.append("Failed VWAP reclaim")
-        elif close_1m < ema9_5m and high_1m > ema9_5m:
-            sell_conditions.append("Failed EMA9 reclaim")
-        
-        # CONDITION 4: RSI falling through 65-40 (momentum fading)
-        # WHY: Momentum turning down (widened range)
-        if 40 <= rsi_1m <= 65 and rsi_1m < rsi_5m + 5:  # 1m RSI falling from 5m
-            sell_conditions.append("RSI falling 65-40")
-        
-        # CONDITION 5: MACD histogram decreasing on 1m (momentum shift down)
-        if not macd_increasing_1m and hist_1m_curr < 0:
-            sell_conditions.append("MACD decreasing")
-        
-        # CONDITION 6: Volume confirmation (lowered threshold)
-        if volume_1m > avg_volume_1m * 1.05:  # Lowered from 1.2x
-            sell_conditions.append("Volume above average")
-        
-        # CONDITION 7: 15m MACD negative (trend confirmation)
-        if macd_hist_15m < 0:
-            sell_conditions.append("15m MACD negative")
-        
-        # CONDITION 8: Gamma score elevated (>40)
-        # WHY: High gamma indicates explosive potential, institutional activity
-        if gamma_score >= 40:
-            sell_conditions.append(f"Gamma elevated ({gamma_score}%)")
+        high1 = high_1m[i]
+        failed_vwap = close1 < vwap1 and high1 > vwap1
+        failed_ema9 = not failed_vwap and close1 < ema9 and high1 > ema9
         
         # STRONG BEARISH OVERRIDE 1: Death Cross (EMA9 crosses below EMA21)
-        # WHY: Classic bearish signal - catches downtrend starts (like 2:15 PM death cross)
         # RESTRICTION: Must have negative MACD and price below VWAP (prevents false signals in uptrends)
-        if death_cross and macd_hist_5m < 0 and close_5m < vwap_5m:
-            sell_conditions.append("STRONG: Death Cross (EMA9 < EMA21)")
+        death_override = death_cross[i] and hist < 0 and close < vwap
         
         # STRONG BEARISH OVERRIDE 2: MACD histogram crossing zero downward on 5m
-        # This catches clear selloffs like 2:15 PM breakdown
-        strong_macd_breakdown = False
-        if i >= 1:
-            prev_hist_5m = float(indicators_5m['MACD'].iloc[i-1]) - float(indicators_5m['MACD_signal'].iloc[i-1])
-            curr_hist_5m = macd_hist_5m
-            # Crossover from positive to negative OR strong decrease in negative territory
-            if (prev_hist_5m > 0 and curr_hist_5m < 0) or (prev_hist_5m < 0 and curr_hist_5m < prev_hist_5m * 1.5):
-                strong_macd_breakdown = True
-                sell_conditions.append("STRONG: 5m MACD bearish shift")
+        # Crossover from positive to negative OR strong decrease in negative territory
+        strong_macd_breakdown = (prev_hist > 0 and hist < 0) or (prev_hist < 0 and hist < prev_hist * 1.5)
+        
+        sell_mask, sell_count = _pack_conditions((
+            close_15m[i] < vwap_15m[i],                  # 1: 15m below VWAP (bearish trend)
+            close < vwap,                                # 2: 5m below VWAP (bearish setup)
+            failed_vwap,                                 # 3: Failed VWAP reclaim
+            failed_ema9,                                 # 3: ... or failed EMA9 reclaim
+            40 <= rsi1 <= 65 and rsi1 < rsi_5m[i] + 5,   # 4: 1m RSI falling from 5m
+            not macd_up_1m and hist1 < 0,                # 5: MACD histogram decreasing on 1m
+            volume_confirmed,                            # 6: Volume confirmation
+            hist_15m[i] < 0,                             # 7: 15m MACD negative
+            gamma_elevated,                              # 8: Gamma score elevated
+            death_override,
+            strong_macd_breakdown,
+        ))
         
-        # Generate SELL signal if 3+ conditions met OR strong MACD/EMA shift
         # MANDATORY: Price must be below VWAP to prevent counter-trend signals
-        # CRITICAL: SELL only if price below VWAP (trend alignment)
-        price_below_vwap = close_5m < vwap_5m
-        trigger_sell = (len(sell_conditions) >= 3 or strong_macd_breakdown or (death_cross and macd_hist_5m < 0 and close_5m < vwap_5m))
+        trigger_sell = sell_count >= 3 or strong_macd_breakdown or death_override
+        if trigger_sell and close < vwap:
+            sig_type[i] = SIGNAL_SELL
+            cond_mask[i] = sell_mask
+    
+    return sig_type, cond_mask
+
+
+@njit(cache=True)
+def _cooldown_mask(ts_ns, conditions_met, cooldown_ns, strong_cooldown_ns, strong_conditions):
+    """
+    Greedy frequency limiting over time-ordered signals.
+    
+    Args:
+        ts_ns: Signal timestamps as int64 nanoseconds
+        conditions_met: Conditions met per signal
+        cooldown_ns: Minimum gap after the last accepted signal
+        strong_cooldown_ns: Shorter gap allowed for strong signals
+        strong_conditions: Conditions needed to count as strong
+    
+    Returns:
+        Boolean array marking the accepted signals
+    """
+    n = ts_ns.shape[0]
+    keep = np.zeros(n, dtype=np.bool_)
+    last = 0
+    for k in range(n):
+        gap = ts_ns[k] - last
+        # Allow signal if it's the first, 15+ minutes have passed,
+        # or it's STRONG (6-8/8 conditions) and 10+ minutes passed
+        if k == 0 or gap >= cooldown_ns or (
+                conditions_met[k] >= strong_conditions and gap >= strong_cooldown_ns):
+            keep[k] = True
+            last = ts_ns[k]
+    return keep
+
+
+def _scan_signals_vectorized(close_5m, vwap_5m, ema9_5m, rsi_5m, hist_5m, prev_hist_5m,
+                             volume_5m, avg_volume_5m, recent_high_5m, gamma_5m, golden_cross, death_cross,
+                             has_15m, close_15m, vwap_15m, hist_15m,
+                             has_1m, close_1m, high_1m, vwap_1m, rsi_1m, hist_1m, macd_increasing_1m,
+                             volume_1m, avg_volume_1m):
+    """
+    Same rules and outputs as _scan_signals_core, evaluated as whole-array numpy
+    comparisons (used when numba isn't installed).
+    
+    Returns:
+        Tuple of (signal type per candle: SIGNAL_NONE/BUY/SELL, condition bitmask per candle)
+    """
+    n = close_5m.shape[0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Filters: warm-up, a 15m/1m match, and the 50%-of-average volume check
+        valid = (np.arange(n) >= 20) & has_15m & has_1m & ~(volume_5m < avg_volume_5m * 0.5)
+        
+        above_vwap = close_5m > vwap_5m
+        below_vwap = close_5m < vwap_5m
+        volume_confirmed = volume_1m > avg_volume_1m * 1.05
+        gamma_elevated = gamma_5m >= 40
         
-        if trigger_sell and price_below_vwap:
-            signals.append({
-                'timestamp': timestamp_5m,
-                'price': close_5m,
-                'type': 'sell',
-                'strength': len(sell_conditions) * 12,  # 8 conditions max = 96%
-                'conditions_met': len(sell_conditions),
-                'conditions': sell_conditions,
-                'label': f"SELL ({len(sell_conditions)}/8 conditions) [γ={gamma_score}]"
-            })
+        distance_to_vwap_1m = ((close_1m - vwap_1m) / vwap_1m) * 100
+        pullback_vwap = (distance_to_vwap_1m > 0) & (distance_to_vwap_1m < 0.3)
+        distance_to_ema9_1m = (close_1m - ema9_5m) / ema9_5m * 100
+        near_ema9 = ~pullback_vwap & (distance_to_ema9_1m > 0) & (distance_to_ema9_1m < 0.2)
+        golden_override = golden_cross & (hist_5m > 0) & above_vwap
+        strong_macd_reversal = (((prev_hist_5m < 0) & (hist_5m > 0))
+                                | ((prev_hist_5m > 0) & (hist_5m > prev_hist_5m * 1.5)))
+        
+        failed_vwap = (close_1m < vwap_1m) & (high_1m > vwap_1m)
+        failed_ema9 = ~failed_vwap & (close_1m < ema9_5m) & (high_1m > ema9_5m)
+        death_override = death_cross & (hist_5m < 0) & below_vwap
+        strong_macd_breakdown = (((prev_hist_5m > 0) & (hist_5m < 0))
+                                 | ((prev_hist_5m < 0) & (hist_5m < prev_hist_5m * 1.5)))
+        
+        # One bit per condition, in label order
+        buy_mask = _pack_bits((
+            close_15m > vwap_15m, above_vwap, pullback_vwap, near_ema9,
+            (rsi_1m >= 35) & (rsi_1m <= 60) & (rsi_1m > rsi_5m - 5),
+            macd_increasing_1m & (hist_1m > 0), volume_confirmed, hist_15m > 0, gamma_elevated,
+            golden_override, strong_macd_reversal,
+        ))
+        sell_mask = _pack_bits((
+            close_15m < vwap_15m, below_vwap, failed_vwap, failed_ema9,
+            (rsi_1m >= 40) & (rsi_1m <= 65) & (rsi_1m < rsi_5m + 5),
+            ~macd_increasing_1m & (hist_1m < 0), volume_confirmed, hist_15m < 0, gamma_elevated,
+            death_override, strong_macd_breakdown,
+        ))
+        
+        distance_from_high = ((recent_high_5m - close_5m) / close_5m) * 100
+        at_resistance = (distance_from_high < 0.3) & (hist_5m < 0.05)
+    
+    buy = valid & ((_popcount(buy_mask) >= 3) | strong_macd_reversal | golden_override) & above_vwap & ~at_resistance
+    sell = valid & ~buy & ((_popcount(sell_mask) >= 3) | strong_macd_breakdown | death_override) & below_vwap
+    
+    sig_type = np.zeros(n, dtype=np.int8)
+    sig_type[buy] = SIGNAL_BUY
+    sig_type[sell] = SIGNAL_SELL
+    cond_mask = np.where(buy, buy_mask, np.where(sell, sell_mask, 0)).astype(np.int64)
+    return sig_type, cond_mask
+
+
+def _signal_frame(timestamps, price, type_code, cond_mask, gamma_score) -> pd.DataFrame:
+    """Assemble the signal DataFrame from per-signal columns."""
+    conditions_met = _popcount(cond_mask).astype(np.int64)
+    return pd.DataFrame({
+        'timestamp': timestamps,
+        'price': price,
+        'type_code': type_code.astype(np.int8),
+        'strength': conditions_met * 12,
+        'conditions_met': conditions_met,
+        'gamma': gamma_score,
+        'cond_bitmask': cond_mask.astype(np.uint16),
+    })
+
+
+def generate_multi_timeframe_signals(
+    data_1m: pd.DataFrame,
+    data_5m: pd.DataFrame,
+    data_15m: pd.DataFrame,
+    indicators_1m: pd.DataFrame,
+    indicators_5m: pd.DataFrame,
+    indicators_15m: pd.DataFrame
+) -> List[Dict]:
+    """
+    Generate buy/sell signals with multi-timeframe confirmation.
     
-    # Apply frequency limiting (15-minute cooldown)
-    filtered_signals = []
-    last_signal_time = None
+    Returns list of signals: [{timestamp, price, type, strength, conditions_met, label}]
+    """
+    frame = generate_multi_timeframe_signal_frame(
+        data_1m, data_5m, data_15m, indicators_1m, indicators_5m, indicators_15m
+    )
+    # tolist() converts each column to Python scalars in one call
+    return [
+        _signal_dict(*row) for row in zip(
+            frame['timestamp'], frame['price'].tolist(), frame['type_code'].tolist(),
+            frame['cond_bitmask'].tolist(), frame['gamma'].tolist()
+        )
+    ]
+
+
+def generate_multi_timeframe_signal_frame(
+    data_1m: pd.DataFrame,
+    data_5m: pd.DataFrame,
+    data_15m: pd.DataFrame,
+    indicators_1m: pd.DataFrame,
+    indicators_5m: pd.DataFrame,
+    indicators_15m: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Generate buy/sell signals with multi-timeframe confirmation, one row per signal.
     
-    for signal in signals:
-        if last_signal_time is None:
-            filtered_signals.append(signal)
-            last_signal_time = signal['timestamp']
+    Returns:
+        DataFrame with columns timestamp, price, type_code (SIGNAL_BUY/SIGNAL_SELL),
+        strength, conditions_met, gamma and cond_bitmask (bit k set when condition
+        k of _BUY_CONDITION_LABELS/_SELL_CONDITION_LABELS was met)
+    """
+    # Need minimum data (every candle needs a 15m and a 1m match)
+    if len(data_5m) < 20 or data_15m.empty or data_1m.empty:
+        empty = np.array([], dtype=np.int64)
+        return _signal_frame(data_5m.index[:0], np.array([], dtype=np.float64), empty, empty, empty)
+    
+    # Positional gathers below assume each indicator frame shares its data frame's index
+    indicators_1m = _aligned(indicators_1m, data_1m)
+    indicators_5m = _aligned(indicators_5m, data_5m)
+    indicators_15m = _aligned(indicators_15m, data_15m)
+    
+    # Per-candle 5m quantities, computed once for the whole series
+    close_5m_arr = data_5m['Close'].to_numpy(dtype=np.float64)
+    vwap_5m_arr = indicators_5m['VWAP'].to_numpy(dtype=np.float64)
+    ema9_5m_arr = indicators_5m['EMA_fast'].to_numpy(dtype=np.float64)
+    ema21_5m_arr = indicators_5m['EMA_slow'].to_numpy(dtype=np.float64)
+    rsi_5m_arr = indicators_5m['RSI'].to_numpy(dtype=np.float64)
+    macd_hist_5m_arr = (indicators_5m['MACD'] - indicators_5m['MACD_signal']).to_numpy(dtype=np.float64)
+    prev_hist_5m_arr = np.concatenate(([0.0], macd_hist_5m_arr[:-1]))
+    volume_5m_arr = data_5m['Volume'].to_numpy(dtype=np.float64)
+    
+    # Calculate Gamma Score (0-100) based on volume, volatility, and momentum
+    # WHY: High gamma indicates explosive move potential (like gamma squeezes)
+    # Rolling means are shifted one bar so each candle sees only the bars before it
+    with np.errstate(divide='ignore', invalid='ignore'):
+        recent_volume_5m = data_5m['Volume'].rolling(5, min_periods=1).mean().shift(1).to_numpy()
+        avg_volume_5m_calc = data_5m['Volume'].rolling(20, min_periods=1).mean().shift(1).to_numpy()
+        avg_volume_5m_arr = data_5m['Volume'].rolling(10, min_periods=1).mean().shift(1).to_numpy()  # volume filter
+        recent_high_5m_arr = data_5m['High'].rolling(20, min_periods=1).max().shift(1).to_numpy()  # resistance check
+        volume_ratio = np.where(avg_volume_5m_calc > 0, recent_volume_5m / avg_volume_5m_calc, 1.0)
+        
+        # Calculate volatility (ATR-based if available)
+        if 'ATR' in indicators_5m.columns:
+            current_atr = indicators_5m['ATR'].to_numpy(dtype=np.float64)
+            avg_atr = indicators_5m['ATR'].rolling(20, min_periods=1).mean().shift(1).to_numpy()
+            volatility_ratio = np.where(avg_atr > 0, current_atr / avg_atr, 1.0)
         else:
-            time_diff_minutes = (signal['timestamp'] - last_signal_time).total_seconds() / 60
-            
-            # Allow signal if:
-            # 1. 15+ minutes have passed, OR
-            # 2. Signal is STRONG (6-8/8 conditions) and 10+ minutes passed
-            if time_diff_minutes >= 15:
-                filtered_signals.append(signal)
-                last_signal_time = signal['timestamp']
-            elif signal['conditions_met'] >= 6 and time_diff_minutes >= 10:
-                filtered_signals.append(signal)
-                last_signal_time = signal['timestamp']
+            volatility_ratio = np.ones(len(data_5m))
+        
+        # Calculate price momentum over last 5 candles
+        price_change_5m = np.zeros(len(data_5m))
+        price_change_5m[5:] = ((close_5m_arr[5:] / close_5m_arr[:-5]) - 1) * 100
+    
+    # Gamma score: volume (30%) + volatility (30%) + momentum (40%)
+    gamma_raw = volume_ratio * 30 + volatility_ratio * 30 + np.abs(price_change_5m) * 10
+    gamma_score_arr = np.minimum(100, np.nan_to_num(gamma_raw)).astype(np.int64)
+    
+    # EMA crossover detection (5m timeframe)
+    # Golden cross: EMA9 crosses above EMA21; death cross: EMA9 crosses below EMA21
+    ema9_above_arr = ema9_5m_arr > ema21_5m_arr
+    prev_ema9_above_arr = np.concatenate(([False], ema9_above_arr[:-1]))
+    golden_cross_arr = ~prev_ema9_above_arr & ema9_above_arr
+    death_cross_arr = prev_ema9_above_arr & ~ema9_above_arr
+    
+    # Align every 5m candle with the 15m/1m candles at or before it in one pass:
+    # last 15m candle <= t, and the 1m candles in (t - 5min, t]
+    ts_5m_ns = _index_ns(data_5m.index)
+    ts_1m_ns = _index_ns(data_1m.index)
+    idx_15m_map = np.searchsorted(_index_ns(data_15m.index), ts_5m_ns, side='right') - 1
+    last_1m_map = np.searchsorted(ts_1m_ns, ts_5m_ns, side='right') - 1
+    first_1m_map = np.searchsorted(ts_1m_ns, ts_5m_ns - _FIVE_MIN_NS, side='right')
+    
+    # 1m window reductions from prefix sums: mean volume of the window's earlier candles
+    # (all but the last), NaN volumes skipped like Series.mean()
+    close_1m_arr = data_1m['Close'].to_numpy(dtype=np.float64)
+    high_1m_arr = data_1m['High'].to_numpy(dtype=np.float64)
+    volume_1m_arr = data_1m['Volume'].to_numpy(dtype=np.float64)
+    volume_1m_valid = ~np.isnan(volume_1m_arr)
+    cum_volume_1m = np.concatenate(([0.0], np.cumsum(np.where(volume_1m_valid, volume_1m_arr, 0.0))))
+    cum_count_1m = np.concatenate(([0], np.cumsum(volume_1m_valid)))
+    window_last = np.maximum(last_1m_map, 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg_prev_volume_1m_arr = ((cum_volume_1m[window_last] - cum_volume_1m[first_1m_map])
+                                  / (cum_count_1m[window_last] - cum_count_1m[first_1m_map]))
+    
+    # 15m context, gathered at each 5m candle's aligned 15m position
+    has_15m = idx_15m_map >= 0
+    pos_15m = np.maximum(idx_15m_map, 0)
+    close_15m_at = data_15m['Close'].to_numpy(dtype=np.float64)[pos_15m]
+    vwap_15m_at = indicators_15m['VWAP'].to_numpy(dtype=np.float64)[pos_15m]
+    hist_15m_at = (indicators_15m['MACD'] - indicators_15m['MACD_signal']).to_numpy(dtype=np.float64)[pos_15m]
+    
+    # 1m entry timing, gathered at the last (and second-to-last) 1m candle of each window
+    window_len_1m = last_1m_map - first_1m_map + 1
+    has_1m = window_len_1m > 0
+    prev_1m_last = np.maximum(window_last - 1, 0)
+    hist_1m_ind = (indicators_1m['MACD'] - indicators_1m['MACD_signal']).to_numpy(dtype=np.float64)
+    volume_1m_at = volume_1m_arr[window_last]
+    hist_1m_at = hist_1m_ind[window_last]
+    prev_hist_1m_at = np.where(window_len_1m >= 2, hist_1m_ind[prev_1m_last], 0.0)
+    macd_increasing_1m = hist_1m_at > prev_hist_1m_at
+    avg_volume_1m_at = np.where(window_len_1m > 1, avg_prev_volume_1m_arr, volume_1m_at)
+    
+    # Compiled per-candle loop with numba, whole-array numpy comparisons without it
+    scan = _scan_signals_core if NUMBA_AVAILABLE else _scan_signals_vectorized
+    sig_type, cond_mask = scan(
+        close_5m_arr, vwap_5m_arr, ema9_5m_arr, rsi_5m_arr, macd_hist_5m_arr, prev_hist_5m_arr,
+        volume_5m_arr, avg_volume_5m_arr, recent_high_5m_arr,
+        gamma_score_arr, golden_cross_arr, death_cross_arr,
+        has_15m, close_15m_at, vwap_15m_at, hist_15m_at,
+        has_1m, close_1m_arr[window_last], high_1m_arr[window_last],
+        indicators_1m['VWAP'].to_numpy(dtype=np.float64)[window_last],
+        indicators_1m['RSI'].to_numpy(dtype=np.float64)[window_last],
+        hist_1m_at, macd_increasing_1m,
+        volume_1m_at, avg_volume_1m_at
+    )
+    
+    # Apply frequency limiting (15-minute cooldown) on the fired candles' int64 timestamps
+    fired = np.flatnonzero(sig_type)
+    keep = _cooldown_mask(
+        ts_5m_ns[fired], _popcount(cond_mask[fired]),
+        SIGNAL_COOLDOWN_MINUTES * _MINUTE_NS, STRONG_SIGNAL_COOLDOWN_MINUTES * _MINUTE_NS,
+        STRONG_SIGNAL_CONDITIONS
+    )
+    fired = fired[keep]
     
-    return filtered_signals
+    return _signal_frame(
+        data_5m.index[fired], close_5m_arr[fired], sig_type[fired],
+        cond_mask[fired], gamma_score_arr[fired]
+    )
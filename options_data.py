@@ -7,21 +7,114 @@ Provides:
 - Strike-based support/resistance from actual open interest
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 import yfinance as yf
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
 
+# 1-year historical volatility per (ticker, day); it only changes once a day, so it is
+# shared across fetcher instances instead of refetching a year of history every refresh
+_HIST_VOL_CACHE: Dict[Tuple[str, date], float] = {}
+
+
 class OptionsDataFetcher:
     """Fetch and analyze real options chain data for SPY"""
     
-    def __init__(self, ticker: str = "SPY"):
+    def __init__(self, ticker: str = "SPY", cache_ttl: float = 30.0):
+        """
+        Args:
+            ticker: Underlying symbol
+            cache_ttl: Seconds to reuse fetched expirations, chains and history
+        """
         self.ticker = ticker
         self.stock = yf.Ticker(ticker)
+        self.cache_ttl = cache_ttl
+        self._expirations_cache: Optional[Tuple[float, Tuple[str, ...]]] = None
+        self._chain_cache: Dict[str, Tuple[float, Any]] = {}
+        self._history_cache: Dict[str, Tuple[float, pd.DataFrame]] = {}
+        self._chain_sums_cache: Dict[str, Tuple[Any, np.ndarray]] = {}
+    
+    def _is_fresh(self, cached: Optional[Tuple[float, Any]]) -> bool:
+        """True if a (fetched_at, value) cache entry is younger than cache_ttl."""
+        return cached is not None and time.time() - cached[0] < self.cache_ttl
+    
+    def _get_expirations(self) -> Tuple[str, ...]:
+        """Available expiration dates, fetched at most once per cache_ttl."""
+        cached = self._expirations_cache
+        if self._is_fresh(cached):
+            return cached[1]
+        expirations = tuple(self.stock.options or ())
+        self._expirations_cache = (time.time(), expirations)
+        return expirations
+    
+    def _get_chain(self, expiration: str):
+        """Option chain (calls/puts) for one expiration, fetched at most once per cache_ttl."""
+        cached = self._chain_cache.get(expiration)
+        if self._is_fresh(cached):
+            return cached[1]
+        chain = self.stock.option_chain(expiration)
+        self._chain_cache[expiration] = (time.time(), chain)
+        return chain
+    
+    def _get_chains(self, expirations) -> List[Any]:
+        """Option chains for several expirations; uncached ones are fetched concurrently."""
+        missing = [exp for exp in expirations if not self._is_fresh(self._chain_cache.get(exp))]
+        if len(missing) > 1:
+            # Network-bound, so threads overlap the round-trips
+            with ThreadPoolExecutor(max_workers=min(4, len(missing))) as pool:
+                list(pool.map(self._get_chain, missing))
+        return [self._get_chain(exp) for exp in expirations]
+    
+    def _get_hist_vol(self) -> Optional[float]:
+        """Annualized 1-year historical volatility, computed once per ticker per day.
+        
+        Returns:
+            Historical volatility, or None when no 1-year history is available
+        """
+        key = (self.ticker.upper(), date.today())
+        if key not in _HIST_VOL_CACHE:
+            hist_52w = self._get_history('1y')
+            if hist_52w.empty:
+                return None
+            close = hist_52w['Close'].to_numpy(dtype=np.float64)
+            returns = close[1:] / close[:-1] - 1
+            returns = returns[~np.isnan(returns)]
+            _HIST_VOL_CACHE[key] = float(returns.std(ddof=1) * np.sqrt(252))  # Annualized
+        return _HIST_VOL_CACHE[key]
+    
+    def _get_chain_sums(self, expiration: str) -> np.ndarray:
+        """Put volume, call volume, put OI and call OI summed over one chain (NaN skipped).
+        
+        Sums are kept until the chain itself is refetched, so the put/call ratio
+        and GEX share one pass over the nearest chain.
+        """
+        chain = self._get_chain(expiration)
+        cached = self._chain_sums_cache.get(expiration)
+        if cached is not None and cached[0] is chain:
+            return cached[1]
+        sums = np.array([
+            np.nansum(chain.puts['volume'].to_numpy(dtype=np.float64)),
+            np.nansum(chain.calls['volume'].to_numpy(dtype=np.float64)),
+            np.nansum(chain.puts['openInterest'].to_numpy(dtype=np.float64)),
+            np.nansum(chain.calls['openInterest'].to_numpy(dtype=np.float64)),
+        ])
+        self._chain_sums_cache[expiration] = (chain, sums)
+        return sums
+    
+    def _get_history(self, period: str) -> pd.DataFrame:
+        """Underlying price history for a period, fetched at most once per cache_ttl."""
+        cached = self._history_cache.get(period)
+        if self._is_fresh(cached):
+            return cached[1]
+        hist = self.stock.history(period=period)
+        self._history_cache[period] = (time.time(), hist)
+        return hist
         
     def get_options_walls(self, current_price: float, min_oi: int = 1000) -> List[Dict]:
         """Get support/resistance levels from actual options open interest.
@@ -35,13 +128,13 @@ class OptionsDataFetcher:
         """
         try:
             # Get nearest expiration (typically 0-7 DTE for max gamma)
-            expirations = self.stock.options
+            expirations = self._get_expirations()
             if not expirations or len(expirations) == 0:
                 return self._fallback_walls(current_price)
             
             # Use nearest expiration for highest gamma impact
             nearest_exp = expirations[0]
-            chain = self.stock.option_chain(nearest_exp)
+            chain = self._get_chain(nearest_exp)
             
             calls = chain.calls
             puts = chain.puts
@@ -53,37 +146,9 @@ class OptionsDataFetcher:
             
             walls = []
             
-            # Process calls (resistance above current price)
-            call_strikes = calls[
-                (calls['strike'] >= current_price) & 
-                (calls['strike'] <= upper_bound) &
-                (calls['openInterest'] >= min_oi)
-            ].sort_values('openInterest', ascending=False).head(3)
-            
-            for _, row in call_strikes.iterrows():
-                walls.append({
-                    'strike': float(row['strike']),
-                    'type': 'resistance',
-                    'strength': min(100, int((row['openInterest'] / 10000) * 100)),
-                    'open_interest': int(row['openInterest']),
-                    'volume': int(row['volume']) if pd.notna(row['volume']) else 0
-                })
-            
-            # Process puts (support below current price)
-            put_strikes = puts[
-                (puts['strike'] <= current_price) & 
-                (puts['strike'] >= lower_bound) &
-                (puts['openInterest'] >= min_oi)
-            ].sort_values('openInterest', ascending=False).head(3)
-            
-            for _, row in put_strikes.iterrows():
-                walls.append({
-                    'strike': float(row['strike']),
-                    'type': 'support',
-                    'strength': min(100, int((row['openInterest'] / 10000) * 100)),
-                    'open_interest': int(row['openInterest']),
-                    'volume': int(row['volume']) if pd.notna(row['volume']) else 0
-                })
+            # Calls above current price act as resistance, puts below as support
+            walls.extend(self._top_oi_strikes(calls, current_price, upper_bound, min_oi, 'resistance'))
+            walls.extend(self._top_oi_strikes(puts, lower_bound, current_price, min_oi, 'support'))
             
             # Sort by distance from current price
             walls.sort(key=lambda x: abs(x['strike'] - current_price))
@@ -94,44 +159,76 @@ class OptionsDataFetcher:
             print(f"Options walls error: {e}")
             return self._fallback_walls(current_price)
     
-    def get_iv_metrics(self) -> Dict:
+    @staticmethod
+    def _top_oi_strikes(options: pd.DataFrame, low: float, high: float,
+                        min_oi: int, wall_type: str, top_n: int = 3) -> List[Dict]:
+        """The top_n strikes in [low, high] by open interest, as wall dicts.
+        
+        Args:
+            options: Calls or puts table from an option chain
+            low: Lowest strike to consider
+            high: Highest strike to consider
+            min_oi: Minimum open interest to consider a strike significant
+            wall_type: 'resistance' or 'support'
+            top_n: Number of strikes to keep
+            
+        Returns:
+            List of dicts with strike, type, strength, open_interest, volume
+        """
+        strike = options['strike'].to_numpy(dtype=np.float64)
+        oi = options['openInterest'].to_numpy(dtype=np.float64)
+        volume = options['volume'].to_numpy(dtype=np.float64)
+        
+        candidates = np.flatnonzero((strike >= low) & (strike <= high) & (oi >= min_oi))
+        top = candidates[np.argsort(-oi[candidates], kind='stable')[:top_n]]
+        
+        return [{
+            'strike': k,
+            'type': wall_type,
+            'strength': min(100, int((o / 10000) * 100)),
+            'open_interest': int(o),
+            'volume': int(v) if v == v else 0  # NaN volume -> 0
+        } for k, o, v in zip(strike[top].tolist(), oi[top].tolist(), volume[top].tolist())]
+    
+    def get_iv_metrics(self, current_price: Optional[float] = None) -> Dict:
         """Calculate IV Rank and IV Percentile from options chain.
         
+        Args:
+            current_price: Current stock price (fetched from 1d history if omitted)
+            
         Returns:
             Dict with iv_rank, iv_percentile, current_iv, iv_high, iv_low
         """
         try:
-            expirations = self.stock.options
+            expirations = self._get_expirations()
             if not expirations or len(expirations) == 0:
                 return self._fallback_iv_metrics()
             
             # Get ATM implied volatility from nearest expiration
             nearest_exp = expirations[0]
-            chain = self.stock.option_chain(nearest_exp)
-            
-            # Get current stock price
-            hist = self.stock.history(period='1d')
-            if hist.empty:
+            chain = self._get_chain(nearest_exp)
+            
+            # Get current stock price unless the caller already has it
+            if current_price is None:
+                hist = self._get_history('1d')
+                if hist.empty:
+                    return self._fallback_iv_metrics()
+                current_price = float(hist['Close'].iloc[-1])
+            
+            # Find ATM option (closest to current price) with one argmin pass
+            strikes = chain.calls['strike'].to_numpy(dtype=np.float64)
+            if strikes.size == 0:
                 return self._fallback_iv_metrics()
             
-            current_price = float(hist['Close'].iloc[-1])
-            
-            # Find ATM option (closest to current price)
-            calls = chain.calls
-            atm_call = calls.iloc[(calls['strike'] - current_price).abs().argsort()[:1]]
-            
-            if atm_call.empty or pd.isna(atm_call['impliedVolatility'].iloc[0]):
+            atm_idx = np.nanargmin(np.abs(strikes - current_price))
+            current_iv = float(chain.calls['impliedVolatility'].to_numpy(dtype=np.float64)[atm_idx])
+            if np.isnan(current_iv):
                 return self._fallback_iv_metrics()
             
-            current_iv = float(atm_call['impliedVolatility'].iloc[0])
-            
             # Get historical volatility for comparison
             # Calculate IV rank using 52-week historical range
-            hist_52w = self.stock.history(period='1y')
-            if not hist_52w.empty:
-                returns = hist_52w['Close'].pct_change().dropna()
-                hist_vol = returns.std() * np.sqrt(252)  # Annualized
-                
+            hist_vol = self._get_hist_vol()
+            if hist_vol is not None:
                 # For IV rank, we need historical IV data
                 # As approximation, use historical volatility range
                 iv_high = hist_vol * 1.5  # Approximate high IV
@@ -173,32 +270,14 @@ class OptionsDataFetcher:
             Dict with volume_pcr, oi_pcr, sentiment
         """
         try:
-            expirations = self.stock.options
+            expirations = self._get_expirations()
             if not expirations or len(expirations) < 2:
                 return {'volume_pcr': 1.0, 'oi_pcr': 1.0, 'sentiment': 'neutral'}
             
             # Use first 2 expirations for broader picture
-            total_put_volume = 0
-            total_call_volume = 0
-            total_put_oi = 0
-            total_call_oi = 0
-            
-            for exp in expirations[:2]:
-                chain = self.stock.option_chain(exp)
-                
-                put_vol = chain.puts['volume'].sum()
-                call_vol = chain.calls['volume'].sum()
-                put_oi = chain.puts['openInterest'].sum()
-                call_oi = chain.calls['openInterest'].sum()
-                
-                if pd.notna(put_vol):
-                    total_put_volume += put_vol
-                if pd.notna(call_vol):
-                    total_call_volume += call_vol
-                if pd.notna(put_oi):
-                    total_put_oi += put_oi
-                if pd.notna(call_oi):
-                    total_call_oi += call_oi
+            self._get_chains(expirations[:2])  # fetch both concurrently if needed
+            totals = np.sum([self._get_chain_sums(exp) for exp in expirations[:2]], axis=0)
+            total_put_volume, total_call_volume, total_put_oi, total_call_oi = totals.tolist()
             
             volume_pcr = total_put_volume / total_call_volume if total_call_volume > 0 else 1.0
             oi_pcr = total_put_oi / total_call_oi if total_call_oi > 0 else 1.0
@@ -231,18 +310,16 @@ class OptionsDataFetcher:
             Dict with total_gamma, net_gamma_exposure, gex_level
         """
         try:
-            expirations = self.stock.options
+            expirations = self._get_expirations()
             if not expirations:
                 return {'total_gamma': 0, 'net_gex': 0, 'gex_level': 'low'}
             
             # Focus on nearest expiration for max gamma impact
             nearest_exp = expirations[0]
-            chain = self.stock.option_chain(nearest_exp)
             
             # Simplified GEX calculation
             # Dealers are short gamma when price is below call walls, long gamma above put walls
-            call_gamma = chain.calls['openInterest'].sum()
-            put_gamma = chain.puts['openInterest'].sum()
+            put_gamma, call_gamma = self._get_chain_sums(nearest_exp)[2:].tolist()
             
             total_gamma = call_gamma + put_gamma
             
@@ -303,8 +380,8 @@ if __name__ == '__main__':
     
     fetcher = OptionsDataFetcher("SPY")
     
-    # Get current price
-    hist = yf.Ticker("SPY").history(period='1d')
+    # Get current price (shared with the metrics below through the fetcher's history cache)
+    hist = fetcher._get_history('1d')
     current_price = float(hist['Close'].iloc[-1])
     print(f"\nCurrent SPY Price: ${current_price:.2f}")
     
@@ -317,7 +394,7 @@ if __name__ == '__main__':
     
     print("\n2. IV Metrics:")
     print("-" * 60)
-    iv = fetcher.get_iv_metrics()
+    iv = fetcher.get_iv_metrics(current_price)
     print(f"  Current IV:     {iv['current_iv']}%")
     print(f"  IV Rank:        {iv['iv_rank']}")
     print(f"  IV Percentile:  {iv['iv_percentile']}")
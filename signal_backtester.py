@@ -3,7 +3,101 @@ Signal Backtester - Analyzes signal performance and suggests improvements
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, List, Sequence, Tuple
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import bottleneck as bn
+    BOTTLENECK_AVAILABLE = True
+except ImportError:
+    BOTTLENECK_AVAILABLE = False
+
+
+def _locate_signals(index: pd.Index, timestamps: List) -> Tuple[Sequence[pd.Timestamp], np.ndarray]:
+    """
+    Parse signal timestamps in one batch and find their positions in index.
+    
+    Returns:
+        Tuple of (parsed timestamps, position of each in index or -1 where missing)
+    """
+    try:
+        times = pd.to_datetime(timestamps, cache=True)
+        # list() boxes all Timestamps in one go; per-item DatetimeIndex access is slower
+        return list(times), index.get_indexer(times)
+    except (TypeError, ValueError):
+        # Mixed time zones can't share one DatetimeIndex; parse and look them up one by one
+        times = [pd.Timestamp(timestamp) for timestamp in timestamps]
+        positions = np.full(len(times), -1, dtype=np.int64)
+        for i, timestamp in enumerate(times):
+            try:
+                positions[i] = index.get_loc(timestamp)
+            except KeyError:
+                pass
+        return times, positions
+
+
+def _eval_windows(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
+                  sig_idx: np.ndarray, sig_price: np.ndarray, sig_is_buy: np.ndarray,
+                  lookforward: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Forward-window performance of each signal over candles [idx, idx + lookforward].
+    
+    Returns:
+        Tuple of (final pnl, max gain, max loss) arrays, one value per signal
+    """
+    future_idx = np.minimum(sig_idx + lookforward, len(closes) - 1)
+    if BOTTLENECK_AVAILABLE and len(sig_idx):
+        # Forward max/min = trailing move_max/move_min over the reversed arrays, O(n);
+        # min_count=1 skips NaN and cuts windows short near the end
+        window = min(lookforward + 1, len(highs))
+        window_high = bn.move_max(highs[::-1], window, min_count=1)[::-1][sig_idx]
+        window_low = bn.move_min(lows[::-1], window, min_count=1)[::-1][sig_idx]
+    else:
+        # Forward windows as strided views over NaN-padded arrays (windows near the end
+        # are cut short); fmax/fmin skip NaN like Series.max()/min()
+        pad = np.full(lookforward, np.nan)
+        window_high = np.fmax.reduce(sliding_window_view(np.concatenate((highs, pad)), lookforward + 1)[sig_idx], axis=1)
+        window_low = np.fmin.reduce(sliding_window_view(np.concatenate((lows, pad)), lookforward + 1)[sig_idx], axis=1)
+    final_price = closes[future_idx]
+    pnl = np.where(sig_is_buy, final_price - sig_price, sig_price - final_price)
+    return pnl, window_high - sig_price, sig_price - window_low
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _eval_windows_nb(highs, lows, closes, sig_idx, sig_price, sig_is_buy, lookforward):
+        """Compiled _eval_windows: one pass over each signal's window, NaN skipped."""
+        m = sig_idx.shape[0]
+        last_idx = closes.shape[0] - 1
+        pnl = np.empty(m)
+        max_gain = np.empty(m)
+        max_loss = np.empty(m)
+        for k in range(m):
+            start = sig_idx[k]
+            end = min(start + lookforward, last_idx)
+            window_high = np.nan
+            window_low = np.nan
+            for j in range(start, end + 1):
+                if not (highs[j] <= window_high):  # first non-NaN value or a new high
+                    if not np.isnan(highs[j]):
+                        window_high = highs[j]
+                if not (lows[j] >= window_low):
+                    if not np.isnan(lows[j]):
+                        window_low = lows[j]
+            price = sig_price[k]
+            if sig_is_buy[k]:
+                pnl[k] = closes[end] - price
+            else:
+                pnl[k] = price - closes[end]
+            max_gain[k] = window_high - price
+            max_loss[k] = price - window_low
+        return pnl, max_gain, max_loss
 
 
 class SignalBacktester:
@@ -40,73 +134,59 @@ class SignalBacktester:
         if not signals:
             return results
         
-        for signal in signals:
-            signal_time = pd.Timestamp(signal['timestamp'])
-            signal_price = signal['price']
-            signal_type = signal['type']
-            
-            # Find signal in data
-            try:
-                signal_idx = data.index.get_loc(signal_time)
-            except KeyError:
-                # Signal timestamp not in data, skip
-                continue
-            
-            # Look forward to see if signal was profitable
-            future_idx = min(signal_idx + self.lookforward_candles, len(data) - 1)
-            future_prices = data.iloc[signal_idx:future_idx + 1]
-            
-            if len(future_prices) < 2:
-                continue
-            
-            # Calculate performance
-            max_gain = future_prices['High'].max() - signal_price
-            max_loss = signal_price - future_prices['Low'].min()
-            final_price = future_prices.iloc[-1]['Close']
-            final_pnl = final_price - signal_price if signal_type == 'buy' else signal_price - final_price
-            
-            # Determine if profitable
-            is_profitable = final_pnl > 0
-            
-            # Track results
-            if signal_type == 'buy':
-                results['buy_signals'] += 1
-                if is_profitable:
-                    results['profitable_buys'] += 1
-                else:
-                    results['losing_buys'] += 1
-                    results['failed_signal_patterns'].append({
-                        'timestamp': str(signal_time),
-                        'type': 'buy',
-                        'price': signal_price,
-                        'pnl': final_pnl,
-                        'strength': signal.get('strength', 0),
-                        'label': signal.get('label', '')
-                    })
-            else:
-                results['sell_signals'] += 1
-                if is_profitable:
-                    results['profitable_sells'] += 1
-                else:
-                    results['losing_sells'] += 1
-                    results['failed_signal_patterns'].append({
-                        'timestamp': str(signal_time),
-                        'type': 'sell',
-                        'price': signal_price,
-                        'pnl': final_pnl,
-                        'strength': signal.get('strength', 0),
-                        'label': signal.get('label', '')
-                    })
-            
+        # Locate every signal in data with one index join instead of a get_loc per signal
+        signal_times, signal_positions = _locate_signals(data.index, [signal['timestamp'] for signal in signals])
+        
+        # Skip signals missing from data and signals on the last candle (nothing to look forward to)
+        future_positions = np.minimum(signal_positions + self.lookforward_candles, len(data) - 1)
+        evaluated = (signal_positions >= 0) & (future_positions > signal_positions)
+        evaluated_idx = np.flatnonzero(evaluated)
+        
+        # Forward-window stats for all evaluated signals in one call
+        is_buy = np.array([signals[i]['type'] == 'buy' for i in evaluated_idx.tolist()], dtype=np.bool_)
+        eval_windows = _eval_windows_nb if NUMBA_AVAILABLE else _eval_windows
+        pnls, max_gains, max_losses = eval_windows(
+            data['High'].to_numpy(dtype=np.float64),
+            data['Low'].to_numpy(dtype=np.float64),
+            data['Close'].to_numpy(dtype=np.float64),
+            signal_positions[evaluated_idx],
+            np.array([signals[i]['price'] for i in evaluated_idx.tolist()], dtype=np.float64),
+            is_buy,
+            self.lookforward_candles
+        )
+        profitable = pnls > 0
+        
+        # Track results: counts straight from the arrays
+        results['buy_signals'] = int(is_buy.sum())
+        results['sell_signals'] = len(is_buy) - results['buy_signals']
+        results['profitable_buys'] = int((is_buy & profitable).sum())
+        results['profitable_sells'] = int((~is_buy & profitable).sum())
+        results['losing_buys'] = results['buy_signals'] - results['profitable_buys']
+        results['losing_sells'] = results['sell_signals'] - results['profitable_sells']
+        
+        # Failure records only for the losing signals
+        for k in np.flatnonzero(~profitable).tolist():
+            signal = signals[evaluated_idx[k]]
+            results['failed_signal_patterns'].append({
+                'timestamp': str(signal_times[evaluated_idx[k]]),
+                'type': 'buy' if is_buy[k] else 'sell',
+                'price': signal['price'],
+                'pnl': pnls[k],
+                'strength': signal.get('strength', 0),
+                'label': signal.get('label', '')
+            })
+        
+        for k, i in enumerate(evaluated_idx.tolist()):
+            signal = signals[i]
             results['signal_details'].append({
-                'timestamp': str(signal_time),
-                'type': signal_type,
-                'price': signal_price,
+                'timestamp': str(signal_times[i]),
+                'type': signal['type'],
+                'price': signal['price'],
                 'strength': signal.get('strength', 0),
-                'profitable': is_profitable,
-                'pnl': final_pnl,
-                'max_gain': max_gain,
-                'max_loss': max_loss
+                'profitable': profitable[k],
+                'pnl': pnls[k],
+                'max_gain': max_gains[k],
+                'max_loss': max_losses[k]
             })
         
         # Calculate accuracy
@@ -121,7 +201,7 @@ class SignalBacktester:
         
         return results
     
-    def analyze_failed_signals(self, results: Dict, data: pd.DataFrame, indicators: pd.DataFrame) -> List[str]:
+    def analyze_failed_signals(self, results: Dict) -> List[str]:
         """
         Analyze failed signals to identify common patterns.
         
@@ -136,12 +216,26 @@ class SignalBacktester:
         
         failed = results['failed_signal_patterns']
         
-        # Analyze by signal strength
-        weak_failures = [s for s in failed if s['strength'] < 50]
-        strong_failures = [s for s in failed if s['strength'] >= 70]
+        # Tally failure patterns in one pass: strength buckets and label tags
+        weak_failures = 0
+        strong_failures = []
+        counter_trend_failures = 0
+        risky_failures = 0
+        for s in failed:
+            strength = s['strength']
+            label = s.get('label', '')
+            if strength < 50:
+                weak_failures += 1
+            elif strength >= 70:
+                strong_failures.append(s)
+            if 'COUNTER-TREND' in label:
+                counter_trend_failures += 1
+            if 'RISKY' in label:
+                risky_failures += 1
         
-        if len(weak_failures) > len(failed) * 0.5:
-            suggestions.append(f"⚠️ {len(weak_failures)}/{len(failed)} failed signals were WEAK (<50%). Consider raising minimum threshold to 45-50%.")
+        # Analyze by signal strength
+        if weak_failures > len(failed) * 0.5:
+            suggestions.append(f"⚠️ {weak_failures}/{len(failed)} failed signals were WEAK (<50%). Consider raising minimum threshold to 45-50%.")
         
         if strong_failures:
             suggestions.append(f"⚠️ {len(strong_failures)} STRONG signals (>70%) failed. These need investigation:")
@@ -149,13 +243,10 @@ class SignalBacktester:
                 suggestions.append(f"   - {sig['type'].upper()} at ${sig['price']:.2f} ({sig['label']}) → Lost ${abs(sig['pnl']):.2f}")
         
         # Analyze counter-trend vs trend-following
-        counter_trend_failures = [s for s in failed if 'COUNTER-TREND' in s.get('label', '')]
-        risky_failures = [s for s in failed if 'RISKY' in s.get('label', '')]
-        
-        if len(counter_trend_failures) > len(failed) * 0.4:
-            suggestions.append(f"⚠️ Counter-trend signals have {len(counter_trend_failures)}/{len(failed)} failures. Consider reducing RSI reversal weight.")
+        if counter_trend_failures > len(failed) * 0.4:
+            suggestions.append(f"⚠️ Counter-trend signals have {counter_trend_failures}/{len(failed)} failures. Consider reducing RSI reversal weight.")
         
-        if len(risky_failures) > len(failed) * 0.3:
+        if risky_failures > len(failed) * 0.3:
             suggestions.append(f"⚠️ RISKY signals (against RSI) failing frequently. Consider blocking signals against extreme RSI.")
         
         # Accuracy-based suggestions
@@ -173,11 +264,11 @@ class SignalBacktester:
         
         return suggestions
     
-    def generate_report(self, data: pd.DataFrame, indicators: pd.DataFrame, signals: List[Dict]) -> str:
+    def generate_report(self, data: pd.DataFrame, signals: List[Dict]) -> str:
         """Generate a comprehensive backtest report"""
         
         results = self.evaluate_signals(data, signals)
-        suggestions = self.analyze_failed_signals(results, data, indicators)
+        suggestions = self.analyze_failed_signals(results)
         
         report = []
         report.append("=" * 70)
@@ -7,13 +7,33 @@ confirmation with VWAP, EMA crossovers, and MACD momentum.
 
 This file remains for backward compatibility with test files.
 """
+import math
+import numpy as np
 import pandas as pd
+from collections import Counter
 from typing import Dict, Any, List
 from datetime import datetime
-from bias_classifier import BiasClassifier, MarketBias
+from bias_classifier import BIAS_COLUMNS, BiasClassifier, MarketBias
 from indicators import detect_volatility_regime
 
 
+# Bias strings compared in the synthesis hot path, bound once instead of per Enum lookup
+_BULLISH = MarketBias.BULLISH.value
+_BEARISH = MarketBias.BEARISH.value
+_NEUTRAL = MarketBias.NEUTRAL.value
+
+# (output key, indicator column, decimals) reported with every signal after "close"
+_INDICATOR_SPECS = (
+    ("ema_9", "EMA_fast", 2),
+    ("ema_21", "EMA_slow", 2),
+    ("rsi", "RSI", 1),
+    ("atr", "ATR", 2),
+    ("vwap", "VWAP", 2),
+)
+# Every column generate_signal reads the latest value of
+_SIGNAL_COLUMNS = tuple(dict.fromkeys(BIAS_COLUMNS + tuple(column for _, column, _ in _INDICATOR_SPECS)))
+
+
 class SignalGenerator:
     """
     Generates structured trading signals based on technical analysis.
@@ -45,17 +65,25 @@ class SignalGenerator:
         Returns:
             Dictionary containing structured signal information
         """
-        # Get the latest data point
-        latest = df.iloc[-1]
+        # Latest values are read straight from the column arrays, no pandas row is built
+        cols = {column: df[column].to_numpy(dtype=np.float64, copy=False) for column in _SIGNAL_COLUMNS}
         
         # Classify bias
-        bias, confidence, notes = self.classifier.classify_bias(latest)
+        bias, confidence, notes = self.classifier.classify_last(cols)
         
         # Detect volatility regime
-        volatility_regime = detect_volatility_regime(df['ATR'])
+        volatility_regime = detect_volatility_regime(cols['ATR'])
         
         # Get current timestamp
-        timestamp = latest.name if hasattr(latest.name, 'strftime') else datetime.now()
+        timestamp = df.index[-1]
+        if not hasattr(timestamp, 'strftime'):
+            timestamp = datetime.now()
+        
+        # Latest indicator values (None where not yet available)
+        indicators = {"close": round(float(cols['Close'][-1]), 2)}
+        for key, column, ndigits in _INDICATOR_SPECS:
+            value = float(cols[column][-1])
+            indicators[key] = None if math.isnan(value) else round(value, ndigits)
         
         # Build the signal dictionary
         signal = {
@@ -66,14 +94,7 @@ class SignalGenerator:
             "confidence": round(confidence, 3),
             "confidence_label": self.classifier.get_bias_strength_label(confidence),
             "volatility_regime": volatility_regime,
-            "indicators": {
-                "close": round(latest['Close'], 2),
-                "ema_9": round(latest['EMA_fast'], 2) if pd.notna(latest['EMA_fast']) else None,
-                "ema_21": round(latest['EMA_slow'], 2) if pd.notna(latest['EMA_slow']) else None,
-                "rsi": round(latest['RSI'], 1) if pd.notna(latest['RSI']) else None,
-                "atr": round(latest['ATR'], 2) if pd.notna(latest['ATR']) else None,
-                "vwap": round(latest['VWAP'], 2) if pd.notna(latest['VWAP']) else None
-            },
+            "indicators": indicators,
             "analysis_notes": notes
         }
         
@@ -121,21 +142,25 @@ class SignalGenerator:
         Returns:
             Dictionary with synthesized analysis
         """
-        biases = [s['bias'] for s in signals.values()]
-        confidences = [s['confidence'] for s in signals.values()]
+        # Collect biases and confidences in one pass over the signals
+        biases, confidences = [], []
+        for s in signals.values():
+            biases.append(s['bias'])
+            confidences.append(s['confidence'])
         
         # Count bias alignment
-        bullish_count = sum(1 for b in biases if b == MarketBias.BULLISH.value)
-        bearish_count = sum(1 for b in biases if b == MarketBias.BEARISH.value)
-        neutral_count = sum(1 for b in biases if b == MarketBias.NEUTRAL.value)
+        bias_counts = Counter(biases)
+        bullish_count = bias_counts[_BULLISH]
+        bearish_count = bias_counts[_BEARISH]
+        neutral_count = bias_counts[_NEUTRAL]
         
         # Determine overall bias
         if bullish_count > bearish_count:
-            overall_bias = MarketBias.BULLISH.value
+            overall_bias = _BULLISH
         elif bearish_count > bullish_count:
-            overall_bias = MarketBias.BEARISH.value
+            overall_bias = _BEARISH
         else:
-            overall_bias = MarketBias.NEUTRAL.value
+            overall_bias = _NEUTRAL
         
         # Average confidence (weighted by alignment)
         avg_confidence = sum(confidences) / len(confidences) if confidences else 0
@@ -184,10 +209,11 @@ class SignalGenerator:
         
         # Get volatility regimes
         vol_regimes = [s['volatility_regime'] for s in signals.values()]
-        expansion_count = sum(1 for v in vol_regimes if v == "Expansion")
+        n_regimes = len(vol_regimes)
+        expansion_count = vol_regimes.count("Expansion")
         
         # Bias-based recommendations
-        if bias == MarketBias.BULLISH.value:
+        if bias == _BULLISH:
             if confidence >= 0.75 and alignment >= 0.8:
                 recommendations.append("Strong bullish setup - consider directional call options or bullish spreads")
             elif confidence >= 0.5:
@@ -195,7 +221,7 @@ class SignalGenerator:
             else:
                 recommendations.append("Weak bullish signal - consider waiting for stronger confirmation")
         
-        elif bias == MarketBias.BEARISH.value:
+        elif bias == _BEARISH:
             if confidence >= 0.75 and alignment >= 0.8:
                 recommendations.append("Strong bearish setup - consider directional put options or bearish spreads")
             elif confidence >= 0.5:
@@ -207,9 +233,9 @@ class SignalGenerator:
             recommendations.append("Neutral/mixed signals - theta strategies (iron condors, strangles) may be more appropriate")
         
         # Volatility-based recommendations
-        if expansion_count >= len(vol_regimes) * 0.7:
+        if expansion_count >= n_regimes * 0.7:
             recommendations.append("Volatility expanding - directional strategies may benefit from increased movement")
-        elif expansion_count <= len(vol_regimes) * 0.3:
+        elif expansion_count <= n_regimes * 0.3:
             recommendations.append("Volatility compressing - theta decay strategies may be favorable")
         
         # Alignment-based recommendations
@@ -8,33 +8,143 @@ from rich.panel import Panel
 from rich.layout import Layout
 from rich.table import Table
 from rich.text import Text
+from rich.markup import escape
 from rich.progress import Progress, BarColumn, TextColumn
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import os
 import time
 from typing import Optional
+import numpy as np
 import pandas as pd
 
 from market_copilot import MarketCopilot
 from market_hours import MarketHours
 
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit: the downsampler then runs as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Plain-ASCII panel symbols skip Rich's wide-character width handling on every render
+ASCII_MODE = os.environ.get('DASHBOARD_ASCII', '').lower() in ('1', 'true', 'yes')
+
+_EMOJI_SYMBOLS = {
+    "bull": "🚀", "bear": "📉", "flat": "➡️",
+    "bull_dot": "🟢", "bear_dot": "🔴", "flat_dot": "🟡",
+    "volatility": "⚡", "confidence": "📊", "alignment": "🎯", "ideas": "💡",
+}
+_ASCII_SYMBOLS = {
+    "bull": "^^", "bear": "vv", "flat": "<>",
+    "bull_dot": "+", "bear_dot": "-", "flat_dot": "=",
+    "volatility": "~", "confidence": "%", "alignment": ">", "ideas": "*",
+}
+
+# Markup for a value below/above its reference, indexed by int(diff > 0)
+_RED_GREEN = ("red", "green")
+_DOWN_UP = ("▼", "▲")
+
+# Chart canvas width in characters; braille rendering draws 2 points per character
+CHART_WIDTH = 80
+MAX_CHART_POINTS = 2 * CHART_WIDTH
+# Candles shown in the price chart: all of a 5d/5m fetch (~390 bars), which
+# _lttb thins to MAX_CHART_POINTS per line
+CHART_LOOKBACK = 400
+
+
+def _apply_chart_style():
+    """Set the chart styling that stays the same from frame to frame."""
+    plt.theme('dark')
+    plt.plotsize(CHART_WIDTH, 20)
+    plt.xlabel("← Older | Newer →")
+    plt.ylabel("Price ($)")
+
+
+def _clear_chart_data():
+    """Drop the plotted series but keep the figure (clear_data needs plotext 5+)."""
+    if hasattr(plt, "clear_data"):
+        plt.clear_data()
+    else:
+        plt.clear_figure()
+        _apply_chart_style()
+
+
+@njit(cache=True)
+def _lttb(xs, ys, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling of a line to n_out points.
+    
+    Keeps the first and last points and, from each bucket in between, the point
+    forming the largest triangle with the previously kept point and the next
+    bucket's average, so peaks and troughs survive.
+    
+    Returns:
+        Tuple of (x values, y values) of the kept points
+    """
+    n = xs.shape[0]
+    if n_out >= n or n_out < 3:
+        return xs.copy(), ys.copy()
+    
+    out_x = np.empty(n_out)
+    out_y = np.empty(n_out)
+    out_x[0] = xs[0]
+    out_y[0] = ys[0]
+    bucket = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * bucket) + 1
+        end = int((i + 1) * bucket) + 1
+        next_end = min(int((i + 2) * bucket) + 1, n)
+        
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(end, next_end):
+            avg_x += xs[j]
+            avg_y += ys[j]
+        avg_x /= next_end - end
+        avg_y /= next_end - end
+        
+        best = start
+        best_area = -1.0
+        for j in range(start, end):
+            area = abs((xs[a] - avg_x) * (ys[j] - ys[a]) - (xs[a] - xs[j]) * (avg_y - ys[a]))
+            if area > best_area:
+                best_area = area
+                best = j
+        out_x[i + 1] = xs[best]
+        out_y[i + 1] = ys[best]
+        a = best
+    
+    out_x[n_out - 1] = xs[n - 1]
+    out_y[n_out - 1] = ys[n - 1]
+    return out_x, out_y
+
 
 class TerminalDashboard:
     """
     Interactive terminal dashboard with charts and HUD display.
     """
     
-    def __init__(self):
+    def __init__(self, ascii_mode: bool = ASCII_MODE):
         self.console = Console()
+        self._symbols = _ASCII_SYMBOLS if ascii_mode else _EMOJI_SYMBOLS
         self.copilot = MarketCopilot()
         self.last_signal = None
         self.chart_data = {}  # Store DataFrames for chart generation
+        self._panel_cache = {}  # panel slot -> (inputs, renderable) from the last build
+        
+        _apply_chart_style()  # set once; each frame only swaps the plotted data
         
     def create_price_chart(self, signal: dict, timeframe: str) -> str:
         """
         Create an ASCII chart of price action in the terminal.
         """
-        plt.clear_figure()
-        plt.clf()
+        _clear_chart_data()
         
         # Get data from stored chart_data
         if timeframe not in self.chart_data:
@@ -43,42 +153,49 @@ class TerminalDashboard:
         df = self.chart_data[timeframe]
         
         # Get more data points for better visualization
-        lookback = min(100, len(df))
+        lookback = min(CHART_LOOKBACK, len(df))
         df = df.tail(lookback)
         
-        timestamps = list(range(len(df)))
-        closes = df['Close'].tolist()
-        
-        # Plot the line chart with braille for smooth lines
-        plt.plot(timestamps, closes, color="green+", label="Price")
-        
-        # Add EMAs if available
-        if 'EMA_fast' in df.columns:
-            ema9 = df['EMA_fast'].tolist()
-            plt.plot(timestamps, ema9, color="yellow+", label="EMA9")
-        
-        if 'EMA_slow' in df.columns:
-            ema21 = df['EMA_slow'].tolist()
-            plt.plot(timestamps, ema21, color="cyan+", label="EMA21")
+        # Plot each line with braille for smooth lines, downsampled to what the
+        # canvas can draw when there are more candles than braille columns
+        positions = np.arange(len(df), dtype=np.float64)
+        for column, color, label in (("Close", "green+", "Price"),
+                                     ("EMA_fast", "yellow+", "EMA9"),
+                                     ("EMA_slow", "cyan+", "EMA21")):
+            if column not in df.columns:
+                continue
+            xs, ys = _lttb(positions, df[column].to_numpy(dtype=np.float64), MAX_CHART_POINTS)
+            plt.plot(xs.tolist(), ys.tolist(), color=color, label=label)
         
         # Chart settings
         plt.title(f"SPY {timeframe.upper()} - Last {lookback} Candles")
-        plt.xlabel("← Older | Newer →")
-        plt.ylabel("Price ($)")
-        plt.theme('dark')
-        
-        # Set canvas size for better rendering
-        plt.plotsize(80, 20)
         
         return plt.build()
     
+    def _cached_panel(self, slot: str, inputs: tuple, build):
+        """
+        Return the renderable last built for slot if its inputs are unchanged,
+        otherwise build and remember a new one (no-op refreshes reuse panels).
+        """
+        cached = self._panel_cache.get(slot)
+        if cached is not None and cached[0] == inputs:
+            return cached[1]
+        renderable = build()
+        self._panel_cache[slot] = (inputs, renderable)
+        return renderable
+    
     def create_indicator_panel(self, signal: dict, timeframe: str) -> Table:
         """
         Create a HUD-style panel showing indicators.
         """
-        tf_data = signal['timeframes'][timeframe]
-        indicators = tf_data['indicators']
-        
+        indicators = signal['timeframes'][timeframe]['indicators']
+        return self._cached_panel(
+            f"indicators_{timeframe}", tuple(indicators.items()),
+            lambda: self._build_indicator_panel(indicators)
+        )
+    
+    def _build_indicator_panel(self, indicators: dict) -> Table:
+        """Build the indicator table for one timeframe."""
         table = Table(show_header=False, box=None, padding=(0, 1))
         table.add_column("Indicator", style="bold cyan", width=8)
         table.add_column("Value", style="bold white", width=12)
@@ -108,31 +225,23 @@ class TerminalDashboard:
         
         # VWAP with difference
         vwap_diff = close - indicators['vwap']
-        vwap_color = "green" if vwap_diff > 0 else "red"
         vwap_pct = (vwap_diff / indicators['vwap']) * 100
+        up = int(vwap_diff > 0)
         table.add_row(
             "VWAP",
             f"{indicators['vwap']:.2f}",
-            f"[{vwap_color}]{'▲' if vwap_diff > 0 else '▼'} {abs(vwap_diff):.2f} ({vwap_pct:+.2f}%)[/]"
-        )
-        
-        # EMA 9
-        ema9_diff = close - ema9
-        ema9_color = "green" if ema9_diff > 0 else "red"
-        table.add_row(
-            "EMA 9",
-            f"{ema9:.2f}",
-            f"[{ema9_color}]{'▲' if ema9_diff > 0 else '▼'} {abs(ema9_diff):.2f}[/]"
+            f"[{_RED_GREEN[up]}]{_DOWN_UP[up]} {abs(vwap_diff):.2f} ({vwap_pct:+.2f}%)[/]"
         )
         
-        # EMA 21
-        ema21_diff = close - ema21
-        ema21_color = "green" if ema21_diff > 0 else "red"
-        table.add_row(
-            "EMA 21",
-            f"{ema21:.2f}",
-            f"[{ema21_color}]{'▲' if ema21_diff > 0 else '▼'} {abs(ema21_diff):.2f}[/]"
-        )
+        # EMA 9 and EMA 21
+        for label, ema in (("EMA 9", ema9), ("EMA 21", ema21)):
+            ema_diff = close - ema
+            up = int(ema_diff > 0)
+            table.add_row(
+                label,
+                f"{ema:.2f}",
+                f"[{_RED_GREEN[up]}]{_DOWN_UP[up]} {abs(ema_diff):.2f}[/]"
+            )
         
         # RSI with color coding and bar
         rsi = indicators['rsi']
@@ -181,6 +290,13 @@ class TerminalDashboard:
         Create a panel showing bias and confidence.
         """
         tf_data = signal['timeframes'][timeframe]
+        return self._cached_panel(
+            f"bias_{timeframe}", (tf_data['bias'], tf_data['confidence'], tf_data['volatility_regime']),
+            lambda: self._build_bias_panel(tf_data, timeframe)
+        )
+    
+    def _build_bias_panel(self, tf_data: dict, timeframe: str) -> Panel:
+        """Build the bias/confidence panel for one timeframe."""
         bias = tf_data['bias']
         confidence = tf_data['confidence']
         vol_regime = tf_data['volatility_regime']
@@ -188,13 +304,13 @@ class TerminalDashboard:
         # Color coding
         if bias == "Bullish":
             bias_color = "green bold"
-            bias_symbol = "🚀"
+            bias_symbol = self._symbols['bull']
         elif bias == "Bearish":
             bias_color = "red bold"
-            bias_symbol = "📉"
+            bias_symbol = self._symbols['bear']
         else:
             bias_color = "yellow bold"
-            bias_symbol = "➡️"
+            bias_symbol = self._symbols['flat']
         
         # Confidence bar
         conf_bar = self.create_bar(confidence, 0, 1, width=30)
@@ -203,14 +319,13 @@ class TerminalDashboard:
         # Volatility
         vol_color = "red" if vol_regime == "Expansion" else "blue" if vol_regime == "Compression" else "white"
         
-        content = Text()
-        content.append(f"\n{bias_symbol}  BIAS: ", style="bold white")
-        content.append(f"{bias}\n", style=bias_color)
-        content.append(f"   CONFIDENCE: ", style="bold white")
-        content.append(f"{confidence:.0%}\n", style=conf_color)
-        content.append(f"   [{conf_color}]{conf_bar}[/]\n\n", style=conf_color)
-        content.append(f"⚡ VOLATILITY: ", style="bold white")
-        content.append(f"{vol_regime}\n", style=vol_color)
+        markup = (
+            f"\n{bias_symbol}  [bold white]BIAS:[/] [{bias_color}]{bias}[/]\n"
+            f"   [bold white]CONFIDENCE:[/] [{conf_color}]{confidence:.0%}[/]\n"
+            f"   [{conf_color}]{conf_bar}[/]\n\n"
+            f"{self._symbols['volatility']} [bold white]VOLATILITY:[/] [{vol_color}]{vol_regime}[/]\n"
+        )
+        content = Text.from_markup(markup)
         
         return Panel(content, title=f"[bold white]{timeframe.upper()} ANALYSIS[/]", border_style=bias_color)
     
@@ -219,34 +334,36 @@ class TerminalDashboard:
         Create synthesis/recommendations panel.
         """
         synthesis = signal['synthesis']
-        
+        inputs = (synthesis['overall_bias'], synthesis['average_confidence'], synthesis['timeframe_alignment'],
+                  synthesis['alignment_strength'], tuple(synthesis['recommendations']))
+        return self._cached_panel("synthesis", inputs, lambda: self._build_synthesis_panel(synthesis))
+    
+    def _build_synthesis_panel(self, synthesis: dict) -> Panel:
+        """Build the synthesis/recommendations panel."""
         # Overall bias styling
         bias = synthesis['overall_bias']
         if bias == "Bullish":
             style = "green bold"
-            emoji = "🟢"
+            emoji = self._symbols['bull_dot']
         elif bias == "Bearish":
             style = "red bold"
-            emoji = "🔴"
+            emoji = self._symbols['bear_dot']
         else:
             style = "yellow bold"
-            emoji = "🟡"
-        
-        content = Text()
-        content.append(f"\n{emoji} OVERALL BIAS: ", style="bold white")
-        content.append(f"{bias}\n\n", style=style)
-        
-        content.append(f"📊 AVG CONFIDENCE: ", style="bold white")
-        content.append(f"{synthesis['average_confidence']:.0%}\n", style="cyan")
-        
-        content.append(f"🎯 ALIGNMENT: ", style="bold white")
-        content.append(f"{synthesis['timeframe_alignment']} - {synthesis['alignment_strength']}\n\n", style="white")
-        
-        content.append("💡 RECOMMENDATIONS:\n", style="bold yellow")
-        for rec in synthesis['recommendations']:
-            content.append(f"  • {rec}\n", style="white")
+            emoji = self._symbols['flat_dot']
+        
+        recommendations = "".join(f"  • {escape(rec)}\n" for rec in synthesis['recommendations'])
+        markup = (
+            f"\n{emoji} [bold white]OVERALL BIAS:[/] [{style}]{bias}[/]\n\n"
+            f"{self._symbols['confidence']} [bold white]AVG CONFIDENCE:[/] [cyan]{synthesis['average_confidence']:.0%}[/]\n"
+            f"{self._symbols['alignment']} [bold white]ALIGNMENT:[/] "
+            f"[white]{synthesis['timeframe_alignment']} - {synthesis['alignment_strength']}[/]\n\n"
+            f"[bold yellow]{self._symbols['ideas']} RECOMMENDATIONS:[/]\n"
+            f"[white]{recommendations}[/]"
+        )
+        content = Text.from_markup(markup)
         
-        return Panel(content, title="[bold white]🎯 SYNTHESIS[/]", border_style=style)
+        return Panel(content, title=f"[bold white]{self._symbols['alignment']} SYNTHESIS[/]", border_style=style)
     
     def create_market_status_panel(self, signal: dict) -> Panel:
         """
@@ -357,17 +474,19 @@ class TerminalDashboard:
             
             fetcher = YahooFinanceDataFetcher("SPY")
             
-            # Fetch 5m data
-            df_5m = fetcher.fetch_data("5m", period="5d")
-            if df_5m is not None and not df_5m.empty:
-                df_5m = calculate_all_indicators(df_5m, INDICATORS)
-                self.chart_data["5m"] = df_5m
+            def fetch_chart_data(interval):
+                df = fetcher.fetch_data(interval, period="5d")
+                if df is not None and not df.empty:
+                    return calculate_all_indicators(df, INDICATORS)
+                return None
             
-            # Fetch 15m data
-            df_15m = fetcher.fetch_data("15m", period="5d")
-            if df_15m is not None and not df_15m.empty:
-                df_15m = calculate_all_indicators(df_15m, INDICATORS)
-                self.chart_data["15m"] = df_15m
+            # Fetch 5m and 15m data concurrently (network-bound)
+            intervals = ("5m", "15m")
+            with ThreadPoolExecutor(max_workers=len(intervals)) as pool:
+                chart_frames = dict(zip(intervals, pool.map(fetch_chart_data, intervals)))
+            for interval, df in chart_frames.items():
+                if df is not None:
+                    self.chart_data[interval] = df
             
             # Generate signal
             signal = self.copilot.analyze(verbose=False)
@@ -380,6 +499,24 @@ class TerminalDashboard:
         
         return signal
     
+    def _seconds_until_next_open(self, max_sleep: float) -> float:
+        """
+        Seconds to wait before checking a closed market again.
+        
+        Args:
+            max_sleep: Upper bound, so pre-market opening is not slept through
+        
+        Returns:
+            Time until MarketHours' next regular open, capped at max_sleep
+        """
+        next_open = MarketHours.get_market_status()['next_open']
+        if not next_open:
+            return max_sleep
+        # next_open is "YYYY-MM-DD HH:MM:SS TZ" in market time
+        next_open_dt = datetime.strptime(next_open[:19], "%Y-%m-%d %H:%M:%S")
+        now = MarketHours.get_market_time().replace(tzinfo=None)
+        return max(1.0, min(max_sleep, (next_open_dt - now).total_seconds()))
+    
     def run_live(self, refresh_interval: int = 60):
         """
         Run the dashboard with live updates.
@@ -389,6 +526,14 @@ class TerminalDashboard:
         """
         try:
             while True:
+                # Bars don't change while the market is closed, so keep showing the last
+                # signal and only poll occasionally until the next session starts
+                if self.last_signal is not None and not MarketHours.is_market_open(include_extended_hours=True):
+                    sleep_s = self._seconds_until_next_open(refresh_interval * 10)
+                    self.console.print(f"[dim]Market closed | Next check in {sleep_s:.0f}s | Press Ctrl+C to exit[/dim]")
+                    time.sleep(sleep_s)
+                    continue
+                
                 self.run_once()
                 
                 self.console.print(f"\n[dim]Last update: {datetime.now().strftime('%H:%M:%S')} | Refreshing in {refresh_interval}s | Press Ctrl+C to exit[/dim]")
@@ -1,11 +1,21 @@
 """Test certainty factor and frequency limiting"""
+from pathlib import Path
+import pandas as pd
 from analyzers import SentimentAnalyzer
-import yfinance as yf
 
-print("Downloading Dec 31 data...")
-data_1m = yf.download('SPY', period='1d', interval='1m', start='2024-12-31', end='2025-01-01', progress=False)
-data_5m = yf.download('SPY', period='1d', interval='5m', start='2024-12-31', end='2025-01-01', progress=False)
-data_15m = yf.download('SPY', period='1d', interval='15m', start='2024-12-31', end='2025-01-01', progress=False)
+# Dec 31 bars never change, so download them once and reuse a local copy
+FIXTURE = Path(__file__).parent / 'tests' / 'fixtures' / 'spy_dec31_5m.pkl'
+
+if FIXTURE.exists():
+    print("Loading cached Dec 31 data...")
+    data_5m = pd.read_pickle(FIXTURE)
+else:
+    import yfinance as yf
+    print("Downloading Dec 31 data...")
+    data_5m = yf.download('SPY', period='1d', interval='5m', start='2024-12-31', end='2025-01-01', progress=False)
+    if not data_5m.empty:
+        FIXTURE.parent.mkdir(parents=True, exist_ok=True)
+        data_5m.to_pickle(FIXTURE)
 
 print("Generating signals with CERTAINTY FACTOR...")
 analyzer = SentimentAnalyzer()
@@ -0,0 +1,79 @@
+"""
+Test that the Numba indicator kernels match the pandas implementations,
+including on data with missing (NaN) values
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from indicators import NUMBA_AVAILABLE, calculate_ema, calculate_rsi, calculate_atr, calculate_vwap
+
+
+def _sample_bars() -> pd.DataFrame:
+    """Three sessions of synthetic 5m bars with NaNs like yfinance's partial bars."""
+    rng = np.random.default_rng(7)
+    index = pd.DatetimeIndex([])
+    for day in ("2024-12-27", "2024-12-30", "2024-12-31"):
+        index = index.append(pd.date_range(f"{day} 09:30", periods=78, freq="5min", tz="America/New_York"))
+    close = 590 + np.cumsum(rng.normal(0, 0.4, len(index)))
+    df = pd.DataFrame({
+        'Open': close + rng.normal(0, 0.1, len(index)),
+        'High': close + rng.uniform(0.05, 0.5, len(index)),
+        'Low': close - rng.uniform(0.05, 0.5, len(index)),
+        'Close': close,
+        'Volume': rng.integers(10_000, 500_000, len(index)).astype(float),
+    }, index=index)
+
+    df.iloc[20, df.columns.get_loc('High')] = np.nan
+    df.iloc[[19, 40, 41, 42, 120], df.columns.get_loc('Close')] = np.nan
+    df.iloc[[60, 150], df.columns.get_loc('Volume')] = np.nan
+    return df
+
+
+def _reference_vwap(df: pd.DataFrame) -> pd.Series:
+    """Session VWAP as a groupby cumsum (NaN terms skipped)."""
+    typical_price = (df['High'] + df['Low'] + df['Close']) / 3
+    dates = df.index.date
+    cumul_tp_volume = (typical_price * df['Volume']).groupby(dates).cumsum()
+    cumul_volume = df['Volume'].groupby(dates).cumsum()
+    return cumul_tp_volume / cumul_volume
+
+
+def _check(name: str, actual: pd.Series, expected: pd.Series):
+    """Assert two indicator series match, NaNs included."""
+    np.testing.assert_allclose(actual.to_numpy(), expected.to_numpy(), rtol=1e-9, atol=1e-9,
+                               equal_nan=True, err_msg=name)
+    print(f"✓ {name:<20} matches ({int(expected.isna().sum())} NaN bars)")
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+def test_numba_kernels_match_pandas_with_nans():
+    """
+    Compare each JIT kernel to the pandas path on bars containing NaNs.
+    """
+    print("\n" + "="*70)
+    print("  NUMBA KERNEL PARITY TEST (NaN inputs)")
+    print("="*70 + "\n")
+
+    df = _sample_bars()
+
+    for period in (9, 21):
+        _check(f"EMA {period}", calculate_ema(df['Close'], period, use_numba=True),
+               calculate_ema(df['Close'], period, use_numba=False))
+    _check("RSI", calculate_rsi(df['Close'], use_numba=True), calculate_rsi(df['Close'], use_numba=False))
+    _check("ATR", calculate_atr(df, use_numba=True), calculate_atr(df, use_numba=False))
+    _check("VWAP", calculate_vwap(df, use_numba=True), _reference_vwap(df))
+
+    print("="*70 + "\n")
+
+
+def test_vwap_fallback_with_nans():
+    """
+    The numpy VWAP fallback (no numba) skips NaN terms like a groupby cumsum.
+    """
+    df = _sample_bars()
+    _check("VWAP (numpy)", calculate_vwap(df, use_numba=False), _reference_vwap(df))
+
+
+if __name__ == "__main__":
+    test_numba_kernels_match_pandas_with_nans()
+    test_vwap_fallback_with_nans()
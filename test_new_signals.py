@@ -3,11 +3,34 @@ Test the new multi-timeframe signal generation logic
 """
 import yfinance as yf
 import pandas as pd
-from datetime import datetime
-from new_signal_logic import generate_multi_timeframe_signals
+from datetime import date, datetime
+from pathlib import Path
+from data_fetcher import resample_ohlcv
+from new_signal_logic import SIGNAL_BUY, condition_labels, generate_multi_timeframe_signal_frame
 from indicators import calculate_all_indicators
 from config import INDICATORS
 
+FIXTURE_DIR = Path(__file__).parent / 'tests' / 'fixtures'
+
+
+def _download_1m(ticker):
+    """5 days of 1m bars, downloaded once per day and reused from a local pickle."""
+    fixture = FIXTURE_DIR / f'{ticker.lower()}_1m_5d_{date.today().isoformat()}.pkl'
+    if fixture.exists():
+        print("    (cached)")
+        return pd.read_pickle(fixture)
+    
+    data = yf.download(ticker, period='5d', interval='1m', progress=False)
+    if isinstance(data.columns, pd.MultiIndex):
+        data.columns = data.columns.get_level_values(0)
+    if not data.empty:
+        FIXTURE_DIR.mkdir(parents=True, exist_ok=True)
+        for old in FIXTURE_DIR.glob(f'{ticker.lower()}_1m_5d_*.pkl'):
+            old.unlink()
+        data.to_pickle(fixture)
+    return data
+
+
 def test_new_signals():
     print("="*80)
     print("TESTING NEW MULTI-TIMEFRAME SIGNAL LOGIC")
@@ -18,17 +41,19 @@ def test_new_signals():
     print("[FETCH] Downloading SPY data...")
     ticker = "SPY"
     
-    # Get 1m data (last day)
-    print("  - 1-minute data...")
-    data_1m = yf.download(ticker, period='1d', interval='1m', progress=False)
+    # One 1m download; the 5m/15m candles are resampled from it instead of
+    # separate requests (1m history only goes back ~a week, so 5d of context)
+    print("  - 1-minute data (5m/15m resampled from it)...")
+    data_1m_all = _download_1m(ticker)
+    if data_1m_all.empty:
+        print("[ERROR] Failed to fetch data")
+        return
     
-    # Get 5m data (last 5 days for context)
-    print("  - 5-minute data...")
-    data_5m = yf.download(ticker, period='5d', interval='5m', progress=False)
+    data_5m = resample_ohlcv(data_1m_all, '5min')
+    data_15m = resample_ohlcv(data_1m_all, '15min')
     
-    # Get 15m data (last month for context)
-    print("  - 15-minute data...")
-    data_15m = yf.download(ticker, period='1mo', interval='15m', progress=False)
+    # Signals are generated on the latest session's 1m candles
+    data_1m = data_1m_all[data_1m_all.index.date == data_1m_all.index[-1].date()]
     
     if data_1m.empty or data_5m.empty or data_15m.empty:
         print("[ERROR] Failed to fetch data")
@@ -50,7 +75,8 @@ def test_new_signals():
     
     # Generate signals
     print("[SIGNAL] Generating signals with new multi-timeframe logic...")
-    signals = generate_multi_timeframe_signals(
+    # Columnar result: one array per field instead of a dict per signal
+    sig_df = generate_multi_timeframe_signal_frame(
         data_1m, data_5m, data_15m,
         indicators_1m, indicators_5m, indicators_15m
     )
@@ -62,7 +88,7 @@ def test_new_signals():
     print("="*80)
     print()
     
-    if not signals:
+    if sig_df.empty:
         print("[X] No signals generated")
         print()
         print("This could mean:")
@@ -71,30 +97,30 @@ def test_new_signals():
         print("  - Insufficient multi-timeframe alignment (need 5/7 conditions)")
         return
     
-    print(f"[OK] Generated {len(signals)} signals")
+    print(f"[OK] Generated {len(sig_df)} signals")
     print()
     
-    # Separate by type
-    buy_signals = [s for s in signals if s['type'] == 'buy']
-    sell_signals = [s for s in signals if s['type'] == 'sell']
-    
-    print(f"[BUY]  signals:  {len(buy_signals)}")
-    print(f"[SELL] signals: {len(sell_signals)}")
+    is_buy = sig_df['type_code'].to_numpy() == SIGNAL_BUY
+    print(f"[BUY]  signals:  {int(is_buy.sum())}")
+    print(f"[SELL] signals: {int(len(sig_df) - is_buy.sum())}")
     print()
     
     # Show each signal with details
     print("-"*80)
-    for i, signal in enumerate(signals, 1):
-        prefix = "[BUY]" if signal['type'] == 'buy' else "[SELL]"
-        signal_type = signal['type'].upper()
+    rows = zip(sig_df['timestamp'], sig_df['price'].tolist(), sig_df['type_code'].tolist(),
+               sig_df['strength'].tolist(), sig_df['conditions_met'].tolist(),
+               sig_df['cond_bitmask'].tolist(), sig_df['gamma'].tolist())
+    for i, (timestamp, price, code, strength, conditions_met, mask, gamma) in enumerate(rows, 1):
+        prefix = "[BUY]" if code == SIGNAL_BUY else "[SELL]"
+        signal_type = "BUY" if code == SIGNAL_BUY else "SELL"
         
         print(f"{prefix} Signal #{i}: {signal_type}")
-        print(f"   Time:       {signal['timestamp'].strftime('%Y-%m-%d %H:%M')}")
-        print(f"   Price:      ${signal['price']:.2f}")
-        print(f"   Strength:   {signal['strength']}%")
-        print(f"   Conditions: {signal['conditions_met']}/7 met")
+        print(f"   Time:       {timestamp.strftime('%Y-%m-%d %H:%M')}")
+        print(f"   Price:      ${price:.2f}")
+        print(f"   Strength:   {strength}%")
+        print(f"   Conditions: {conditions_met}/7 met")
         print(f"   Details:")
-        for condition in signal['conditions']:
+        for condition in condition_labels(code, mask, gamma):
             print(f"      [X] {condition}")
         print()
     
@@ -102,20 +128,20 @@ def test_new_signals():
     print()
     
     # Summary statistics
-    if signals:
+    if not sig_df.empty:
         print("SUMMARY:")
-        print(f"   Total signals:     {len(signals)}")
-        print(f"   Average strength:  {sum(s['strength'] for s in signals) / len(signals):.1f}%")
-        print(f"   Avg conditions:    {sum(s['conditions_met'] for s in signals) / len(signals):.1f}/7")
+        print(f"   Total signals:     {len(sig_df)}")
+        print(f"   Average strength:  {sig_df['strength'].mean():.1f}%")
+        print(f"   Avg conditions:    {sig_df['conditions_met'].mean():.1f}/7")
         print()
         
         # Time distribution
-        if len(signals) > 1:
-            first_signal = signals[0]['timestamp']
-            last_signal = signals[-1]['timestamp']
+        if len(sig_df) > 1:
+            first_signal = sig_df['timestamp'].iloc[0]
+            last_signal = sig_df['timestamp'].iloc[-1]
             time_span = (last_signal - first_signal).total_seconds() / 60
             print(f"   Time span:         {time_span:.0f} minutes")
-            print(f"   Signal frequency:  ~{time_span / len(signals):.0f} min between signals")
+            print(f"   Signal frequency:  ~{time_span / len(sig_df):.0f} min between signals")
             print()
     
     # Show latest market state
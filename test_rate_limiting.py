@@ -2,6 +2,7 @@
 Test script to demonstrate rate limiting functionality
 """
 import time
+import numpy as np
 from data_fetcher import YahooFinanceDataFetcher
 import config
 
@@ -23,30 +24,31 @@ def test_rate_limiting():
     fetcher = YahooFinanceDataFetcher("SPY", request_delay=config.REQUEST_DELAY)
     
     print(f"\nFetching data from Yahoo Finance...")
-    print(f"Watch the timing - should be ~{config.REQUEST_DELAY}s between requests\n")
+    print(f"Timing should be ~{config.REQUEST_DELAY}s between requests (reported after the last one)\n")
     
     # Make multiple requests
     num_requests = 3
-    start_time = time.time()
+    deltas_ns = np.empty(num_requests, dtype=np.int64)  # per-request durations (monotonic clock)
+    logs = []  # printed after the loop so console writes don't skew the timings
+    start_ns = time.perf_counter_ns()
     
     for i in range(num_requests):
-        request_start = time.time()
-        print(f"Request {i+1}/{num_requests}...", end=" ", flush=True)
+        request_start = time.perf_counter_ns()
         
         try:
             # Fetch data (this will trigger rate limiting)
             df = fetcher.fetch_data(interval="5m", period="1d")
-            request_end = time.time()
+            request_end = time.perf_counter_ns()
+            deltas_ns[i] = request_end - request_start
             
-            elapsed = request_end - request_start
-            total_elapsed = request_end - start_time
-            
-            print(f"✓ Complete ({elapsed:.2f}s) | Total: {total_elapsed:.2f}s | Rows: {len(df)}")
+            logs.append(f"✓ Complete ({deltas_ns[i] / 1e9:.2f}s) | Total: {(request_end - start_ns) / 1e9:.2f}s | Rows: {len(df)}")
             
         except Exception as e:
-            print(f"✗ Failed: {str(e)}")
+            deltas_ns[i] = time.perf_counter_ns() - request_start
+            logs.append(f"✗ Failed: {str(e)}")
     
-    total_time = time.time() - start_time
+    total_time = (time.perf_counter_ns() - start_ns) / 1e9
+    print("\n".join(f"Request {i+1}/{num_requests}... {line}" for i, line in enumerate(logs)))
     expected_time = config.REQUEST_DELAY * (num_requests - 1)  # First request is immediate
     
     print(f"\n" + "-"*70)
@@ -55,6 +57,7 @@ def test_rate_limiting():
     print(f"  Total Time: {total_time:.2f}s")
     print(f"  Expected Time: ~{expected_time:.2f}s (with {config.REQUEST_DELAY}s delays)")
     print(f"  Average Time/Request: {total_time/num_requests:.2f}s")
+    print(f"  Request time: avg={deltas_ns.mean() / 1e6:.2f}ms p95={np.percentile(deltas_ns, 95) / 1e6:.2f}ms")
     
     if total_time >= expected_time * 0.9:
         print(f"\n✅ Rate limiting is working correctly!")
@@ -90,18 +93,19 @@ def test_custom_delay():
     print(f"Expected rate: ~{3600 / custom_delay:.0f} requests/hour")
     
     num_requests = 2
-    start_time = time.time()
+    logs = []
+    start_time = time.perf_counter()
     
     for i in range(num_requests):
-        print(f"Request {i+1}/{num_requests}...", end=" ", flush=True)
         try:
             df = fetcher.fetch_data(interval="15m", period="1d")
-            elapsed = time.time() - start_time
-            print(f"✓ Complete | Total: {elapsed:.2f}s")
+            elapsed = time.perf_counter() - start_time
+            logs.append(f"✓ Complete | Total: {elapsed:.2f}s")
         except Exception as e:
-            print(f"✗ Failed: {str(e)}")
+            logs.append(f"✗ Failed: {str(e)}")
     
-    total_time = time.time() - start_time
+    total_time = time.perf_counter() - start_time
+    print("\n".join(f"Request {i+1}/{num_requests}... {line}" for i, line in enumerate(logs)))
     print(f"\nTotal time: {total_time:.2f}s for {num_requests} requests")
     print("="*70 + "\n")
 
@@ -4,6 +4,8 @@ Can run with or without dependencies
 """
 import sys
 import os
+import importlib
+import importlib.util
 
 
 def test_imports():
@@ -21,12 +23,13 @@ def test_imports():
         "signal_generator",
     ]
     
-    # Optional modules (require dependencies)
-    optional_modules = [
-        "data_fetcher",
-        "market_copilot",
-        "market_hours"
-    ]
+    # Optional modules (require dependencies), with the third-party packages
+    # they import at module level; missing ones are detected without importing
+    optional_modules = {
+        "data_fetcher": ("yfinance", "pandas"),
+        "market_copilot": (),
+        "market_hours": (),
+    }
     
     passed = 0
     failed = 0
@@ -42,9 +45,12 @@ def test_imports():
             failed += 1
     
     # Test optional modules
-    for module in optional_modules:
+    for module, dependencies in optional_modules.items():
+        if any(importlib.util.find_spec(dep) is None for dep in dependencies):
+            print(f"⚠ {module:<25} SKIPPED (missing dependencies)")
+            continue
         try:
-            __import__(module)
+            importlib.import_module(module)
             print(f"✓ {module:<25} OK (requires dependencies)")
             passed += 1
         except ImportError as e:
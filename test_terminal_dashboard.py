@@ -0,0 +1,47 @@
+"""
+Test the LTTB downsampler used by the terminal price chart
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip("plotext")
+from terminal_dashboard import _lttb, MAX_CHART_POINTS, CHART_LOOKBACK
+
+
+def test_lttb_downsamples_to_chart_budget():
+    """
+    A long series comes back at exactly MAX_CHART_POINTS, keeping both ends
+    and the original x order.
+    """
+    print("\n" + "="*70)
+    print("  LTTB DOWNSAMPLING TEST")
+    print("="*70 + "\n")
+
+    # The chart must actually hit the downsampling path
+    assert CHART_LOOKBACK > MAX_CHART_POINTS
+
+    rng = np.random.default_rng(3)
+    xs = np.arange(500, dtype=np.float64)
+    ys = 590 + np.cumsum(rng.normal(0, 0.4, 500))
+
+    out_x, out_y = _lttb(xs, ys, MAX_CHART_POINTS)
+
+    assert len(out_x) == len(out_y) == MAX_CHART_POINTS
+    assert (out_x[0], out_y[0]) == (xs[0], ys[0])
+    assert (out_x[-1], out_y[-1]) == (xs[-1], ys[-1])
+    assert np.all(np.diff(out_x) > 0)
+    # Every kept point is one of the originals
+    np.testing.assert_array_equal(out_y, ys[out_x.astype(int)])
+    print(f"✓ 500 points -> {len(out_x)} points, endpoints kept, x strictly increasing")
+
+    # Short series pass through untouched
+    short_x, short_y = _lttb(xs[:100], ys[:100], MAX_CHART_POINTS)
+    np.testing.assert_array_equal(short_x, xs[:100])
+    np.testing.assert_array_equal(short_y, ys[:100])
+    print("✓ series shorter than the budget are returned as-is")
+
+    print("="*70 + "\n")
+
+
+if __name__ == "__main__":
+    test_lttb_downsamples_to_chart_budget()
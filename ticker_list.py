@@ -5,9 +5,30 @@ Data sources (all free):
 - NYSE GitHub: https://github.com/datasets/nyse-listings
 - Or use this curated list of most-traded securities
 """
+import pickle
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from itertools import chain
+from operator import itemgetter
+from pathlib import Path
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# The exchange listings change at most daily, so a fetched list is reused for the rest of the day
+TICKER_CACHE_DIR = Path("~/.cache/ticker_list").expanduser()
+
+_session = None  # shared requests.Session, created on first fetch
+
+# Index symbols (^...) and warrants/special securities (containing . or $)
+_NASDAQ_EXCLUDE = re.compile(r'^\^|[.$]')
 
 # Popular ETFs and stocks - highly liquid, good for options trading
-POPULAR_TICKERS = [
+POPULAR_TICKERS = (
     # Major Index ETFs
     ("SPY", "S&P 500 ETF"),
     ("QQQ", "Nasdaq 100 ETF"),
@@ -44,7 +65,8 @@ POPULAR_TICKERS = [
     ("JPM", "JPMorgan Chase"),
     ("BA", "Boeing Co."),
     ("GE", "General Electric"),
-]
+)
+POPULAR_SYMBOLS = frozenset(symbol for symbol, _ in POPULAR_TICKERS)
 
 
 def get_ticker_list():
@@ -55,35 +77,41 @@ def get_ticker_list():
     """
     import time
     
+    cached = _load_cached_tickers()
+    if cached:
+        print(f"Loaded {len(cached)} tickers from today's cache")
+        return cached
+    
     print("Fetching complete US stock ticker list...")
     start = time.time()
     
-    all_tickers = []
+    # Both downloads are network-bound, so run them side by side
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        nasdaq_future = pool.submit(fetch_all_nasdaq_tickers)
+        nyse_future = pool.submit(fetch_all_nyse_tickers)
+        nasdaq = nasdaq_future.result()
+        nyse = nyse_future.result()
     
-    # Fetch Nasdaq tickers
-    nasdaq = fetch_all_nasdaq_tickers()
-    if nasdaq and len(nasdaq) > 30:  # Only use if we got real data
-        all_tickers.extend(nasdaq)
+    # Only use a list if we got real data
+    if nasdaq and len(nasdaq) > 30:
         print(f"Loaded {len(nasdaq)} Nasdaq tickers")
-    
-    # Fetch NYSE tickers
-    nyse = fetch_all_nyse_tickers()
+    else:
+        nasdaq = []
     if nyse and len(nyse) > 30:
-        all_tickers.extend(nyse)
         print(f"Loaded {len(nyse)} NYSE tickers")
+    else:
+        nyse = []
     
-    # Remove duplicates and sort
-    if all_tickers:
-        # Use dict to deduplicate by symbol
+    # Deduplicate by symbol and sort: the first entry for a symbol wins, and
+    # Nasdaq is read first so its entries take priority over NYSE ones
+    if nasdaq or nyse:
         unique = {}
-        for symbol, name in all_tickers:
-            if symbol not in unique:
-                unique[symbol] = name
-        
-        all_tickers = [(s, n) for s, n in unique.items()]
-        all_tickers.sort(key=lambda x: x[0])
+        for symbol, name in chain(nasdaq, nyse):
+            unique.setdefault(symbol, name)
+        all_tickers = sorted(unique.items(), key=itemgetter(0))
         
         print(f"Total unique tickers: {len(all_tickers)} (loaded in {time.time()-start:.1f}s)")
+        _save_cached_tickers(all_tickers)
         return all_tickers
     
     # Fallback to popular list
@@ -91,14 +119,66 @@ def get_ticker_list():
     return POPULAR_TICKERS
 
 
+def _ticker_cache_path():
+    """Path of today's ticker list cache file."""
+    return TICKER_CACHE_DIR / f"{date.today().isoformat()}.pkl"
+
+
+def _load_cached_tickers():
+    """Return today's cached (symbol, name) list, or None if there isn't a usable one."""
+    path = _ticker_cache_path()
+    try:
+        return pickle.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Ignoring unreadable ticker cache {path}: {e}")
+        return None
+
+
+def _save_cached_tickers(tickers):
+    """Write today's ticker list to the cache and drop files from earlier days."""
+    path = _ticker_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(pickle.dumps(tickers, protocol=pickle.HIGHEST_PROTOCOL))
+        for old in path.parent.glob("*.pkl"):
+            if old != path:
+                old.unlink()
+    except OSError as e:
+        print(f"Could not write ticker cache: {e}")
+
+
+def _get_session():
+    """Shared requests.Session so the fallback fetches reuse open connections."""
+    global _session
+    if _session is None:
+        import requests
+        _session = requests.Session()
+    return _session
+
+
+def _read_listing_csv(response):
+    """
+    Parse a streamed listing CSV (symbol, name, ...) with pandas' C parser.
+    
+    Reads straight from the socket, so the payload is never held as one big string.
+    
+    Returns (symbols, names) string Series, whitespace-stripped
+    """
+    import pandas as pd
+    
+    response.raw.decode_content = True  # undo any gzip transfer encoding while reading
+    df = pd.read_csv(response.raw, usecols=[0, 1], dtype=str, na_filter=False, engine='c')
+    return df.iloc[:, 0].str.strip(), df.iloc[:, 1].str.strip()
+
+
 def fetch_all_nasdaq_tickers():
     """
     Download full Nasdaq ticker list from official source.
     
     Returns list of (symbol, name) tuples
     """
-    import requests
-    
     try:
         # Nasdaq official API (updated daily)
         url = "https://api.nasdaq.com/api/screener/stocks?tableonly=true&limit=25000&offset=0&download=true"
@@ -107,24 +187,25 @@ def fetch_all_nasdaq_tickers():
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         
-        response = requests.get(url, headers=headers, timeout=15)
+        response = _get_session().get(url, headers=headers, timeout=(3, 15))
         if response.status_code != 200:
             # Fallback to FTP text file
             return fetch_nasdaq_ftp()
         
-        data = response.json()
+        # The screener payload is several MB; orjson decodes the raw bytes directly
+        data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
         if not data or 'data' not in data or 'rows' not in data['data']:
             return fetch_nasdaq_ftp()
         
-        tickers = []
-        for row in data['data']['rows']:
-            symbol = row.get('symbol', '').strip()
-            name = row.get('name', '').strip()
-            
-            # Filter out weird symbols
-            if symbol and not symbol.startswith('^') and len(symbol) <= 6:
-                if '.' not in symbol and '$' not in symbol:  # Remove warrants/special securities
-                    tickers.append((symbol, name))
+        import pandas as pd
+        
+        rows = pd.DataFrame(data['data']['rows'], columns=['symbol', 'name']).fillna('').astype(str)
+        symbols = rows['symbol'].str.strip()
+        names = rows['name'].str.strip()
+        
+        # Filter out weird symbols
+        keep = symbols.str.len().between(1, 6) & ~symbols.str.contains(_NASDAQ_EXCLUDE)
+        tickers = list(zip(symbols[keep], names[keep]))
         
         return tickers if tickers else fetch_nasdaq_ftp()
         
@@ -135,32 +216,17 @@ def fetch_all_nasdaq_tickers():
 
 def fetch_nasdaq_ftp():
     """Fallback FTP source for Nasdaq tickers"""
-    import requests
-    
     try:
         # FTP mirror on GitHub (updated regularly)
         url = "https://raw.githubusercontent.com/datasets/nasdaq-listings/master/data/nasdaq-listed.csv"
         
-        response = requests.get(url, timeout=10)
-        if response.status_code != 200:
-            return []
-        
-        tickers = []
-        lines = response.text.split('\n')
+        with _get_session().get(url, timeout=(3, 10), stream=True) as response:
+            if response.status_code != 200:
+                return []
+            symbols, names = _read_listing_csv(response)
         
-        # Skip header
-        for line in lines[1:]:
-            if not line.strip():
-                continue
-            parts = line.split(',')
-            if len(parts) >= 2:
-                symbol = parts[0].strip().strip('"')
-                name = parts[1].strip().strip('"')
-                
-                if symbol and len(symbol) <= 6 and '.' not in symbol:
-                    tickers.append((symbol, name))
-        
-        return tickers
+        keep = (symbols != '') & (symbols.str.len() <= 6) & ~symbols.str.contains('.', regex=False)
+        return list(zip(symbols[keep], names[keep]))
         
     except Exception as e:
         print(f"Nasdaq FTP failed: {e}")
@@ -173,29 +239,15 @@ def fetch_all_nyse_tickers():
     
     Returns list of (symbol, name) tuples
     """
-    import requests
-    
     try:
         url = "https://raw.githubusercontent.com/datasets/nyse-listings/master/data/nyse-listed.csv"
-        response = requests.get(url, timeout=10)
-        
-        if response.status_code != 200:
-            return []
-        
-        tickers = []
-        lines = response.text.split('\n')
-        
-        # Skip header
-        for line in lines[1:]:
-            parts = line.split(',')
-            if len(parts) >= 2:
-                symbol = parts[0].strip().strip('"')
-                name = parts[1].strip().strip('"')
-                
-                if symbol and len(symbol) <= 5:
-                    tickers.append((symbol, name))
+        with _get_session().get(url, timeout=(3, 10), stream=True) as response:
+            if response.status_code != 200:
+                return []
+            symbols, names = _read_listing_csv(response)
         
-        return tickers
+        keep = (symbols != '') & (symbols.str.len() <= 5)
+        return list(zip(symbols[keep], names[keep]))
         
     except Exception as e:
         print(f"Failed to fetch NYSE tickers: {e}")